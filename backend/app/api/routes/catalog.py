@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from app.core.auth import Role, WorkspaceContext, get_current_user, get_current_workspace, require_role
 from app.core.config import Settings, get_settings
@@ -22,12 +24,60 @@ async def list_entities(service: CatalogService = Depends(get_service)):
     return service.list_entities()
 
 
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def _set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+@router.get("/entities/batch", response_model=catalog_schemas.CatalogEntityBatchResponse)
+async def get_entities_batch(
+    request: Request,
+    response: Response,
+    ids: List[str] = Query(..., min_length=1, max_length=200),
+    service: CatalogService = Depends(get_service),
+):
+    snapshot = service.detail_snapshot(ids)
+    # Preconditions only apply when some requested entity exists; ``If-None-Match: *`` must not match nothing.
+    if snapshot.ids:
+        etag = service.detail_etag(snapshot)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        _set_etag(response, etag)
+    details = service.entity_details(ids, snapshot)
+    return catalog_schemas.CatalogEntityBatchResponse(
+        entities=[details[unique_id] for unique_id in dict.fromkeys(ids) if unique_id in details],
+        missing=[unique_id for unique_id in dict.fromkeys(ids) if unique_id not in details],
+    )
+
+
 @router.get("/entities/{unique_id}", response_model=catalog_schemas.CatalogEntityDetail)
-async def get_entity(unique_id: str, service: CatalogService = Depends(get_service)):
-    detail = service.entity_detail(unique_id)
-    if not detail:
+async def get_entity(
+    unique_id: str,
+    request: Request,
+    response: Response,
+    service: CatalogService = Depends(get_service),
+):
+    snapshot = service.detail_snapshot([unique_id])
+    # Preconditions only apply to entities that exist; ``If-None-Match: *`` must not hide a 404.
+    if not snapshot.ids:
         raise HTTPException(status_code=404, detail="Entity not found")
-    return detail
+    etag = service.detail_etag(snapshot)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    _set_etag(response, etag)
+    return service.entity_details([unique_id], snapshot)[unique_id]
 
 
 @router.get("/search", response_model=catalog_schemas.SearchResponse)
@@ -35,9 +85,26 @@ async def search_catalog(query: str = Query("", max_length=200), service: Catalo
     return service.search(query)
 
 
+@router.get("/freshness", response_model=catalog_schemas.FreshnessSummaryResponse)
+async def freshness_summary(service: CatalogService = Depends(get_service)):
+    return service.freshness_summary()
+
+
 @router.get("/validation", response_model=catalog_schemas.ValidationResponse)
-async def validation(service: CatalogService = Depends(get_service)):
-    return service.validate()
+async def validation(
+    offset: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1, le=5000),
+    service: CatalogService = Depends(get_service),
+):
+    return service.validate(offset=offset, limit=limit)
+
+
+@router.get("/validation/entities/{unique_id}", response_model=catalog_schemas.ValidationResponse)
+async def entity_validation(unique_id: str, service: CatalogService = Depends(get_service)):
+    result = service.validate_entity(unique_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Entity not found")
+    return result
 
 
 @router.patch(
@@ -17,6 +17,7 @@ from app.schemas.execution import (
     RunArtifactsResponse,
     RunDetail,
     RunHistoryResponse,
+    RunLogLinesResponse,
     RunRequest,
     RunSummary,
     PackagesCheckResponse,
@@ -67,6 +68,7 @@ async def start_run(
             project_path=project_path,
             run_row_lineage=run_request.run_row_lineage,
             artifacts_path=workspace.artifacts_path,
+            priority=run_request.priority,
         )
         
         # Execute in background
@@ -158,11 +160,28 @@ async def stream_run_logs(
     if not run_status:
         raise HTTPException(status_code=404, detail="Run not found")
 
+    # Optional server-side filters, e.g. ?level=ERROR,WARN&node_id=model.project.orders
+    level_param = request.query_params.get("level")
+    levels = {value.strip() for value in level_param.split(",") if value.strip()} if level_param else None
+    node_id = request.query_params.get("node_id") or None
+
+    # Reconnecting EventSource clients send the id of the last line they received.
+    try:
+        last_event_id = int(request.headers.get("last-event-id") or 0)
+    except ValueError:
+        last_event_id = 0
+
     async def log_generator():
         try:
-            async for log_message in executor.stream_logs(run_id):
+            async for log_message in executor.stream_logs(
+                run_id,
+                after=last_event_id,
+                levels=levels,
+                node_id=node_id,
+            ):
                 yield {
                     "event": "log",
+                    "id": str(log_message.line_number),
                     "data": log_message.model_dump_json(),
                 }
         except Exception as e:
@@ -179,6 +198,30 @@ async def stream_run_logs(
     return EventSourceResponse(log_generator())
 
 
+@router.get(
+    "/runs/{run_id}/logs/lines",
+    response_model=RunLogLinesResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def get_run_log_lines(
+    run_id: str,
+    start: int = Query(1, ge=1),
+    limit: int = Query(1000, ge=1, le=10000),
+    tail: Optional[int] = Query(None, ge=1, le=10000),
+):
+    """Read a range of lines (1-based ``start``) or the last ``tail`` lines of a run's stored log."""
+    stored = executor.read_run_log(run_id, start=start - 1, limit=limit, tail=tail)
+    if stored is None:
+        raise HTTPException(status_code=404, detail="Run log not found")
+    return RunLogLinesResponse(
+        run_id=run_id,
+        first_line=stored.first_line,
+        lines=stored.lines,
+        total_lines=stored.total_lines,
+        complete=stored.complete,
+    )
+
+
 @router.get(
     "/runs/{run_id}/artifacts",
     response_model=RunArtifactsResponse,
@@ -231,11 +274,12 @@ async def cleanup_old_runs():
 )
 async def get_execution_status():
     """Get overall execution system status."""
-    active_runs = len([r for r in executor.active_runs.values() if r.poll() is None])
+    active_runs = executor.active_run_count()
     total_runs = len(executor.run_history)
 
     return {
         "active_runs": active_runs,
+        "queued_runs": executor.run_queue.queued_count,
         "total_runs": total_runs,
         "max_concurrent_runs": executor.settings.max_concurrent_runs,
         "max_run_history": executor.settings.max_run_history,
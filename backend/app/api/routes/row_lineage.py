@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.core.auth import Role, WorkspaceContext, get_current_user, get_current_workspace, require_role
 from app.core.config import Settings, get_settings
@@ -15,7 +16,7 @@ from app.schemas.row_lineage import (
     RowLineageStatus,
     RowLineageTraceResponse,
 )
-from app.services.row_lineage_service import RowLineageService
+from app.services.row_lineage_service import InvalidCursorError, RowLineageService
 
 router = APIRouter(prefix="/row-lineage", tags=["row-lineage"], dependencies=[Depends(get_current_user)])
 
@@ -78,6 +79,34 @@ def preview_model(
         raise HTTPException(status_code=400, detail={"message": str(exc), "code": "preview_error"}) from exc
 
 
+@router.get(
+    "/preview/{model_unique_id}/rows",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_role(Role.DEVELOPER))],
+)
+def stream_preview(
+    model_unique_id: str,
+    environment_id: Optional[int] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: Optional[int] = Query(default=None),
+    service: RowLineageService = Depends(get_service),
+) -> StreamingResponse:
+    try:
+        lines = service.stream_preview(
+            model_unique_id=model_unique_id,
+            environment_id=environment_id,
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail={"message": str(exc), "code": "invalid_cursor"}) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail={"message": str(exc), "code": "not_found"}) from exc
+    except Exception as exc:  # pragma: no cover - defensive
+        raise HTTPException(status_code=400, detail={"message": str(exc), "code": "preview_error"}) from exc
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @router.get(
     "/trace/{model_unique_id}/{trace_id}",
     response_model=RowLineageTraceResponse,
@@ -101,3 +130,28 @@ def get_trace(
         raise HTTPException(status_code=404, detail={"message": str(exc), "code": "not_found"}) from exc
     except Exception as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=400, detail={"message": str(exc), "code": "trace_error"}) from exc
+
+
+@router.get(
+    "/downstream/{model_unique_id}/{trace_id}",
+    response_model=RowLineageTraceResponse,
+    dependencies=[Depends(require_role(Role.DEVELOPER))],
+)
+def get_downstream_trace(
+    model_unique_id: str,
+    trace_id: str,
+    environment_id: Optional[int] = Query(default=None),
+    max_hops: Optional[int] = Query(default=None),
+    service: RowLineageService = Depends(get_service),
+) -> RowLineageTraceResponse:
+    try:
+        return service.get_downstream_trace(
+            model_unique_id=model_unique_id,
+            trace_id=trace_id,
+            environment_id=environment_id,
+            max_hops=max_hops,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail={"message": str(exc), "code": "not_found"}) from exc
+    except Exception as exc:  # pragma: no cover - defensive
+        raise HTTPException(status_code=400, detail={"message": str(exc), "code": "trace_error"}) from exc
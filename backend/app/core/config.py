@@ -84,22 +84,44 @@ class Settings(BaseSettings):
     )
     row_lineage_max_hops: int = Field(6, alias="ROW_LINEAGE_MAX_HOPS")
     row_lineage_scan_max_rows: int = Field(50000, alias="ROW_LINEAGE_SCAN_MAX_ROWS")
+    row_lineage_index_cache_max_mb: int = Field(1024, alias="ROW_LINEAGE_INDEX_CACHE_MAX_MB")
+    row_lineage_schema_cache_ttl_seconds: int = Field(300, alias="ROW_LINEAGE_SCHEMA_CACHE_TTL_SECONDS")
+    row_lineage_fetch_concurrency: int = Field(4, alias="ROW_LINEAGE_FETCH_CONCURRENCY")
+    row_lineage_trace_timeout_seconds: float = Field(30.0, alias="ROW_LINEAGE_TRACE_TIMEOUT_SECONDS")
+    row_lineage_trace_cache_max_mb: int = Field(64, alias="ROW_LINEAGE_TRACE_CACHE_MAX_MB")
+    row_lineage_trace_cache_ttl_seconds: float = Field(300.0, alias="ROW_LINEAGE_TRACE_CACHE_TTL_SECONDS")
 
     # dbt execution settings
     dbt_project_path: str = Field("./data/repos/default", alias="DBT_PROJECT_PATH")
     git_repos_base_path: str = Field("./data/repos", alias="GIT_REPOS_BASE_PATH")
     max_concurrent_runs: int = Field(1, alias="MAX_CONCURRENT_RUNS")
+    max_concurrent_runs_per_workspace: int = Field(0, alias="MAX_CONCURRENT_RUNS_PER_WORKSPACE")
+    max_queued_runs: int = Field(100, alias="MAX_QUEUED_RUNS")
     max_run_history: int = Field(100, alias="MAX_RUN_HISTORY")
     max_artifact_sets: int = Field(50, alias="MAX_ARTIFACT_SETS")
     log_buffer_size: int = Field(1000, alias="LOG_BUFFER_SIZE")  # lines
+    run_log_compress: bool = Field(False, alias="RUN_LOG_COMPRESS")
+    dbt_json_logs: bool = Field(True, alias="DBT_JSON_LOGS")
+    dbt_auto_state: bool = Field(True, alias="DBT_AUTO_STATE")
+    dbt_reuse_partial_parse: bool = Field(True, alias="DBT_REUSE_PARTIAL_PARSE")
+    execution_backend: str = Field("local", alias="EXECUTION_BACKEND")  # local | dbt_runner | worker_pool
+    execution_worker_poll_seconds: float = Field(0.5, alias="EXECUTION_WORKER_POLL_SECONDS")
+    execution_worker_heartbeat_seconds: float = Field(5.0, alias="EXECUTION_WORKER_HEARTBEAT_SECONDS")
+    execution_worker_timeout_seconds: float = Field(60.0, alias="EXECUTION_WORKER_TIMEOUT_SECONDS")
+    execution_worker_claim_timeout_seconds: float = Field(300.0, alias="EXECUTION_WORKER_CLAIM_TIMEOUT_SECONDS")
 
     # Catalog settings
     allow_metadata_edits: bool = Field(True, alias="ALLOW_METADATA_EDITS")
     search_indexing_frequency_seconds: int = Field(30, alias="SEARCH_INDEXING_FREQUENCY_SECONDS")
+    catalog_semantic_search_enabled: bool = Field(False, alias="CATALOG_SEMANTIC_SEARCH_ENABLED")
+    catalog_semantic_search_model: str = Field("hashing", alias="CATALOG_SEMANTIC_SEARCH_MODEL")
+    catalog_semantic_search_weight: float = Field(1.0, alias="CATALOG_SEMANTIC_SEARCH_WEIGHT")
+    catalog_semantic_search_min_similarity: float = Field(0.3, alias="CATALOG_SEMANTIC_SEARCH_MIN_SIMILARITY")
     freshness_threshold_override_minutes: int | None = Field(
         None,
         alias="FRESHNESS_THRESHOLD_OVERRIDE_MINUTES",
     )
+    freshness_cache_ttl_seconds: int = Field(60, alias="FRESHNESS_CACHE_TTL_SECONDS")
     validation_severity: str = Field("warning", alias="VALIDATION_SEVERITY")
     statistics_refresh_policy: str = Field("on_artifact_change", alias="STATISTICS_REFRESH_POLICY")
 
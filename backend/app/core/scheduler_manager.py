@@ -7,7 +7,7 @@ from app.core.config import get_settings
 from app.database.connection import SessionLocal
 from app.services.scheduler_service import scheduler_service
 from app.database.models import models as db_models
-from app.schemas.execution import RunStatus
+from app.schemas.execution import RunPriority, RunStatus
 from app.schemas.scheduler import CatchUpPolicy, TriggeringEvent, RetryStatus, RunFinalResult, RetryPolicy
 from app.services.dbt_executor import executor
 
@@ -79,22 +79,31 @@ def _process_due_schedule(db, db_schedule: db_models.Schedule, now: datetime) ->
     created = 0
 
     while next_run_time and next_run_time <= now and created < max_catchup:
+        following_run_time = scheduler_service._compute_next_run_time(
+            cron_expression=cron_expression,
+            timezone_name=timezone_name,
+            from_time=next_run_time,
+        )
+        # Missed occurrences older than the latest due one are catch-up work and
+        # queue behind regular scheduled and interactive runs.
+        is_backfill = (
+            catch_up == CatchUpPolicy.CATCH_UP
+            and following_run_time is not None
+            and following_run_time <= now
+        )
         scheduled_run = scheduler_service.create_scheduled_run(
             db=db,
             db_schedule=db_schedule,
             scheduled_time=_ensure_utc(next_run_time),
             triggering_event=TriggeringEvent.CRON,
+            priority=RunPriority.BACKFILL if is_backfill else RunPriority.SCHEDULED,
         )
         if scheduled_run:
             # Start first attempt asynchronously
             _schedule_attempt_start(scheduled_run.id)
 
         created += 1
-        next_run_time = scheduler_service._compute_next_run_time(
-            cron_expression=cron_expression,
-            timezone_name=timezone_name,
-            from_time=next_run_time,
-        )
+        next_run_time = following_run_time
         db_schedule.next_run_time = next_run_time
         db_schedule.last_run_time = now
         db.add(db_schedule)
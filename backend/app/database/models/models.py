@@ -7,6 +7,7 @@ from sqlalchemy import (
     Index,
     Integer,
     JSON,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -290,6 +291,54 @@ class ScheduledRunAttempt(Base):
     db_run = relationship("Run")
 
 
+class ExecutionJob(Base):
+    """A dbt invocation waiting for, or claimed by, an execution worker."""
+
+    __tablename__ = "execution_jobs"
+    __table_args__ = (Index("ix_execution_jobs_status_created", "status", "created_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String, unique=True, index=True, nullable=False)
+    command = Column(JSON, nullable=False)  # argv list
+    cwd = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="queued")  # queued | running | succeeded | failed | cancelled
+    worker_id = Column(String, nullable=True)
+    exit_code = Column(Integer, nullable=True)
+    error_message = Column(String, nullable=True)
+    cancel_requested = Column(Boolean, default=False)
+    created_at = Column(DateTime)
+    claimed_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    logs = relationship("ExecutionJobLog", back_populates="job", cascade="all, delete-orphan")
+    artifacts = relationship("ExecutionJobArtifact", back_populates="job", cascade="all, delete-orphan")
+
+
+class ExecutionJobLog(Base):
+    __tablename__ = "execution_job_logs"
+    __table_args__ = (UniqueConstraint("job_id", "seq", name="uq_execution_job_logs_job_seq"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("execution_jobs.id"), nullable=False, index=True)
+    seq = Column(Integer, nullable=False)
+    line = Column(Text, nullable=False)
+
+    job = relationship("ExecutionJob", back_populates="logs")
+
+
+class ExecutionJobArtifact(Base):
+    __tablename__ = "execution_job_artifacts"
+    __table_args__ = (UniqueConstraint("job_id", "filename", name="uq_execution_job_artifacts_job_filename"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("execution_jobs.id"), nullable=False, index=True)
+    filename = Column(String, nullable=False)
+    content = Column(LargeBinary, nullable=False)
+
+    job = relationship("ExecutionJob", back_populates="artifacts")
+
+
 class SchedulerEvent(Base):
     __tablename__ = "scheduler_events"
 
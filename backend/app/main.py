@@ -148,18 +148,37 @@ async def get_config():
             "mapping_relative_path": settings.row_lineage_mapping_relative_path,
             "max_hops": settings.row_lineage_max_hops,
             "scan_max_rows": settings.row_lineage_scan_max_rows,
+            "index_cache_max_mb": settings.row_lineage_index_cache_max_mb,
+            "schema_cache_ttl_seconds": settings.row_lineage_schema_cache_ttl_seconds,
+            "fetch_concurrency": settings.row_lineage_fetch_concurrency,
+            "trace_timeout_seconds": settings.row_lineage_trace_timeout_seconds,
+            "trace_cache_max_mb": settings.row_lineage_trace_cache_max_mb,
+            "trace_cache_ttl_seconds": settings.row_lineage_trace_cache_ttl_seconds,
         },
         "execution": {
             "dbt_project_path": settings.dbt_project_path,
             "max_concurrent_runs": settings.max_concurrent_runs,
+            "max_concurrent_runs_per_workspace": settings.max_concurrent_runs_per_workspace,
+            "max_queued_runs": settings.max_queued_runs,
             "max_run_history": settings.max_run_history,
             "max_artifact_sets": settings.max_artifact_sets,
             "log_buffer_size": settings.log_buffer_size,
+            "run_log_compress": settings.run_log_compress,
+            "dbt_json_logs": settings.dbt_json_logs,
+            "dbt_auto_state": settings.dbt_auto_state,
+            "dbt_reuse_partial_parse": settings.dbt_reuse_partial_parse,
+            "execution_backend": settings.execution_backend,
+            "execution_worker_poll_seconds": settings.execution_worker_poll_seconds,
+            "execution_worker_heartbeat_seconds": settings.execution_worker_heartbeat_seconds,
+            "execution_worker_timeout_seconds": settings.execution_worker_timeout_seconds,
+            "execution_worker_claim_timeout_seconds": settings.execution_worker_claim_timeout_seconds,
         },
         "catalog": {
             "allow_metadata_edits": settings.allow_metadata_edits,
             "search_indexing_frequency_seconds": settings.search_indexing_frequency_seconds,
+            "semantic_search_enabled": settings.catalog_semantic_search_enabled,
             "freshness_threshold_override_minutes": settings.freshness_threshold_override_minutes,
+            "freshness_cache_ttl_seconds": settings.freshness_cache_ttl_seconds,
             "validation_severity": settings.validation_severity,
             "statistics_refresh_policy": settings.statistics_refresh_policy,
         },
@@ -39,6 +39,26 @@ class FreshnessInfo(BaseModel):
     checked_at: Optional[datetime] = None
 
 
+class FreshnessSchemaSummary(BaseModel):
+    schema_: Optional[str] = Field(None, alias="schema")
+    total: int = 0
+    on_time: int = 0
+    late: int = 0
+    unknown: int = 0
+
+    class Config:
+        populate_by_name = True
+
+
+class FreshnessSummaryResponse(BaseModel):
+    computed_at: datetime
+    total: int = 0
+    on_time: int = 0
+    late: int = 0
+    unknown: int = 0
+    schemas: List[FreshnessSchemaSummary] = Field(default_factory=list)
+
+
 class CatalogEntitySummary(BaseModel):
     unique_id: str
     name: str
@@ -65,6 +85,11 @@ class CatalogEntityDetail(CatalogEntitySummary):
     meta: Dict[str, Any] = Field(default_factory=dict)
 
 
+class CatalogEntityBatchResponse(BaseModel):
+    entities: List[CatalogEntityDetail] = Field(default_factory=list)
+    missing: List[str] = Field(default_factory=list)
+
+
 class SearchResult(BaseModel):
     unique_id: str
     name: str
@@ -105,4 +130,7 @@ class ValidationIssue(BaseModel):
 
 class ValidationResponse(BaseModel):
     issues: List[ValidationIssue]
+    total: int = 0
+    offset: int = 0
+    limit: Optional[int] = None
 
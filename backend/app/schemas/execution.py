@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class RunStatus(str, Enum):
@@ -20,24 +20,50 @@ class DbtCommand(str, Enum):
     DEPS = "deps"
 
 
+class RunPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    SCHEDULED = "scheduled"
+    BACKFILL = "backfill"
+
+
 class RunRequest(BaseModel):
     command: DbtCommand
     parameters: Optional[Dict[str, Any]] = Field(default_factory=dict)
     description: Optional[str] = None
     workspace_id: Optional[int] = None
     run_row_lineage: bool = Field(default=False)
+    priority: RunPriority = RunPriority.INTERACTIVE
+
+
+class RunNodeResult(BaseModel):
+    unique_id: str
+    status: Optional[str] = None
+    execution_time: Optional[float] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    message: Optional[str] = None
+
+
+class RunProgress(BaseModel):
+    total: Optional[int] = None
+    completed: int = 0
+    failed: int = 0
 
 
 class RunSummary(BaseModel):
     run_id: str
     command: DbtCommand
     status: RunStatus
-    start_time: datetime
+    start_time: datetime  # when the run left the queue and began executing
     end_time: Optional[datetime] = None
     duration_seconds: Optional[float] = None
     description: Optional[str] = None
     error_message: Optional[str] = None
     artifacts_available: bool = False
+    progress: Optional[RunProgress] = None
+    priority: RunPriority = RunPriority.INTERACTIVE
+    queue_position: Optional[int] = None
+    queued_at: Optional[datetime] = None
 
 
 class RunDetail(RunSummary):
@@ -47,6 +73,20 @@ class RunDetail(RunSummary):
     project_path: Optional[str] = None
     dbt_output: Optional[Dict[str, Any]] = None
     run_row_lineage: bool = Field(default=False)
+    node_results: Dict[str, RunNodeResult] = Field(default_factory=dict)
+
+    @field_serializer("log_lines")
+    def _serialize_log_lines(self, log_lines: Any) -> List[str]:
+        # The executor stores a RunLogBuffer here while the run is live.
+        return list(log_lines)
+
+
+class RunLogLinesResponse(BaseModel):
+    run_id: str
+    first_line: int
+    lines: List[str]
+    total_lines: int
+    complete: bool
 
 
 class LogMessage(BaseModel):
@@ -55,6 +95,10 @@ class LogMessage(BaseModel):
     level: str
     message: str
     line_number: int
+    event_name: Optional[str] = None
+    node_id: Optional[str] = None
+    node_status: Optional[str] = None
+    execution_time: Optional[float] = None
 
 
 class RunHistoryResponse(BaseModel):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -9,6 +9,15 @@ class RowLineageBaseModel(BaseModel):
     model_config = ConfigDict(populate_by_name=True, protected_namespaces=())
 
 
+class RowLineageCacheStats(RowLineageBaseModel):
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
 class RowLineageStatus(RowLineageBaseModel):
     enabled: bool
     available: bool
@@ -18,6 +27,8 @@ class RowLineageStatus(RowLineageBaseModel):
     roots: List[str] = Field(default_factory=list)
     models: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
+    index_cache: Optional[RowLineageCacheStats] = None
+    trace_cache: Optional[RowLineageCacheStats] = None
 
 
 class RowLineageModelInfo(RowLineageBaseModel):
@@ -115,4 +126,5 @@ class RowLineageTraceResponse(RowLineageBaseModel):
     graph: RowLineageGraph
     hops: List[RowLineageHop]
     truncated: bool
+    direction: Literal["upstream", "downstream"] = "upstream"
     warnings: List[str] = Field(default_factory=list)
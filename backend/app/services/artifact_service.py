@@ -26,6 +26,22 @@ class ArtifactService:
         except json.JSONDecodeError:
             return None
 
+    def get_artifact_signature(self, filename: str) -> Optional[str]:
+        """Return a cheap identifier that changes whenever the artifact changes.
+
+        Monitored files use the watcher's content checksum; other files fall
+        back to their modification time and size.
+        """
+
+        version = self.watcher.get_current_version(filename)
+        if version is not None:
+            return version.checksum
+        file_path = self.base_path / filename
+        if not file_path.exists():
+            return None
+        stat = file_path.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
     def get_artifact_summary(self) -> Dict[str, bool]:
         return {
             "manifest": (self.base_path / "manifest.json").exists(),
@@ -0,0 +1,188 @@
+"""Content-addressed store for captured dbt artifacts.
+
+Every captured file is hashed (SHA-256) and kept once under
+``<artifacts base>/.store/objects/<aa>/<digest>``. Immutable run directories
+are populated with read-only hardlinks to those objects, so capturing a
+target directory only writes files whose content changed since an earlier
+capture. When hardlinks are not possible (e.g. the store and destination are
+on different filesystems) files are copied instead.
+
+Directories that other code writes to in place (the latest snapshot in the
+artifacts base, the saved parse cache) receive real copies, refreshed only
+when their content differs, so writes there can never reach a stored object.
+
+Storing an object and linking it into its destinations happens under a
+per-store lock that :meth:`ArtifactStore.prune` also holds, so pruning never
+removes an object between a capture's ``put`` and its ``link``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+STORE_DIRNAME = ".store"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# store root -> lock shared by every ArtifactStore instance for that root.
+_ROOT_LOCKS: Dict[str, threading.Lock] = {}
+_ROOT_LOCKS_GUARD = threading.Lock()
+
+
+def _root_lock(root: Path) -> threading.Lock:
+    key = os.path.abspath(root)
+    with _ROOT_LOCKS_GUARD:
+        return _ROOT_LOCKS.setdefault(key, threading.Lock())
+
+
+@dataclass
+class StoredFile:
+    relative_path: str
+    digest: str
+    size_bytes: int
+
+
+class ArtifactStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        # source path -> (size, mtime_ns, digest); skips re-hashing unchanged files.
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        # Serializes object placement (put + link/copy) against prune.
+        self._objects_lock = _root_lock(self.root)
+
+    @classmethod
+    def for_artifacts_base(cls, artifacts_base: Path) -> "ArtifactStore":
+        return cls(Path(artifacts_base) / STORE_DIRNAME)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        key = str(path.resolve())
+        with self._lock:
+            cached = self._digests.get(key)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        sha256 = hashlib.sha256()
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                sha256.update(block)
+        digest = sha256.hexdigest()
+        with self._lock:
+            self._digests[key] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def put(self, path: Path) -> str:
+        """Store ``path``'s content (once) and return its digest."""
+        digest = self.digest(path)
+        with self._objects_lock:
+            self._store(path, digest)
+        return digest
+
+    def _store(self, path: Path, digest: str) -> None:
+        target = self._object_path(digest)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging = target.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            shutil.copyfile(path, staging)
+            os.chmod(staging, 0o444)
+            os.replace(staging, target)
+
+    def link(self, digest: str, destination: Path) -> None:
+        """Make ``destination`` refer to the stored object ``digest``."""
+        source = self._object_path(digest)
+        if destination.is_symlink() or destination.is_file():
+            try:
+                if os.path.samefile(source, destination):
+                    return
+            except OSError:
+                pass
+            destination.unlink()
+        elif destination.is_dir():
+            shutil.rmtree(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
+
+    def copy(self, digest: str, destination: Path) -> None:
+        """Give ``destination`` a private, writable copy of the stored object ``digest``."""
+        source = self._object_path(digest)
+        if destination.is_symlink() or destination.is_file():
+            try:
+                shared = os.path.samefile(source, destination)
+            except OSError:
+                shared = False
+            if not shared and not destination.is_symlink() and self.digest(destination) == digest:
+                return
+            # Never write through an existing file: it may be a link to a stored object.
+            destination.unlink()
+        elif destination.is_dir():
+            shutil.rmtree(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, destination)
+
+    def capture(
+        self,
+        source_dir: Path,
+        destinations: Iterable[Path],
+        include: Optional[Iterable[str]] = None,
+        copy_destinations: Iterable[Path] = (),
+    ) -> List[StoredFile]:
+        """Store the files under ``source_dir`` and place them in every destination.
+
+        ``destinations`` must be directories nothing modifies afterwards; they
+        get hardlinks to the stored objects. ``copy_destinations`` get real
+        copies of files whose content changed. ``include`` limits the capture
+        to the given top-level files or directories of ``source_dir``; by
+        default everything is captured.
+        Files already present in a destination but absent from the source are
+        left in place, matching ``copytree(..., dirs_exist_ok=True)``.
+        """
+        source_dir = Path(source_dir)
+        destinations = [Path(destination) for destination in destinations]
+        copy_destinations = [Path(destination) for destination in copy_destinations]
+        if include is None:
+            roots = [source_dir]
+        else:
+            roots = [source_dir / name for name in include if (source_dir / name).exists()]
+
+        stored: List[StoredFile] = []
+        for root in roots:
+            paths = [root] if root.is_file() else sorted(p for p in root.rglob("*") if p.is_file())
+            for path in paths:
+                relative = path.relative_to(source_dir)
+                digest = self.digest(path)
+                with self._objects_lock:
+                    self._store(path, digest)
+                    for destination in destinations:
+                        self.link(digest, destination / relative)
+                    for destination in copy_destinations:
+                        self.copy(digest, destination / relative)
+                stored.append(StoredFile(relative.as_posix(), digest, path.stat().st_size))
+        return stored
+
+    def prune(self) -> int:
+        """Delete objects no directory links to any more; return how many were removed."""
+        removed = 0
+        with self._objects_lock:
+            if not self.objects_dir.exists():
+                return removed
+            for path in self.objects_dir.glob("*/*"):
+                try:
+                    if path.name.endswith(".tmp") or path.stat().st_nlink > 1:
+                        continue
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+        return removed
@@ -0,0 +1,116 @@
+"""Thread-safe LRU cache bounded by the total size of its entries."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    size: int
+    stored_at: float
+
+
+class BoundedCache(Generic[K, V]):
+    """LRU cache that evicts least recently used entries once ``max_bytes`` is exceeded.
+
+    Callers report the size of each entry when storing it. Entries larger than
+    the whole budget are not cached. When ``ttl_seconds`` is set, entries
+    older than that are treated as misses.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, _Entry[V]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _drop(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict_to(self, budget: int) -> None:
+        while self._entries and self._bytes > budget:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def get(self, key: K, is_valid: Optional[Callable[[V], bool]] = None) -> Optional[V]:
+        """Return the cached value, or ``None`` when missing, expired or rejected by ``is_valid``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expired = self.ttl_seconds is not None and self._clock() - entry.stored_at >= self.ttl_seconds
+                if expired or (is_valid is not None and not is_valid(entry.value)):
+                    self._drop(key)
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: K, value: V, size: int) -> bool:
+        """Store ``value``; return ``False`` when it is larger than the whole budget."""
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = _Entry(value=value, size=size, stored_at=self._clock())
+            self._bytes += size
+            self._evict_to(self.max_bytes)
+            return True
+
+    def invalidate(self, key: K) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._drop(key)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict_to(max_bytes)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
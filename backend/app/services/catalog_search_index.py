@@ -0,0 +1,239 @@
+"""Local vector index used to blend semantic similarity into catalog search.
+
+Documents (entity and column descriptions) are embedded by a pluggable local
+embedder and stored in a dense NumPy matrix. Lookups use random-hyperplane
+LSH tables to shortlist candidates on large catalogs and exact cosine scoring
+on the shortlist. Indexes are kept per artifacts directory and updated
+incrementally: only documents whose text changed are re-embedded when a new
+manifest version arrives.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SENTENCE_TRANSFORMERS_PREFIX = "sentence-transformers:"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_indexes_by_key: Dict[Tuple[str, str], "VectorIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+class Embedder(Protocol):
+    name: str
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return an ``(len(texts), dimension)`` float32 matrix of unit vectors."""
+
+
+class HashingEmbedder:
+    """Dependency-free embedder based on signed feature hashing.
+
+    Words and character trigrams are hashed into a fixed number of buckets, so
+    morphological variants ("order", "orders", "ordered") land close together
+    without any model download.
+    """
+
+    def __init__(self, dimension: int = 512):
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        features: List[Tuple[str, float]] = []
+        for token in _TOKEN_PATTERN.findall(text.lower().replace("_", " ")):
+            if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+                token = token[:-1]
+            features.append((f"w:{token}", 1.0))
+            padded = f"^{token}$"
+            for start in range(len(padded) - 2):
+                features.append((f"c:{padded[start:start + 3]}", 0.5))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                matrix[row, digest % self.dimension] += sign * weight
+        return _normalize(matrix)
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by a locally available ``sentence-transformers`` model."""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer  # optional dependency
+
+        self.name = f"{SENTENCE_TRANSFORMERS_PREFIX}{model_name}"
+        self._model = SentenceTransformer(model_name)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = self._model.encode(list(texts), normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def build_embedder(spec: str) -> Embedder:
+    """Resolve an embedder from the ``CATALOG_SEMANTIC_SEARCH_MODEL`` setting.
+
+    ``hashing`` (the default) needs no extra packages. Values of the form
+    ``sentence-transformers:<model>`` load a local model and fall back to
+    hashing when the package or model is unavailable.
+    """
+
+    if spec.startswith(SENTENCE_TRANSFORMERS_PREFIX):
+        model_name = spec[len(SENTENCE_TRANSFORMERS_PREFIX):]
+        try:
+            return SentenceTransformerEmbedder(model_name)
+        except Exception as exc:  # ImportError or model loading failures
+            logger.warning("Falling back to hashing embedder for catalog search: %s", exc)
+    return HashingEmbedder()
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class VectorIndex:
+    """Dense vector index with LSH candidate selection."""
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        n_tables: int = 8,
+        n_bits: int = 10,
+        brute_force_limit: int = 5000,
+        seed: int = 0,
+    ):
+        self.embedder = embedder
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.brute_force_limit = brute_force_limit
+        self.signature: Optional[Any] = None
+        self._seed = seed
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._hashes: List[str] = []
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._planes: Optional[np.ndarray] = None
+        self._buckets: List[Dict[int, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def update(self, documents: Dict[str, str], signature: Any = None) -> int:
+        """Synchronize the index with ``documents``; return how many were embedded."""
+
+        with self._lock:
+            previous = {
+                doc_id: (text_hash, row)
+                for row, (doc_id, text_hash) in enumerate(zip(self._ids, self._hashes))
+            }
+            ids = sorted(documents)
+            hashes = [_text_hash(documents[doc_id]) for doc_id in ids]
+            reused: List[int] = []
+            stale: List[int] = []
+            for position, (doc_id, text_hash) in enumerate(zip(ids, hashes)):
+                if doc_id in previous and previous[doc_id][0] == text_hash:
+                    reused.append(position)
+                else:
+                    stale.append(position)
+
+            fresh_vectors = (
+                self.embedder.embed([documents[ids[position]] for position in stale]) if stale else None
+            )
+            dimension = (
+                fresh_vectors.shape[1]
+                if fresh_vectors is not None
+                else (self._matrix.shape[1] if self._matrix.size else 0)
+            )
+            matrix = np.zeros((len(ids), dimension), dtype=np.float32)
+            if reused:
+                matrix[reused] = self._matrix[[previous[ids[position]][1] for position in reused]]
+            if stale:
+                matrix[stale] = fresh_vectors
+
+            self._ids = ids
+            self._hashes = hashes
+            self._matrix = matrix
+            self._rebuild_buckets()
+            self.signature = signature
+            return len(stale)
+
+    def _codes(self, vectors: np.ndarray) -> np.ndarray:
+        bits = np.einsum("tbd,nd->tnb", self._planes, vectors) > 0
+        weights = 1 << np.arange(self.n_bits, dtype=np.int64)
+        return bits.astype(np.int64) @ weights
+
+    def _rebuild_buckets(self) -> None:
+        self._buckets = []
+        if len(self._ids) <= self.brute_force_limit or not self._matrix.size:
+            return
+        dimension = self._matrix.shape[1]
+        if self._planes is None or self._planes.shape[2] != dimension:
+            rng = np.random.default_rng(self._seed)
+            self._planes = rng.standard_normal((self.n_tables, self.n_bits, dimension)).astype(np.float32)
+        codes = self._codes(self._matrix)
+        for table_codes in codes:
+            order = np.argsort(table_codes, kind="stable")
+            unique_codes, starts = np.unique(table_codes[order], return_index=True)
+            groups = np.split(order, starts[1:])
+            self._buckets.append(dict(zip(unique_codes.tolist(), groups)))
+
+    def _candidates(self, query_vector: np.ndarray, top_k: int) -> Optional[np.ndarray]:
+        if not self._buckets:
+            return None
+        query_codes = self._codes(query_vector[None, :])[:, 0]
+        hits = [
+            self._buckets[table].get(int(code))
+            for table, code in enumerate(query_codes)
+        ]
+        hits = [hit for hit in hits if hit is not None]
+        if not hits:
+            return None
+        candidates = np.unique(np.concatenate(hits))
+        return candidates if len(candidates) >= top_k else None
+
+    def search(self, query: str, top_k: int = 50) -> List[Tuple[str, float]]:
+        """Return up to ``top_k`` ``(document_id, cosine_similarity)`` pairs."""
+
+        with self._lock:
+            if not self._ids or not query.strip():
+                return []
+            query_vector = self.embedder.embed([query])[0]
+            candidates = self._candidates(query_vector, top_k)
+            if candidates is None:
+                candidates = np.arange(len(self._ids))
+            scores = self._matrix[candidates] @ query_vector
+            limit = min(top_k, len(candidates))
+            best = np.argpartition(-scores, limit - 1)[:limit]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            return [(self._ids[candidates[position]], float(scores[position])) for position in best]
+
+
+def get_vector_index(cache_key: str, embedder_spec: str) -> VectorIndex:
+    """Return the shared index for an artifacts directory, creating it on first use."""
+
+    key = (cache_key, embedder_spec)
+    with _indexes_lock:
+        index = _indexes_by_key.get(key)
+        if index is None:
+            index = VectorIndex(build_embedder(embedder_spec))
+            _indexes_by_key[key] = index
+        return index
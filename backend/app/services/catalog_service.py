@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -14,6 +19,97 @@ from app.database.connection import SessionLocal
 from app.database.models import models as db_models
 from app.schemas import catalog as catalog_schemas
 from app.services.artifact_service import ArtifactService
+from app.services.catalog_search_index import get_vector_index
+
+_freshness_cache_by_path: Dict[str, "_FreshnessSnapshot"] = {}
+_freshness_cache_lock = threading.Lock()
+_validation_cache_by_path: Dict[str, "_ValidationSnapshot"] = {}
+_validation_cache_lock = threading.Lock()
+
+_UTC_SUFFIXES = ("Z", "+00:00", "+0000")
+_SEMANTIC_TOP_K = 200
+
+
+@dataclass
+class _FreshnessSnapshot:
+    signature: Tuple[Any, ...]
+    computed_at: datetime
+    by_source: Dict[str, catalog_schemas.FreshnessInfo]
+
+
+@dataclass
+class _DetailSnapshot:
+    manifest: Dict[str, Any]
+    catalog: Dict[str, Any]
+    run_results: Dict[str, Any]
+    merged_nodes: Dict[str, Dict[str, Any]]
+    ids: List[str]  # requested ids that exist, in request order
+    signatures: List[Optional[str]]
+    freshness: _FreshnessSnapshot
+    entity_overrides: Dict[str, Dict[str, Any]]
+    column_overrides: Dict[str, Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class _ValidationSnapshot:
+    signature: Tuple[Any, ...]
+    overrides: Dict[str, Dict[str, Any]]
+    freshness_computed_at: datetime
+    # unique_id -> (artifact fingerprint, override owner, test status, freshness status)
+    fingerprints: Dict[str, Tuple[Any, ...]]
+    issues_by_entity: Dict[str, List[catalog_schemas.ValidationIssue]]
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _parse_timestamp(value: str) -> np.datetime64:
+    if not value:
+        return np.datetime64("NaT", "us")
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return np.datetime64("NaT", "us")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(parsed, "us")
+
+
+def _to_datetime64(values: List[Any]) -> np.ndarray:
+    """Parse ISO-8601 timestamps into a naive-UTC ``datetime64[us]`` array.
+
+    UTC designators are stripped so the bulk of the values parse in one NumPy
+    call; values with other offsets, or batches NumPy rejects, fall back to
+    ``datetime.fromisoformat``. Missing or unparsable values become ``NaT``.
+    """
+
+    normalized: List[str] = []
+    offset_values: Dict[int, str] = {}
+    for index, value in enumerate(values):
+        text = str(value).strip() if value else ""
+        for suffix in _UTC_SUFFIXES:
+            if text.endswith(suffix):
+                text = text[: -len(suffix)]
+                break
+        else:
+            if len(text) > 10 and text[-6] in "+-" and text[-3] == ":":
+                offset_values[index] = text
+                text = ""
+        normalized.append(text)
+
+    try:
+        parsed = np.array(normalized, dtype="datetime64[us]")
+    except ValueError:
+        parsed = np.array([_parse_timestamp(text) for text in normalized], dtype="datetime64[us]")
+    for index, text in offset_values.items():
+        parsed[index] = _parse_timestamp(text)
+    return parsed
 
 
 class CatalogService:
@@ -136,13 +232,17 @@ class CatalogService:
         catalog_node: Dict[str, Any],
         test_nodes: Dict[str, Dict[str, Any]],
         test_statuses: Dict[str, str],
+        column_test_map: Optional[Dict[Tuple[str, str], List[str]]] = None,
+        metadata_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[catalog_schemas.ColumnMetadata]:
         merged = self._column_meta(manifest_node, catalog_node)
         stats = self._column_stats(catalog_node, unique_id)
-        column_test_map = self._column_tests(test_nodes)
+        if column_test_map is None:
+            column_test_map = self._column_tests(test_nodes)
         results: List[catalog_schemas.ColumnMetadata] = []
 
-        metadata_overrides = self._column_overrides(unique_id)
+        if metadata_overrides is None:
+            metadata_overrides = self._column_overrides([unique_id]).get(unique_id, {})
         for name, meta in merged.items():
             key = (unique_id, name)
             tests = [
@@ -166,12 +266,16 @@ class CatalogService:
             )
         return results
 
-    def _column_overrides(self, unique_id: str) -> Dict[str, Dict[str, Any]]:
-        overrides: Dict[str, Dict[str, Any]] = {}
+    def _column_overrides(self, unique_ids: Iterable[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        overrides: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
         with self._session() as session:
-            records = session.query(db_models.ColumnMetadata).filter_by(unique_id=unique_id).all()
+            records = (
+                session.query(db_models.ColumnMetadata)
+                .filter(db_models.ColumnMetadata.unique_id.in_(list(unique_ids)))
+                .all()
+            )
             for record in records:
-                overrides[record.column_name] = {
+                overrides[record.unique_id][record.column_name] = {
                     "description_override": record.description_override,
                     "owner": record.owner,
                     "tags_override": record.tags_override or [],
@@ -179,75 +283,139 @@ class CatalogService:
                 }
         return overrides
 
-    def _entity_override(self, unique_id: str) -> Optional[Dict[str, Any]]:
+    def _entity_overrides(self, unique_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        overrides: Dict[str, Dict[str, Any]] = {}
         with self._session() as session:
-            record = (
-                session.query(db_models.CatalogMetadata)
-                .filter_by(unique_id=unique_id)
-                .one_or_none()
-            )
-            if record is None:
-                return None
-            return {
-                "owner": record.owner,
-                "description_override": record.description_override,
-                "tags_override": record.tags_override or [],
-                "custom_metadata": record.custom_metadata or {},
-            }
+            query = session.query(db_models.CatalogMetadata)
+            if unique_ids is not None:
+                query = query.filter(db_models.CatalogMetadata.unique_id.in_(list(unique_ids)))
+            for record in query.all():
+                overrides[record.unique_id] = {
+                    "owner": record.owner,
+                    "description_override": record.description_override,
+                    "tags_override": record.tags_override or [],
+                    "custom_metadata": record.custom_metadata or {},
+                }
+        return overrides
 
-    def _freshness(self, catalog_node: Dict[str, Any]) -> Optional[catalog_schemas.FreshnessInfo]:
-        freshness_meta = catalog_node.get("freshness") or {}
-        max_loaded_at = freshness_meta.get("max_loaded_at") or catalog_node.get("max_loaded_at")
-        checked_at = freshness_meta.get("snapshotted_at") or freshness_meta.get("last_checked")
-        threshold_minutes = freshness_meta.get("threshold")
-        if threshold_minutes is None and self.settings.freshness_threshold_override_minutes is not None:
-            threshold_minutes = self.settings.freshness_threshold_override_minutes
-
-        if max_loaded_at:
-            try:
-                max_loaded_time = datetime.fromisoformat(str(max_loaded_at))
-            except ValueError:
-                max_loaded_time = None
-        else:
-            max_loaded_time = None
+    def _freshness_signature(self) -> Tuple[Any, ...]:
+        return (
+            self.artifact_service.get_artifact_signature("manifest.json"),
+            self.artifact_service.get_artifact_signature("catalog.json"),
+            self.settings.freshness_threshold_override_minutes,
+        )
 
-        if checked_at:
-            try:
-                checked_time = datetime.fromisoformat(str(checked_at))
-            except ValueError:
-                checked_time = None
-        else:
-            checked_time = None
-
-        age_minutes: Optional[float] = None
-        status: Optional[str] = None
-        if max_loaded_time:
-            now = datetime.now(timezone.utc)
-            if max_loaded_time.tzinfo is None:
-                max_loaded_time = max_loaded_time.replace(tzinfo=timezone.utc)
-            age_minutes = (now - max_loaded_time).total_seconds() / 60
-            if threshold_minutes is not None:
-                status = "on-time" if age_minutes <= float(threshold_minutes) else "late"
-
-        if not status and freshness_meta.get("status"):
-            status = freshness_meta.get("status")
-
-        return catalog_schemas.FreshnessInfo(
-            max_loaded_at=str(max_loaded_at) if max_loaded_at else None,
-            age_minutes=age_minutes,
-            threshold_minutes=float(threshold_minutes) if threshold_minutes is not None else None,
-            status=status,
-            checked_at=checked_time,
+    def _cached_freshness_snapshot(self) -> Optional[_FreshnessSnapshot]:
+        """The shared freshness snapshot, if the artifacts and TTL still allow reusing it."""
+
+        with _freshness_cache_lock:
+            cached = _freshness_cache_by_path.get(str(self.artifact_service.base_path))
+        if cached is None or cached.signature != self._freshness_signature():
+            return None
+        age = (datetime.now(timezone.utc) - cached.computed_at).total_seconds()
+        if age >= self.settings.freshness_cache_ttl_seconds:
+            return None
+        return cached
+
+    def _freshness_snapshot(
+        self,
+        manifest: Dict[str, Any],
+        catalog: Dict[str, Any],
+    ) -> _FreshnessSnapshot:
+        """Return freshness for every source, recomputed when artifacts change.
+
+        The snapshot is shared per artifacts directory and rebuilt in a single
+        vectorized pass whenever the manifest or catalog changes, or once its
+        computed ``now`` is older than ``freshness_cache_ttl_seconds``.
+        """
+
+        cached = self._cached_freshness_snapshot()
+        if cached is not None:
+            return cached
+
+        source_ids = sorted(
+            unique_id
+            for unique_id, node in self._merged_nodes(manifest).items()
+            if node.get("resource_type") == "source"
+        )
+        catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+        now = datetime.now(timezone.utc)
+        snapshot = _FreshnessSnapshot(
+            signature=self._freshness_signature(),
+            computed_at=now,
+            by_source=self._compute_freshness(source_ids, catalog_nodes, now),
+        )
+        with _freshness_cache_lock:
+            _freshness_cache_by_path[str(self.artifact_service.base_path)] = snapshot
+        return snapshot
+
+    def _compute_freshness(
+        self,
+        source_ids: List[str],
+        catalog_nodes: Dict[str, Dict[str, Any]],
+        now: datetime,
+    ) -> Dict[str, catalog_schemas.FreshnessInfo]:
+        if not source_ids:
+            return {}
+
+        catalog_entries = [catalog_nodes.get(unique_id, {}) for unique_id in source_ids]
+        freshness_metas = [entry.get("freshness") or {} for entry in catalog_entries]
+        max_loaded_values = [
+            meta.get("max_loaded_at") or entry.get("max_loaded_at")
+            for meta, entry in zip(freshness_metas, catalog_entries)
+        ]
+        checked_values = [meta.get("snapshotted_at") or meta.get("last_checked") for meta in freshness_metas]
+        override = self.settings.freshness_threshold_override_minutes
+        thresholds = np.array(
+            [
+                _to_float(meta.get("threshold") if meta.get("threshold") is not None else override)
+                for meta in freshness_metas
+            ],
+            dtype="float64",
         )
 
+        max_loaded = _to_datetime64(max_loaded_values)
+        checked = _to_datetime64(checked_values)
+        now64 = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), "us")
+        ages = (now64 - max_loaded) / np.timedelta64(1, "m")
+        has_age = ~np.isnat(max_loaded)
+        has_threshold = has_age & ~np.isnan(thresholds)
+        on_time = has_threshold & (ages <= thresholds)
+        late = has_threshold & ~on_time
+
+        results: Dict[str, catalog_schemas.FreshnessInfo] = {}
+        for index, unique_id in enumerate(source_ids):
+            if on_time[index]:
+                status: Optional[str] = "on-time"
+            elif late[index]:
+                status = "late"
+            else:
+                status = freshness_metas[index].get("status") or None
+            max_loaded_at = max_loaded_values[index]
+            results[unique_id] = catalog_schemas.FreshnessInfo(
+                max_loaded_at=str(max_loaded_at) if max_loaded_at else None,
+                age_minutes=float(ages[index]) if has_age[index] else None,
+                threshold_minutes=None if np.isnan(thresholds[index]) else float(thresholds[index]),
+                status=status,
+                checked_at=None
+                if np.isnat(checked[index])
+                else checked[index].item().replace(tzinfo=timezone.utc),
+            )
+        return results
+
     def _test_status_for_entity(
         self,
         unique_id: str,
         test_nodes: Dict[str, Dict[str, Any]],
         test_statuses: Dict[str, str],
+        tests_by_entity: Optional[Dict[str, List[str]]] = None,
     ) -> Tuple[str | None, List[catalog_schemas.TestStatus]]:
         statuses: List[catalog_schemas.TestStatus] = []
-        for test_id, node in test_nodes.items():
+        if tests_by_entity is not None:
+            candidates = [(test_id, test_nodes[test_id]) for test_id in tests_by_entity.get(unique_id, [])]
+        else:
+            candidates = list(test_nodes.items())
+        for test_id, node in candidates:
             depends_on = node.get("depends_on", {}).get("nodes", [])
             if unique_id in depends_on:
                 statuses.append(
@@ -280,15 +448,16 @@ class CatalogService:
         manifest, catalog, run_results = self._load_artifacts()
         test_nodes = self._test_map(manifest)
         test_statuses = self._test_status_map(run_results)
+        tests_by_entity = self._tests_by_entity(test_nodes)
         merged_nodes = self._merged_nodes(manifest)
-        catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+        freshness_by_source = self._freshness_snapshot(manifest, catalog).by_source
+        overrides = self._entity_overrides()
 
         summaries: List[catalog_schemas.CatalogEntitySummary] = []
         for unique_id, node in merged_nodes.items():
-            catalog_node = catalog_nodes.get(unique_id, {})
-            override = self._entity_override(unique_id)
-            test_status, _ = self._test_status_for_entity(unique_id, test_nodes, test_statuses)
-            freshness = self._freshness(catalog_node) if node.get("resource_type") == "source" else None
+            override = overrides.get(unique_id)
+            test_status, _ = self._test_status_for_entity(unique_id, test_nodes, test_statuses, tests_by_entity)
+            freshness = freshness_by_source.get(unique_id)
 
             summaries.append(
                 catalog_schemas.CatalogEntitySummary(
@@ -309,45 +478,175 @@ class CatalogService:
             )
         return sorted(summaries, key=lambda item: item.unique_id)
 
-    def entity_detail(self, unique_id: str) -> Optional[catalog_schemas.CatalogEntityDetail]:
+    def detail_snapshot(self, unique_ids: List[str]) -> _DetailSnapshot:
+        """Load the artifacts and the overrides of the requested entities once.
+
+        Unknown ids are dropped; the ETag and the details of one request are
+        both derived from the returned snapshot.
+        """
+
         manifest, catalog, run_results = self._load_artifacts()
         merged_nodes = self._merged_nodes(manifest)
-        node = merged_nodes.get(unique_id)
-        if not node:
-            return None
+        ids = [unique_id for unique_id in dict.fromkeys(unique_ids) if merged_nodes.get(unique_id)]
+        return _DetailSnapshot(
+            manifest=manifest,
+            catalog=catalog,
+            run_results=run_results,
+            merged_nodes=merged_nodes,
+            ids=ids,
+            signatures=[
+                self.artifact_service.get_artifact_signature(filename)
+                for filename in ("manifest.json", "catalog.json", "run_results.json")
+            ],
+            freshness=self._freshness_snapshot(manifest, catalog),
+            entity_overrides=self._entity_overrides(ids) if ids else {},
+            column_overrides=self._column_overrides(ids) if ids else {},
+        )
 
+    def detail_etag(self, snapshot: _DetailSnapshot) -> str:
+        """Weak validator for entity details, computed without building them.
+
+        Covers the artifact versions, the freshness snapshot time and the user
+        overrides of the requested entities.
+        """
+
+        payload = {
+            "ids": sorted(snapshot.ids),
+            "artifacts": snapshot.signatures,
+            "freshness": snapshot.freshness.computed_at.isoformat(),
+            "entity_overrides": snapshot.entity_overrides,
+            "column_overrides": snapshot.column_overrides,
+        }
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return f'W/"{digest[:32]}"'
+
+    def entity_details(
+        self,
+        unique_ids: List[str],
+        snapshot: Optional[_DetailSnapshot] = None,
+    ) -> Dict[str, catalog_schemas.CatalogEntityDetail]:
+        """Build details for several entities from one artifact snapshot.
+
+        Test indexes, the freshness snapshot and the entity/column overrides
+        are computed once for the whole batch. Unknown ids are omitted.
+        """
+
+        snapshot = snapshot or self.detail_snapshot(unique_ids)
+        wanted = set(unique_ids)
+        ids = [unique_id for unique_id in snapshot.ids if unique_id in wanted]
+        if not ids:
+            return {}
+
+        manifest, catalog, run_results = snapshot.manifest, snapshot.catalog, snapshot.run_results
+        merged_nodes = snapshot.merged_nodes
         catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
-        catalog_node = catalog_nodes.get(unique_id, {})
         test_nodes = self._test_map(manifest)
         test_statuses = self._test_status_map(run_results)
-        override = self._entity_override(unique_id)
-        test_status, tests = self._test_status_for_entity(unique_id, test_nodes, test_statuses)
-        columns = self._column_lineup(unique_id, node, catalog_node, test_nodes, test_statuses)
-
-        return catalog_schemas.CatalogEntityDetail(
-            unique_id=unique_id,
-            name=node.get("name"),
-            resource_type=node.get("resource_type"),
-            database=node.get("database"),
-            schema=node.get("schema"),
-            tags=node.get("tags", []),
-            owner=(node.get("meta", {}) or {}).get("owner"),
-            user_owner=override.get("owner") if override else None,
-            description=node.get("description"),
-            user_description=override.get("description_override") if override else None,
-            user_tags=override.get("tags_override", []) if override else [],
-            test_status=test_status,
-            freshness=self._freshness(catalog_node) if node.get("resource_type") == "source" else None,
-            columns=columns,
-            tests=tests,
-            doc_path=node.get("docs", {}).get("show") if node.get("docs") else None,
-            meta=node.get("meta", {}),
+        tests_by_entity = self._tests_by_entity(test_nodes)
+        column_test_map = self._column_tests(test_nodes)
+        freshness_by_source = snapshot.freshness.by_source
+        entity_overrides = snapshot.entity_overrides
+        column_overrides = snapshot.column_overrides
+
+        details: Dict[str, catalog_schemas.CatalogEntityDetail] = {}
+        for unique_id in ids:
+            node = merged_nodes[unique_id]
+            catalog_node = catalog_nodes.get(unique_id, {})
+            override = entity_overrides.get(unique_id)
+            test_status, tests = self._test_status_for_entity(unique_id, test_nodes, test_statuses, tests_by_entity)
+            columns = self._column_lineup(
+                unique_id,
+                node,
+                catalog_node,
+                test_nodes,
+                test_statuses,
+                column_test_map=column_test_map,
+                metadata_overrides=column_overrides.get(unique_id, {}),
+            )
+            details[unique_id] = catalog_schemas.CatalogEntityDetail(
+                unique_id=unique_id,
+                name=node.get("name"),
+                resource_type=node.get("resource_type"),
+                database=node.get("database"),
+                schema=node.get("schema"),
+                tags=node.get("tags", []),
+                owner=(node.get("meta", {}) or {}).get("owner"),
+                user_owner=override.get("owner") if override else None,
+                description=node.get("description"),
+                user_description=override.get("description_override") if override else None,
+                user_tags=override.get("tags_override", []) if override else [],
+                test_status=test_status,
+                freshness=freshness_by_source.get(unique_id),
+                columns=columns,
+                tests=tests,
+                doc_path=node.get("docs", {}).get("show") if node.get("docs") else None,
+                meta=node.get("meta", {}),
+            )
+        return details
+
+    def entity_detail(self, unique_id: str) -> Optional[catalog_schemas.CatalogEntityDetail]:
+        return self.entity_details([unique_id]).get(unique_id)
+
+    def _search_documents(
+        self,
+        merged_nodes: Dict[str, Dict[str, Any]],
+        catalog_nodes: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, str]:
+        documents: Dict[str, str] = {}
+        for unique_id, node in merged_nodes.items():
+            if node.get("resource_type") == "test":
+                continue
+            parts = [node.get("name") or "", node.get("description") or "", " ".join(node.get("tags", []) or [])]
+            documents[unique_id] = " ".join(part for part in parts if part)
+            columns = self._column_meta(node, catalog_nodes.get(unique_id, {}))
+            for col_name, meta in columns.items():
+                documents[f"{unique_id}.{col_name}"] = " ".join(
+                    part for part in [col_name, meta.get("description") or ""] if part
+                )
+        return documents
+
+    def _semantic_scores(
+        self,
+        query: str,
+        manifest: Dict[str, Any],
+        catalog: Dict[str, Any],
+    ) -> Dict[str, float]:
+        """Semantic relevance of entity and column descriptions to the query, in ``(0, 1]``.
+
+        Similarities at or below ``catalog_semantic_search_min_similarity`` are
+        treated as noise (feature-hashing collisions give unrelated texts small
+        positive cosines) and dropped; the rest are rescaled so the cutoff maps
+        to 0 and an exact match to 1. The vector index is shared per artifacts
+        directory and re-synchronized (re-embedding only changed documents)
+        when the manifest or catalog version changes.
+        """
+
+        if not query or not self.settings.catalog_semantic_search_enabled:
+            return {}
+        index = get_vector_index(
+            str(self.artifact_service.base_path),
+            self.settings.catalog_semantic_search_model,
         )
+        signature = (
+            self.artifact_service.get_artifact_signature("manifest.json"),
+            self.artifact_service.get_artifact_signature("catalog.json"),
+        )
+        if index.signature != signature or not len(index):
+            catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+            index.update(self._search_documents(self._merged_nodes(manifest), catalog_nodes), signature=signature)
+        cutoff = min(max(self.settings.catalog_semantic_search_min_similarity, 0.0), 0.99)
+        return {
+            document_id: (similarity - cutoff) / (1.0 - cutoff)
+            for document_id, similarity in index.search(query, top_k=_SEMANTIC_TOP_K)
+            if similarity > cutoff
+        }
 
     def search(self, query: str) -> catalog_schemas.SearchResponse:
         summaries = self.list_entities()
-        catalog, _, _ = self._load_artifacts()
+        manifest, catalog, _ = self._load_artifacts()
         catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+        semantic_scores = self._semantic_scores(query, manifest, catalog)
+        semantic_weight = self.settings.catalog_semantic_search_weight
         results: Dict[str, List[catalog_schemas.SearchResult]] = defaultdict(list)
 
         for summary in summaries:
@@ -360,6 +659,7 @@ class CatalogService:
                 )
                 for tag in summary.tags + summary.user_tags:
                     score = max(score, self._score(query, tag))
+                score += semantic_weight * semantic_scores.get(summary.unique_id, 0.0)
             if score > 0 or not query:
                 results[summary.resource_type].append(
                     catalog_schemas.SearchResult(
@@ -378,11 +678,14 @@ class CatalogService:
             catalog_node = catalog_nodes.get(summary.unique_id, {})
             columns = catalog_node.get("columns", {}) or {}
             for col_name, meta in columns.items():
+                column_id = f"{summary.unique_id}.{col_name}"
                 score = self._score(query, col_name)
+                if query:
+                    score += semantic_weight * semantic_scores.get(column_id, 0.0)
                 if score > 0 or not query:
                     results["columns"].append(
                         catalog_schemas.SearchResult(
-                            unique_id=f"{summary.unique_id}.{col_name}",
+                            unique_id=column_id,
                             name=col_name,
                             resource_type="column",
                             score=score,
@@ -398,6 +701,33 @@ class CatalogService:
         }
         return catalog_schemas.SearchResponse(query=query, results=sorted_results)
 
+    def freshness_summary(self) -> catalog_schemas.FreshnessSummaryResponse:
+        manifest, catalog, _ = self._load_artifacts()
+        snapshot = self._freshness_snapshot(manifest, catalog)
+        merged_nodes = self._merged_nodes(manifest)
+
+        by_schema: Dict[Optional[str], catalog_schemas.FreshnessSchemaSummary] = {}
+        for unique_id, freshness in snapshot.by_source.items():
+            schema = (merged_nodes.get(unique_id) or {}).get("schema")
+            bucket = by_schema.setdefault(schema, catalog_schemas.FreshnessSchemaSummary(schema=schema))
+            bucket.total += 1
+            if freshness.status == "on-time":
+                bucket.on_time += 1
+            elif freshness.status == "late":
+                bucket.late += 1
+            else:
+                bucket.unknown += 1
+
+        schemas = sorted(by_schema.values(), key=lambda item: item.schema_ or "")
+        return catalog_schemas.FreshnessSummaryResponse(
+            computed_at=snapshot.computed_at,
+            total=sum(item.total for item in schemas),
+            on_time=sum(item.on_time for item in schemas),
+            late=sum(item.late for item in schemas),
+            unknown=sum(item.unknown for item in schemas),
+            schemas=schemas,
+        )
+
     def update_metadata(
         self,
         unique_id: str,
@@ -472,118 +802,277 @@ class CatalogService:
         catalog_node = catalog_nodes.get(unique_id, {})
         return self._column_lineup(unique_id, node, catalog_node, test_nodes, test_statuses)
 
-    def validate(self) -> catalog_schemas.ValidationResponse:
+    def _tests_by_entity(self, test_nodes: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        mapping: Dict[str, List[str]] = defaultdict(list)
+        for test_id, node in test_nodes.items():
+            for target in node.get("depends_on", {}).get("nodes", []):
+                mapping[target].append(test_id)
+        return mapping
+
+    def _overall_test_status(self, test_ids: List[str], test_statuses: Dict[str, str]) -> Optional[str]:
+        if not test_ids:
+            return None
+        statuses = {test_statuses.get(test_id, "not-run") for test_id in test_ids}
+        for level in ["error", "fail", "warn", "skipped", "success", "not-run"]:
+            if level in statuses:
+                return level
+        return None
+
+    def _validation_signature(self) -> Tuple[Any, ...]:
+        return (
+            self.artifact_service.get_artifact_signature("manifest.json"),
+            self.artifact_service.get_artifact_signature("catalog.json"),
+            self.artifact_service.get_artifact_signature("run_results.json"),
+            self.settings.validation_severity,
+        )
+
+    def _artifact_fingerprint(self, node: Dict[str, Any], catalog_node: Dict[str, Any]) -> Tuple[Any, ...]:
+        """The manifest and catalog fields the validation rules read for one entity."""
+
+        return (
+            node.get("checksum"),
+            node.get("name"),
+            node.get("resource_type"),
+            node.get("description"),
+            node.get("tags"),
+            (node.get("meta", {}) or {}).get("owner"),
+            [(name, (meta or {}).get("description")) for name, meta in (node.get("columns", {}) or {}).items()],
+            [(name, (meta or {}).get("comment")) for name, meta in (catalog_node.get("columns", {}) or {}).items()],
+        )
+
+    def _validate_entity(
+        self,
+        unique_id: str,
+        node: Dict[str, Any],
+        catalog_node: Dict[str, Any],
+        override: Optional[Dict[str, Any]],
+        test_status: Optional[str],
+        freshness: Optional[catalog_schemas.FreshnessInfo],
+    ) -> List[catalog_schemas.ValidationIssue]:
         issues: List[catalog_schemas.ValidationIssue] = []
         severity_default = self.settings.validation_severity
-        manifest, catalog, run_results = self._load_artifacts()
-        merged_nodes = self._merged_nodes(manifest)
-        test_nodes = self._test_map(manifest)
-        test_statuses = self._test_status_map(run_results)
-        catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+        name = node.get("name") or unique_id
+        entity_type = node.get("resource_type", "unknown")
 
-        for unique_id, node in merged_nodes.items():
-            name = node.get("name") or unique_id
-            description = node.get("description")
-            if not description:
+        if not node.get("description"):
+            issues.append(
+                catalog_schemas.ValidationIssue(
+                    unique_id=unique_id,
+                    entity_name=name,
+                    entity_type=entity_type,
+                    severity=severity_default,
+                    message="Undocumented entity",
+                )
+            )
+
+        if not node.get("tags"):
+            issues.append(
+                catalog_schemas.ValidationIssue(
+                    unique_id=unique_id,
+                    entity_name=name,
+                    entity_type=entity_type,
+                    severity=severity_default,
+                    message="Missing tags",
+                )
+            )
+
+        owner = (node.get("meta", {}) or {}).get("owner") or (override.get("owner") if override else None)
+        if not owner:
+            issues.append(
+                catalog_schemas.ValidationIssue(
+                    unique_id=unique_id,
+                    entity_name=name,
+                    entity_type=entity_type,
+                    severity=severity_default,
+                    message="Missing owner",
+                )
+            )
+
+        if test_status in {"error", "fail"}:
+            issues.append(
+                catalog_schemas.ValidationIssue(
+                    unique_id=unique_id,
+                    entity_name=name,
+                    entity_type=entity_type,
+                    severity="error",
+                    message="Failing tests",
+                )
+            )
+
+        if node.get("resource_type") == "source":
+            if freshness is None or freshness.status is None:
                 issues.append(
                     catalog_schemas.ValidationIssue(
                         unique_id=unique_id,
                         entity_name=name,
-                        entity_type=node.get("resource_type", "unknown"),
+                        entity_type=node.get("resource_type", "source"),
                         severity=severity_default,
-                        message="Undocumented entity",
+                        message="Missing freshness checks",
                     )
                 )
-
-            if not node.get("tags"):
+            elif freshness.status == "late":
                 issues.append(
                     catalog_schemas.ValidationIssue(
                         unique_id=unique_id,
                         entity_name=name,
-                        entity_type=node.get("resource_type", "unknown"),
-                        severity=severity_default,
-                        message="Missing tags",
+                        entity_type=node.get("resource_type", "source"),
+                        severity="error",
+                        message="Stale source",
                     )
                 )
 
-            override = self._entity_override(unique_id)
-            owner = (node.get("meta", {}) or {}).get("owner") or (override.get("owner") if override else None)
-            if not owner:
+        # Column-level validation
+        manifest_columns = node.get("columns", {}) or {}
+        catalog_columns = catalog_node.get("columns", {}) or {}
+        for col_name in sorted(set(manifest_columns.keys()) | set(catalog_columns.keys())):
+            col_meta = manifest_columns.get(col_name, {})
+            description = col_meta.get("description") or catalog_columns.get(col_name, {}).get("comment")
+            if not description:
                 issues.append(
                     catalog_schemas.ValidationIssue(
-                        unique_id=unique_id,
-                        entity_name=name,
-                        entity_type=node.get("resource_type", "unknown"),
+                        unique_id=f"{unique_id}.{col_name}",
+                        entity_name=col_name,
+                        entity_type="column",
                         severity=severity_default,
-                        message="Missing owner",
+                        message="Undocumented column",
                     )
                 )
 
-            test_status, _ = self._test_status_for_entity(unique_id, test_nodes, test_statuses)
             if test_status in {"error", "fail"}:
                 issues.append(
                     catalog_schemas.ValidationIssue(
-                        unique_id=unique_id,
-                        entity_name=name,
-                        entity_type=node.get("resource_type", "unknown"),
+                        unique_id=f"{unique_id}.{col_name}",
+                        entity_name=col_name,
+                        entity_type="column",
                         severity="error",
-                        message="Failing tests",
+                        message="Parent entity has failing tests",
                     )
                 )
 
-            if node.get("resource_type") == "source":
-                catalog_node = catalog_nodes.get(unique_id, {})
-                freshness = self._freshness(catalog_node)
-                if freshness is None or freshness.status is None:
-                    issues.append(
-                        catalog_schemas.ValidationIssue(
-                            unique_id=unique_id,
-                            entity_name=name,
-                            entity_type=node.get("resource_type", "source"),
-                            severity=severity_default,
-                            message="Missing freshness checks",
-                        )
-                    )
-                elif freshness.status == "late":
-                    issues.append(
-                        catalog_schemas.ValidationIssue(
-                            unique_id=unique_id,
-                            entity_name=name,
-                            entity_type=node.get("resource_type", "source"),
-                            severity="error",
-                            message="Stale source",
-                        )
-                    )
+        return issues
+
+    def _current_validation_snapshot(
+        self,
+        signature: Tuple[Any, ...],
+        overrides: Dict[str, Dict[str, Any]],
+    ) -> Optional[_ValidationSnapshot]:
+        """The cached snapshot if nothing validation reads has changed since it was built."""
+
+        with _validation_cache_lock:
+            cached = _validation_cache_by_path.get(str(self.artifact_service.base_path))
+        if cached is None or cached.signature != signature or cached.overrides != overrides:
+            return None
+        freshness = self._cached_freshness_snapshot()
+        if freshness is None or freshness.computed_at != cached.freshness_computed_at:
+            return None
+        return cached
+
+    def _validation_issues_by_entity(self) -> Dict[str, List[catalog_schemas.ValidationIssue]]:
+        """Return validation issues per entity, recomputing only changed entities.
+
+        Results are cached per artifacts directory. While the manifest, catalog,
+        run results, overrides and freshness snapshot are unchanged the cached
+        issues are returned without loading any artifact. Otherwise each
+        entity is re-validated only when its manifest/catalog fields (read
+        again only when an artifact signature changed), override, test status
+        or freshness status differ from the cached run.
+        """
+
+        signature = self._validation_signature()
+        overrides = self._entity_overrides()
+        current = self._current_validation_snapshot(signature, overrides)
+        if current is not None:
+            return current.issues_by_entity
 
-            # Column-level validation
+        cache_key = str(self.artifact_service.base_path)
+        with _validation_cache_lock:
+            previous = _validation_cache_by_path.get(cache_key)
+        artifacts_unchanged = previous is not None and previous.signature == signature
+
+        manifest, catalog, run_results = self._load_artifacts()
+        merged_nodes = self._merged_nodes(manifest)
+        test_statuses = self._test_status_map(run_results)
+        tests_by_entity = self._tests_by_entity(self._test_map(manifest))
+        catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+        freshness_snapshot = self._freshness_snapshot(manifest, catalog)
+        freshness_by_source = freshness_snapshot.by_source
+
+        fingerprints: Dict[str, Tuple[Any, ...]] = {}
+        issues_by_entity: Dict[str, List[catalog_schemas.ValidationIssue]] = {}
+        for unique_id in sorted(merged_nodes):
+            node = merged_nodes[unique_id]
             catalog_node = catalog_nodes.get(unique_id, {})
-            manifest_columns = node.get("columns", {}) or {}
-            catalog_columns = catalog_node.get("columns", {}) or {}
-            for col_name in set(manifest_columns.keys()) | set(catalog_columns.keys()):
-                col_meta = manifest_columns.get(col_name, {})
-                description = col_meta.get("description") or catalog_columns.get(col_name, {}).get("comment")
-                if not description:
-                    issues.append(
-                        catalog_schemas.ValidationIssue(
-                            unique_id=f"{unique_id}.{col_name}",
-                            entity_name=col_name,
-                            entity_type="column",
-                            severity=severity_default,
-                            message="Undocumented column",
-                        )
-                    )
+            override = overrides.get(unique_id)
+            test_status = self._overall_test_status(tests_by_entity.get(unique_id, []), test_statuses)
+            freshness = freshness_by_source.get(unique_id)
+            cached_fingerprint = previous.fingerprints.get(unique_id) if previous is not None else None
+            if artifacts_unchanged and cached_fingerprint is not None:
+                artifact_fingerprint = cached_fingerprint[0]
+            else:
+                artifact_fingerprint = self._artifact_fingerprint(node, catalog_node)
+            fingerprint = (
+                artifact_fingerprint,
+                override.get("owner") if override else None,
+                test_status,
+                freshness.status if freshness else None,
+            )
+            fingerprints[unique_id] = fingerprint
+            if cached_fingerprint == fingerprint:
+                issues_by_entity[unique_id] = previous.issues_by_entity[unique_id]
+                continue
+            issues_by_entity[unique_id] = self._validate_entity(
+                unique_id, node, catalog_node, override, test_status, freshness
+            )
 
-                test_status, _ = self._test_status_for_entity(unique_id, test_nodes, test_statuses)
-                if test_status in {"error", "fail"}:
-                    issues.append(
-                        catalog_schemas.ValidationIssue(
-                            unique_id=f"{unique_id}.{col_name}",
-                            entity_name=col_name,
-                            entity_type="column",
-                            severity="error",
-                            message="Parent entity has failing tests",
-                        )
-                    )
+        snapshot = _ValidationSnapshot(
+            signature=signature,
+            overrides=overrides,
+            freshness_computed_at=freshness_snapshot.computed_at,
+            fingerprints=fingerprints,
+            issues_by_entity=issues_by_entity,
+        )
+        with _validation_cache_lock:
+            _validation_cache_by_path[cache_key] = snapshot
+        return issues_by_entity
 
-        return catalog_schemas.ValidationResponse(issues=issues)
+    def validate(self, offset: int = 0, limit: Optional[int] = None) -> catalog_schemas.ValidationResponse:
+        issues = [
+            issue
+            for entity_issues in self._validation_issues_by_entity().values()
+            for issue in entity_issues
+        ]
+        page = issues[offset : offset + limit] if limit is not None else issues[offset:]
+        return catalog_schemas.ValidationResponse(
+            issues=page,
+            total=len(issues),
+            offset=offset,
+            limit=limit,
+        )
+
+    def validate_entity(self, unique_id: str) -> Optional[catalog_schemas.ValidationResponse]:
+        current = self._current_validation_snapshot(self._validation_signature(), self._entity_overrides())
+        if current is not None:
+            if unique_id not in current.issues_by_entity:
+                return None
+            issues = current.issues_by_entity[unique_id]
+            return catalog_schemas.ValidationResponse(issues=issues, total=len(issues))
 
+        # Only this entity is validated; the project-wide cache is left for validate().
+        manifest, catalog, run_results = self._load_artifacts()
+        node = self._merged_nodes(manifest).get(unique_id)
+        if node is None:
+            return None
+        catalog_nodes = {**catalog.get("nodes", {}), **catalog.get("sources", {})}
+        test_ids = self._tests_by_entity(self._test_map(manifest)).get(unique_id, [])
+        freshness = None
+        if node.get("resource_type") == "source":
+            freshness = self._freshness_snapshot(manifest, catalog).by_source.get(unique_id)
+        issues = self._validate_entity(
+            unique_id,
+            node,
+            catalog_nodes.get(unique_id, {}),
+            self._entity_overrides([unique_id]).get(unique_id),
+            self._overall_test_status(test_ids, self._test_status_map(run_results)),
+            freshness,
+        )
+        return catalog_schemas.ValidationResponse(issues=issues, total=len(issues))
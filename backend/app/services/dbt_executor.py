@@ -6,36 +6,108 @@ import subprocess
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from typing import Dict, List, Optional, Any, AsyncGenerator, Set, Tuple
 import hashlib
+from dataclasses import dataclass
 
 import yaml
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import get_settings
 from app.core.watcher_manager import get_watcher
 from app.database.connection import SessionLocal
 from app.database.models import models as db_models
+from app.services.artifact_store import ArtifactStore
+from app.services.dbt_log_parser import DbtLogRecord, parse_dbt_log_line
+from app.services.execution_backends import ExecutionJob, LocalProcessBackend, create_backend
+from app.services.run_log_buffer import RunLogBuffer
+from app.services.run_log_store import RunLogSlice, RunLogWriter, read_run_log
+from app.services.run_queue import RunQueue
 from app.schemas.execution import (
-    DbtCommand, RunStatus, RunSummary, RunDetail,
+    DbtCommand, RunPriority, RunStatus, RunSummary, RunDetail, RunNodeResult, RunProgress,
     LogMessage, ArtifactInfo, PackagesCheckResponse
 )
 
+# dbt node statuses reported while a node has not finished yet.
+IN_PROGRESS_NODE_STATUSES = {"started", "compiling", "executing"}
+FAILED_NODE_STATUSES = {"error", "fail", "runtime error"}
+
+# Standard dbt artifacts we report metadata for and notify the watcher about.
+STANDARD_ARTIFACT_FILES = (
+    "manifest.json",
+    "run_results.json",
+    "catalog.json",
+    "sources.json",
+    "index.html",  # from docs generate
+)
+
+
+@dataclass(frozen=True)
+class ArtifactCaptureProfile:
+    """What to capture from ``target/`` after a successful command."""
+
+    # Top-level files/directories of target/ to capture; None captures everything.
+    include: Optional[Tuple[str, ...]] = None
+    notify_watcher: bool = True
+    # Report content checksums for the standard artifacts.
+    checksums: bool = True
+
+
+# Commands that get ``--state`` pointing at the workspace's last successful run.
+STATE_AWARE_COMMANDS = {DbtCommand.RUN, DbtCommand.TEST, DbtCommand.SEED}
+PARTIAL_PARSE_FILENAME = "partial_parse.msgpack"
+
+ARTIFACT_CAPTURE_PROFILES: Dict[DbtCommand, Optional[ArtifactCaptureProfile]] = {
+    # Compiled and run SQL plus the full docs site stay available for these.
+    DbtCommand.RUN: ArtifactCaptureProfile(),
+    DbtCommand.DOCS_GENERATE: ArtifactCaptureProfile(),
+    # Tests and seeds only refresh run metadata; compiled/ and run/ are skipped.
+    DbtCommand.TEST: ArtifactCaptureProfile(include=("manifest.json", "run_results.json")),
+    DbtCommand.SEED: ArtifactCaptureProfile(include=("manifest.json", "run_results.json")),
+    # deps only installs packages.
+    DbtCommand.DEPS: None,
+}
+
 
 class DbtExecutor:
     def __init__(self):
         self.settings = get_settings()
-        self.active_runs: Dict[str, subprocess.Popen] = {}
+        self.active_runs: Dict[str, asyncio.subprocess.Process] = {}
         self.run_history: Dict[str, RunDetail] = {}
         self.run_artifacts: Dict[str, str] = {}  # run_id -> artifacts_path
+        self.run_log_writers: Dict[str, RunLogWriter] = {}  # live runs only
+        self.artifact_stores: Dict[str, ArtifactStore] = {}  # artifacts base -> store
+        self.run_queue = RunQueue(
+            self.settings.max_concurrent_runs,
+            self.settings.max_concurrent_runs_per_workspace,
+        )
+        self.backend = create_backend(
+            self.settings.execution_backend,
+            processes=self.active_runs,
+            poll_interval_seconds=self.settings.execution_worker_poll_seconds,
+            heartbeat_timeout_seconds=self.settings.execution_worker_timeout_seconds,
+            claim_timeout_seconds=self.settings.execution_worker_claim_timeout_seconds,
+        )
         
     def generate_run_id(self) -> str:
         """Generate a unique run identifier."""
         return str(uuid.uuid4())
+
+    def active_run_count(self) -> int:
+        """Number of dbt invocations that have not exited yet."""
+        if not isinstance(self.backend, LocalProcessBackend):
+            # Worker-pool runs have no local process; every held slot is a running job.
+            return self.run_queue.running_count
+        return len([p for p in self.active_runs.values() if p.returncode is None])
     
     def _get_dbt_command(self, command: DbtCommand, parameters: Dict[str, Any]) -> List[str]:
         """Build the dbt command with parameters."""
         cmd = ["dbt"]
         cmd.extend(command.value.split())
+
+        # Structured events are parsed into log levels, timings and node results.
+        if self.settings.dbt_json_logs:
+            cmd.extend(["--log-format", "json"])
         
         # Add default profiles directory if not specified
         if "profiles_dir" not in parameters:
@@ -71,6 +143,19 @@ class DbtExecutor:
         
         return cmd
     
+    def _with_state(self, cmd: List[str], state_path: str, modified_only: bool = False) -> List[str]:
+        """Add ``--state``; ``modified_only`` narrows the selection to ``state:modified+``."""
+        cmd = [*cmd, "--state", state_path]
+        if not modified_only:
+            return cmd
+        if "--select" in cmd:
+            index = cmd.index("--select") + 1
+            # Intersect each selected term with the modified nodes and their children.
+            cmd[index] = " ".join(f"state:modified+,{term}" for term in str(cmd[index]).split())
+        else:
+            cmd.extend(["--select", "state:modified+"])
+        return cmd
+
     def _create_artifacts_directory(self, run_id: str, artifacts_base_path: Optional[str] = None) -> str:
         """Create a directory for storing run artifacts."""
         base_path = Path(artifacts_base_path or self.settings.dbt_artifacts_path)
@@ -89,6 +174,12 @@ class DbtExecutor:
         except Exception:
             return ""
     
+    def _artifact_store(self, artifacts_base: Path) -> ArtifactStore:
+        key = str(Path(artifacts_base).resolve())
+        if key not in self.artifact_stores:
+            self.artifact_stores[key] = ArtifactStore.for_artifacts_base(Path(key))
+        return self.artifact_stores[key]
+
     def _capture_artifacts(self, run_id: str) -> List[ArtifactInfo]:
         """Capture dbt artifacts after run completion."""
         artifacts = []
@@ -97,6 +188,14 @@ class DbtExecutor:
             return artifacts
 
         run_detail = self.run_history.get(run_id)
+        profile = (
+            ARTIFACT_CAPTURE_PROFILES.get(run_detail.command, ArtifactCaptureProfile())
+            if run_detail
+            else ArtifactCaptureProfile()
+        )
+        if profile is None:
+            return artifacts
+
         project_root = (
             Path(run_detail.project_path).resolve()
             if run_detail and run_detail.project_path
@@ -116,31 +215,34 @@ class DbtExecutor:
             else Path(self.settings.dbt_artifacts_path)
         )
 
-        # Copy full target directory so the complete docs site (including assets)
-        # is available for the current run and the latest snapshot.
-        destinations = [artifacts_dir_path, artifacts_base]
-        for destination in destinations:
-            shutil.copytree(target_dir, destination, dirs_exist_ok=True)
-
-        # Standard dbt artifacts we want metadata for and to notify the watcher about
-        artifact_files = [
-            "manifest.json",
-            "run_results.json",
-            "catalog.json",
-            "sources.json",
-            "index.html",  # from docs generate
-        ]
-        
-        for filename in artifact_files:
+        # Capture the profile's part of the target directory (by default all of it,
+        # so the complete docs site is available) for the current run and the latest
+        # snapshot. Files are deduplicated by content, so unchanged files cost no I/O.
+        # The run directory is never modified afterwards and shares stored
+        # objects; the latest snapshot is rewritten in place by other writers
+        # (e.g. row lineage syncs), so it gets private copies.
+        stored = self._artifact_store(artifacts_base).capture(
+            target_dir,
+            [artifacts_dir_path],
+            include=profile.include,
+            copy_destinations=[artifacts_base],
+        )
+        digests = {item.relative_path: item.digest for item in stored}
+
+        for filename in STANDARD_ARTIFACT_FILES:
+            if filename not in digests:
+                # Not produced or not captured by this run; an older copy may linger.
+                continue
             copied_file = Path(artifacts_dir) / filename
             if copied_file.exists():
                 # Notify watcher to update cache immediately
-                try:
-                    watcher = get_watcher(str(artifacts_base))
-                    watcher.on_file_changed(filename)
-                except Exception as e:
-                    # Don't fail the run if watcher update fails
-                    print(f"Failed to notify watcher: {e}")
+                if profile.notify_watcher:
+                    try:
+                        watcher = get_watcher(str(artifacts_base))
+                        watcher.on_file_changed(filename)
+                    except Exception as e:
+                        # Don't fail the run if watcher update fails
+                        print(f"Failed to notify watcher: {e}")
 
                 # Create artifact info
                 stat = copied_file.stat()
@@ -148,7 +250,7 @@ class DbtExecutor:
                     filename=filename,
                     size_bytes=stat.st_size,
                     last_modified=datetime.fromtimestamp(stat.st_mtime),
-                    checksum=self._calculate_file_checksum(str(copied_file))
+                    checksum=digests[filename] if profile.checksums else "",
                 ))
         
         return artifacts
@@ -404,6 +506,87 @@ class DbtExecutor:
             return artifacts_dir
         return Path(self.settings.dbt_artifacts_path)
 
+    def _previous_state_dir(self, run_detail: RunDetail) -> Optional[str]:
+        """Captured artifacts of the newest successful run of the same project and workspace."""
+        artifacts_base = self._resolve_artifacts_base(run_detail)
+        candidates = [
+            other
+            for other in self.run_history.values()
+            if other.run_id != run_detail.run_id
+            and other.status == RunStatus.SUCCEEDED
+            and other.project_path == run_detail.project_path
+            and other.artifacts_path
+            and self._resolve_artifacts_base(other) == artifacts_base
+        ]
+        candidates.sort(key=lambda other: other.start_time.timestamp(), reverse=True)
+        for other in candidates:
+            state_dir = Path(self.run_artifacts.get(other.run_id) or other.artifacts_path)
+            if (state_dir / "manifest.json").exists():
+                return str(state_dir)
+        # Runs from before an API restart are only in the database.
+        return self._persisted_state_dir(run_detail, artifacts_base)
+
+    def _persisted_state_dir(self, run_detail: RunDetail, artifacts_base: Path) -> Optional[str]:
+        """Captured artifacts of the newest successful run recorded in the database.
+
+        Run directories under ``<artifacts base>/runs`` hold read-only links
+        to stored objects, so dbt reading them as ``--state`` cannot alter them.
+        """
+        runs_dir = artifacts_base / "runs"
+        if not runs_dir.is_dir():
+            return None
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(db_models.Run.run_id, db_models.Run.summary)
+                .filter(
+                    db_models.Run.status == RunStatus.SUCCEEDED.value,
+                    db_models.Run.run_id != run_detail.run_id,
+                )
+                .order_by(db_models.Run.timestamp.desc())
+                .yield_per(100)
+            )
+            for run_id, summary in rows:
+                project_path = (summary or {}).get("project_path")
+                if project_path and project_path != run_detail.project_path:
+                    continue
+                state_dir = runs_dir / run_id
+                if (state_dir / "manifest.json").exists():
+                    return str(state_dir)
+        except SQLAlchemyError:
+            return None
+        finally:
+            db.close()
+        return None
+
+    def _partial_parse_dir(self, run_detail: RunDetail) -> Path:
+        return self._resolve_artifacts_base(run_detail) / "state"
+
+    def _restore_partial_parse(self, run_detail: RunDetail, cwd: str) -> None:
+        """Seed a checkout without a parse cache from the workspace's saved copy."""
+        if not self.settings.dbt_reuse_partial_parse:
+            return
+        saved = self._partial_parse_dir(run_detail) / PARTIAL_PARSE_FILENAME
+        target = Path(cwd) / "target" / PARTIAL_PARSE_FILENAME
+        if saved.exists() and not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # A copy, not a link: dbt rewrites this file and stored objects are shared.
+            shutil.copyfile(saved, target)
+
+    def _save_partial_parse(self, run_detail: RunDetail, cwd: str) -> None:
+        if not self.settings.dbt_reuse_partial_parse:
+            return
+        target_dir = Path(cwd) / "target"
+        if not (target_dir / PARTIAL_PARSE_FILENAME).exists():
+            return
+        artifacts_base = self._resolve_artifacts_base(run_detail)
+        self._artifact_store(artifacts_base).capture(
+            target_dir,
+            [],
+            include=[PARTIAL_PARSE_FILENAME],
+            copy_destinations=[self._partial_parse_dir(run_detail)],
+        )
+
     def _copy_row_lineage_output(self, export_file: Path, run_detail: RunDetail) -> None:
         """Copy generated lineage mappings into workspace artifacts."""
         if not export_file.exists() or export_file.is_dir():
@@ -582,8 +765,6 @@ class DbtExecutor:
             if line:
                 line = line.rstrip()
                 run_detail.log_lines.append(f"[row-lineage] {line}")
-                if len(run_detail.log_lines) > self.settings.log_buffer_size:
-                    run_detail.log_lines = run_detail.log_lines[-self.settings.log_buffer_size:]
 
         return_code = process.wait()
         if return_code != 0:
@@ -602,48 +783,76 @@ class DbtExecutor:
         project_path: Optional[str] = None,
         run_row_lineage: bool = False,
         artifacts_path: Optional[str] = None,
+        priority: RunPriority = RunPriority.INTERACTIVE,
     ) -> str:
-        """Start a new dbt run."""
+        """Create a queued dbt run; ``execute_run`` waits for a free slot before starting it."""
         run_id = self.generate_run_id()
         
-        # Check concurrent run limit
-        active_count = len([r for r in self.active_runs.values() if r.poll() is None])
-        if active_count >= self.settings.max_concurrent_runs:
-            raise RuntimeError(f"Maximum concurrent runs ({self.settings.max_concurrent_runs}) exceeded")
+        # Bound the queue rather than the number of concurrent runs
+        if self.run_queue.queued_count >= self.settings.max_queued_runs:
+            raise RuntimeError(f"Run queue is full ({self.settings.max_queued_runs} queued runs)")
         
-        # Create run record
+        # Set up the artifacts directory and log file before the run is
+        # enqueued, so a failure here cannot leave an orphaned queue entry.
+        artifacts_dir = self._create_artifacts_directory(run_id, artifacts_base_path=artifacts_path)
+        # Every line goes to the run's log file; memory keeps only the recent tail.
+        writer = RunLogWriter(self._run_log_dir(artifacts_dir))
+
+        # Create run record; start_time is reset when the run leaves the queue.
+        queued_at = datetime.now()
         run_detail = RunDetail(
             run_id=run_id,
             command=command,
             status=RunStatus.QUEUED,
-            start_time=datetime.now(),
+            start_time=queued_at,
+            queued_at=queued_at,
             parameters=parameters,
             description=description,
-            log_lines=[],
             project_path=project_path,
             run_row_lineage=run_row_lineage,
+            priority=priority,
+            artifacts_path=artifacts_dir,
         )
-        
-        self.run_history[run_id] = run_detail
-        
-        # Create artifacts directory
-        artifacts_dir = self._create_artifacts_directory(run_id, artifacts_base_path=artifacts_path)
+        run_detail.log_lines = RunLogBuffer(self.settings.log_buffer_size, sink=writer.write)
         self.run_artifacts[run_id] = artifacts_dir
-        run_detail.artifacts_path = artifacts_dir
+        self.run_log_writers[run_id] = writer
+        self.run_history[run_id] = run_detail
+        # Each workspace has its own artifacts directory, which keys its quota.
+        self.run_queue.enqueue(run_id, priority, artifacts_path or project_path or "")
         
         return run_id
     
     async def execute_run(self, run_id: str) -> None:
-        """Execute the dbt run in a subprocess."""
+        """Execute the dbt run on the configured execution backend.
+
+        Output is read asynchronously and blocking post-run work (row lineage
+        export, artifact capture, persistence) runs in worker threads, so the
+        event loop keeps serving requests while runs are in progress.
+        """
         if run_id not in self.run_history:
             raise ValueError(f"Run {run_id} not found")
         
         run_detail = self.run_history[run_id]
+        if run_detail.status == RunStatus.CANCELLED or not await self.run_queue.acquire(run_id):
+            # Cancelled while waiting in the queue.
+            return
         run_detail.status = RunStatus.RUNNING
+        # Durations and state baselines measure execution, not time spent queued.
+        run_detail.start_time = datetime.now()
         
         try:
-            # Build command
+            # Build command, comparing against the last successful run when possible
+            state_path = None
+            modified_only = bool(run_detail.parameters.get("modified_only"))
+            if run_detail.command in STATE_AWARE_COMMANDS and (self.settings.dbt_auto_state or modified_only):
+                state_path = self._previous_state_dir(run_detail)
+            if modified_only and not state_path:
+                run_detail.log_lines.append(
+                    "[state] No earlier successful run to compare against; running all selected nodes."
+                )
             cmd = self._get_dbt_command(run_detail.command, run_detail.parameters)
+            if state_path:
+                cmd = self._with_state(cmd, state_path, modified_only)
             
             # Determine working directory: prefer run-specific project path, fallback to default
             cwd = run_detail.project_path if run_detail.project_path else self.settings.dbt_project_path
@@ -653,39 +862,15 @@ class DbtExecutor:
             # Clean package-lock.yml for deps command to avoid inconsistent state
             if run_detail.command == DbtCommand.DEPS:
                 self._clean_package_lock(cwd)
+            else:
+                self._restore_partial_parse(run_detail, cwd)
 
-            # Start subprocess
-            process = subprocess.Popen(
-                cmd,
-                cwd=cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+            # Run on the configured backend (local subprocess or worker pool)
+            return_code = await self.backend.execute(
+                ExecutionJob(run_id=run_id, command=cmd, cwd=cwd),
+                lambda line: self._record_output(run_detail, line),
             )
             
-            self.active_runs[run_id] = process
-            
-            # Read output line by line
-            line_number = 0
-            while True:
-                line = process.stdout.readline()
-                if not line and process.poll() is not None:
-                    break
-                
-                if line:
-                    line = line.rstrip()
-                    line_number += 1
-                    run_detail.log_lines.append(line)
-                    
-                    # Limit log buffer size
-                    if len(run_detail.log_lines) > self.settings.log_buffer_size:
-                        run_detail.log_lines = run_detail.log_lines[-self.settings.log_buffer_size:]
-            
-            # Wait for completion
-            return_code = process.wait()
-            
             # Update run status
             run_detail.end_time = datetime.now()
             run_detail.duration_seconds = (
@@ -697,17 +882,22 @@ class DbtExecutor:
                 # Optionally run row-lineage export before capturing artifacts
                 if run_detail.run_row_lineage:
                     try:
-                        self._run_row_lineage(cwd=cwd, parameters=run_detail.parameters, run_detail=run_detail)
+                        await asyncio.to_thread(
+                            self._run_row_lineage,
+                            cwd=cwd,
+                            parameters=run_detail.parameters,
+                            run_detail=run_detail,
+                        )
                     except Exception as exc:
                         run_detail.log_lines.append(
                             f"[row-lineage] Failed to run dbt-rowlineage: {exc}"
                         )
-                        if len(run_detail.log_lines) > self.settings.log_buffer_size:
-                            run_detail.log_lines = run_detail.log_lines[-self.settings.log_buffer_size:]
 
                 # Capture artifacts on success
-                artifacts = self._capture_artifacts(run_id)
+                artifacts = await asyncio.to_thread(self._capture_artifacts, run_id)
                 run_detail.artifacts_available = len(artifacts) > 0
+                if run_detail.command != DbtCommand.DEPS:
+                    await asyncio.to_thread(self._save_partial_parse, run_detail, cwd)
             else:
                 run_detail.status = RunStatus.FAILED
                 run_detail.error_message = f"dbt command failed with exit code {return_code}"
@@ -728,73 +918,195 @@ class DbtExecutor:
 
         finally:
             # Persist run summary to database run history
-            try:
-                db = SessionLocal()
-                db_run = db.query(db_models.Run).filter(db_models.Run.run_id == run_id).first()
-                if not db_run:
-                    db_run = db_models.Run(
-                        run_id=run_id,
-                        command=run_detail.command.value,
-                        timestamp=run_detail.start_time,
-                        status=run_detail.status.value,
-                        summary={
-                            "description": run_detail.description,
-                            "error_message": run_detail.error_message,
-                            "duration_seconds": run_detail.duration_seconds,
-                            "artifacts_available": run_detail.artifacts_available,
-                            "run_row_lineage": run_detail.run_row_lineage,
-                        },
-                    )
-                else:
-                    db_run.status = run_detail.status.value
-                    db_run.timestamp = run_detail.start_time
-                    db_run.summary = {
+            await asyncio.to_thread(self._persist_run, run_detail)
+            self._log_buffer(run_detail).close()
+            writer = self.run_log_writers.pop(run_id, None)
+            if writer is not None:
+                await asyncio.to_thread(writer.close, self.settings.run_log_compress)
+
+            # Clean up
+            if run_id in self.active_runs:
+                del self.active_runs[run_id]
+            self.run_queue.release(run_id)
+    
+    def _persist_run(self, run_detail: RunDetail) -> None:
+        """Store the run summary in the database run history.
+
+        The full log lives on disk under ``log_path``; ``runs.logs`` only keeps
+        the in-memory tail for runs that have no log file.
+        """
+        log_path = self._run_log_path(run_detail)
+        try:
+            db = SessionLocal()
+            db_run = db.query(db_models.Run).filter(db_models.Run.run_id == run_detail.run_id).first()
+            if not db_run:
+                db_run = db_models.Run(
+                    run_id=run_detail.run_id,
+                    command=run_detail.command.value,
+                    timestamp=run_detail.start_time,
+                    status=run_detail.status.value,
+                    summary={
                         "description": run_detail.description,
                         "error_message": run_detail.error_message,
                         "duration_seconds": run_detail.duration_seconds,
                         "artifacts_available": run_detail.artifacts_available,
                         "run_row_lineage": run_detail.run_row_lineage,
-                    }
-                    db_run.logs = run_detail.log_lines
-                db.add(db_run)
-                db.commit()
-            except Exception:
-                # Database persistence failures must not affect run execution lifecycle
-                pass
+                        "log_path": log_path,
+                        "progress": run_detail.progress.model_dump() if run_detail.progress else None,
+                        "priority": run_detail.priority.value,
+                        "project_path": run_detail.project_path,
+                    },
+                )
+            else:
+                db_run.status = run_detail.status.value
+                db_run.timestamp = run_detail.start_time
+                db_run.summary = {
+                    "description": run_detail.description,
+                    "error_message": run_detail.error_message,
+                    "duration_seconds": run_detail.duration_seconds,
+                    "artifacts_available": run_detail.artifacts_available,
+                    "run_row_lineage": run_detail.run_row_lineage,
+                    "log_path": log_path,
+                    "progress": run_detail.progress.model_dump() if run_detail.progress else None,
+                    "priority": run_detail.priority.value,
+                    "project_path": run_detail.project_path,
+                }
+            db_run.logs = None if log_path else list(run_detail.log_lines)
+            db.add(db_run)
+            db.commit()
+        except Exception:
+            # Database persistence failures must not affect run execution lifecycle
+            pass
+        finally:
+            if 'db' in locals():
+                db.close()
+
+    def _record_output(self, run_detail: RunDetail, line: str) -> None:
+        """Parse one line of dbt output, update node progress and append it to the run log."""
+        record = parse_dbt_log_line(line)
+        if record.node_id:
+            node = run_detail.node_results.get(record.node_id)
+            if node is None:
+                node = RunNodeResult(unique_id=record.node_id)
+                run_detail.node_results[record.node_id] = node
+            if record.node_status:
+                node.status = record.node_status
+            node.started_at = record.node_started_at or node.started_at
+            node.finished_at = record.node_finished_at or node.finished_at
+            if record.execution_time is not None:
+                node.execution_time = record.execution_time
+            if record.level == "ERROR" and record.message:
+                node.message = record.message
+
+            progress = run_detail.progress or RunProgress()
+            statuses = [n.status for n in run_detail.node_results.values()]
+            progress.completed = len([s for s in statuses if s and s not in IN_PROGRESS_NODE_STATUSES])
+            progress.failed = len([s for s in statuses if s in FAILED_NODE_STATUSES])
+            if record.total is not None:
+                progress.total = record.total
+            run_detail.progress = progress
+
+        run_detail.log_lines.append(record.message, record)
+
+    @staticmethod
+    def _run_log_dir(artifacts_dir: str) -> Path:
+        return Path(artifacts_dir) / "logs"
+
+    def _run_log_path(self, run_detail: RunDetail) -> Optional[str]:
+        if not run_detail.artifacts_path:
+            return None
+        return str(self._run_log_dir(run_detail.artifacts_path))
+
+    def read_run_log(
+        self,
+        run_id: str,
+        start: int = 0,
+        limit: int = 1000,
+        tail: Optional[int] = None,
+    ) -> Optional[RunLogSlice]:
+        """Read a line range (0-based ``start``) or the last ``tail`` lines of a run's full log."""
+        writer = self.run_log_writers.get(run_id)
+        if writer is not None:
+            return writer.read(start, limit, tail)
+
+        log_dir: Optional[str] = None
+        if run_id in self.run_history and self.run_history[run_id].artifacts_path:
+            log_dir = self._run_log_path(self.run_history[run_id])
+        else:
+            try:
+                db = SessionLocal()
+                run = db.query(db_models.Run).filter(db_models.Run.run_id == run_id).first()
+                if run:
+                    log_dir = (run.summary or {}).get("log_path")
+            except Exception as e:
+                print(f"Error fetching run log path: {e}")
             finally:
                 if 'db' in locals():
                     db.close()
+        if not log_dir:
+            return None
+        return read_run_log(Path(log_dir), start, limit, tail)
 
-            # Clean up
-            if run_id in self.active_runs:
-                del self.active_runs[run_id]
-    
-    async def stream_logs(self, run_id: str) -> AsyncGenerator[LogMessage, None]:
-        """Stream logs for a running dbt command."""
+    def _log_buffer(self, run_detail: RunDetail) -> RunLogBuffer:
+        """Return the run's log buffer, wrapping a plain list of lines when needed."""
+        if not isinstance(run_detail.log_lines, RunLogBuffer):
+            buffer = RunLogBuffer(self.settings.log_buffer_size, run_detail.log_lines)
+            if run_detail.status in [RunStatus.SUCCEEDED, RunStatus.FAILED, RunStatus.CANCELLED]:
+                buffer.close()
+            run_detail.log_lines = buffer
+        return run_detail.log_lines
+
+    async def stream_logs(
+        self,
+        run_id: str,
+        after: int = 0,
+        levels: Optional[Set[str]] = None,
+        node_id: Optional[str] = None,
+    ) -> AsyncGenerator[LogMessage, None]:
+        """Stream logs for a running dbt command.
+
+        Subscribers sleep until new lines are appended instead of polling.
+        ``after`` is the last line number the client received (e.g. from an
+        SSE ``Last-Event-ID``); only newer lines are sent. ``levels`` and
+        ``node_id`` filter lines server-side; the terminal message is always sent.
+        """
         if run_id not in self.run_history:
             raise ValueError(f"Run {run_id} not found")
         
         run_detail = self.run_history[run_id]
-        last_line = 0
-        emitted_final = False
+        buffer = self._log_buffer(run_detail)
+        last_line = max(0, after)
+        wanted_levels = {level.upper() for level in levels} if levels else None
 
         while True:
-            # Yield new log lines
-            current_lines = len(run_detail.log_lines)
-            if current_lines > last_line:
-                for i in range(last_line, current_lines):
-                    yield LogMessage(
-                        run_id=run_id,
-                        timestamp=datetime.now(),
-                        level="INFO",
-                        message=run_detail.log_lines[i],
-                        line_number=i + 1
-                    )
-                last_line = current_lines
+            for line_number, message, record in buffer.entries_since(last_line):
+                last_line = line_number
+                if not isinstance(record, DbtLogRecord):
+                    record = DbtLogRecord(message=message)
+                if wanted_levels is not None and record.level not in wanted_levels:
+                    continue
+                if node_id is not None and record.node_id != node_id:
+                    continue
+                yield LogMessage(
+                    run_id=run_id,
+                    timestamp=record.timestamp or datetime.now(),
+                    level=record.level,
+                    message=message,
+                    line_number=line_number,
+                    event_name=record.event_name,
+                    node_id=record.node_id,
+                    node_status=record.node_status,
+                    execution_time=record.execution_time,
+                )
 
-            # Check if run is complete
-            if run_detail.status in [RunStatus.SUCCEEDED, RunStatus.FAILED, RunStatus.CANCELLED]:
-                if not emitted_final and last_line == current_lines:
+            finished = buffer.closed or (
+                run_detail.status in [RunStatus.SUCCEEDED, RunStatus.FAILED, RunStatus.CANCELLED]
+                and run_id not in self.active_runs
+            )
+            if finished and buffer.last_seq <= last_line:
+                # The terminal message takes the line number after the last log
+                # line; a client resuming past it has already received it.
+                if last_line == buffer.last_seq:
                     message = run_detail.error_message or f"Run finished with status {run_detail.status.value}"
                     level = "ERROR" if run_detail.error_message else "INFO"
                     yield LogMessage(
@@ -802,13 +1114,12 @@ class DbtExecutor:
                         timestamp=datetime.now(),
                         level=level,
                         message=message,
-                        line_number=last_line + 1,
+                        line_number=buffer.last_seq + 1,
                     )
-                    emitted_final = True
                 break
 
-            # Wait before checking again
-            await asyncio.sleep(0.1)
+            # Wake on the next append; the timeout re-checks runs finished outside execute_run.
+            await buffer.wait_for(last_line, timeout=1.0)
     
     def get_run_status(self, run_id: str) -> Optional[RunSummary]:
         """Get the current status of a run."""
@@ -823,7 +1134,11 @@ class DbtExecutor:
                 duration_seconds=run_detail.duration_seconds,
                 description=run_detail.description,
                 error_message=run_detail.error_message,
-                artifacts_available=run_detail.artifacts_available
+                artifacts_available=run_detail.artifacts_available,
+                progress=run_detail.progress,
+                priority=run_detail.priority,
+                queue_position=self.run_queue.position(run_id),
+                queued_at=run_detail.queued_at,
             )
             
         # Fallback to DB
@@ -841,7 +1156,9 @@ class DbtExecutor:
                     duration_seconds=summary.get("duration_seconds"),
                     description=summary.get("description"),
                     error_message=summary.get("error_message"),
-                    artifacts_available=summary.get("artifacts_available", False)
+                    artifacts_available=summary.get("artifacts_available", False),
+                    progress=summary.get("progress"),
+                    priority=summary.get("priority") or RunPriority.INTERACTIVE,
                 )
             return None
         except Exception as e:
@@ -873,8 +1190,10 @@ class DbtExecutor:
                     description=summary.get("description"),
                     error_message=summary.get("error_message"),
                     artifacts_available=summary.get("artifacts_available", False),
+                    progress=summary.get("progress"),
+                    priority=summary.get("priority") or RunPriority.INTERACTIVE,
                     parameters={},
-                    log_lines=run.logs or [],
+                    log_lines=run.logs or self._stored_log_tail(summary.get("log_path")),
                     artifacts_path=None,
                     run_row_lineage=summary.get("run_row_lineage", False),
                 )
@@ -886,6 +1205,12 @@ class DbtExecutor:
             if 'db' in locals():
                 db.close()
     
+    def _stored_log_tail(self, log_path: Optional[str]) -> List[str]:
+        if not log_path:
+            return []
+        stored = read_run_log(Path(log_path), tail=self.settings.log_buffer_size)
+        return stored.lines if stored else []
+
     def get_run_history(self, page: int = 1, page_size: int = 20) -> List[RunSummary]:
         """Get paginated run history from database."""
         try:
@@ -909,7 +1234,9 @@ class DbtExecutor:
                     duration_seconds=summary.get("duration_seconds"),
                     description=summary.get("description"),
                     error_message=summary.get("error_message"),
-                    artifacts_available=summary.get("artifacts_available", False)
+                    artifacts_available=summary.get("artifacts_available", False),
+                    progress=summary.get("progress"),
+                    priority=summary.get("priority") or RunPriority.INTERACTIVE,
                 ))
             return history
         except Exception as e:
@@ -952,40 +1279,58 @@ class DbtExecutor:
         return artifacts
     
     def cancel_run(self, run_id: str) -> bool:
-        """Cancel a running dbt command."""
-        if run_id in self.active_runs:
-            process = self.active_runs[run_id]
-            if process.poll() is None:  # Still running
-                process.terminate()
-                if run_id in self.run_history:
-                    self.run_history[run_id].status = RunStatus.CANCELLED
-                    self.run_history[run_id].end_time = datetime.now()
-                return True
+        """Cancel a queued or running dbt command."""
+        if self.run_queue.remove(run_id):
+            run_detail = self.run_history.get(run_id)
+            if run_detail is not None:
+                run_detail.status = RunStatus.CANCELLED
+                run_detail.end_time = datetime.now()
+                self._log_buffer(run_detail).close()
+                self._persist_run(run_detail)
+            writer = self.run_log_writers.pop(run_id, None)
+            if writer is not None:
+                writer.close(self.settings.run_log_compress)
+            return True
+        if self.backend.cancel(run_id):
+            if run_id in self.run_history:
+                self.run_history[run_id].status = RunStatus.CANCELLED
+                self.run_history[run_id].end_time = datetime.now()
+            return True
         return False
     
     def cleanup_old_runs(self) -> None:
         """Clean up old runs to maintain limits."""
         # Clean up run history
         if len(self.run_history) > self.settings.max_run_history:
-            runs = list(self.run_history.items())
+            # Queued and running runs are still needed by execute_run.
+            runs = [
+                (run_id, run_detail)
+                for run_id, run_detail in self.run_history.items()
+                if run_detail.status not in (RunStatus.QUEUED, RunStatus.RUNNING)
+            ]
             runs.sort(key=lambda x: x[1].start_time)
             
             # Remove oldest runs
-            to_remove = len(runs) - self.settings.max_run_history
+            to_remove = min(len(runs), len(self.run_history) - self.settings.max_run_history)
             for i in range(to_remove):
                 run_id, _ = runs[i]
                 del self.run_history[run_id]
         
         # Clean up artifact sets
         if len(self.run_artifacts) > self.settings.max_artifact_sets:
-            artifacts = list(self.run_artifacts.items())
+            active = {
+                run_id
+                for run_id, run_detail in self.run_history.items()
+                if run_detail.status in (RunStatus.QUEUED, RunStatus.RUNNING)
+            }
+            artifacts = [item for item in self.run_artifacts.items() if item[0] not in active]
             # Sort by run start time (from run_history)
-            artifacts.sort(key=lambda x: self.run_history.get(x[0], RunDetail(
-                run_id=x[0], command=DbtCommand.RUN, status=RunStatus.FAILED, start_time=datetime.min
-            )).start_time)
+            artifacts.sort(
+                key=lambda x: self.run_history[x[0]].start_time if x[0] in self.run_history else datetime.min
+            )
             
             # Remove oldest artifact sets
-            to_remove = len(artifacts) - self.settings.max_artifact_sets
+            to_remove = min(len(artifacts), len(self.run_artifacts) - self.settings.max_artifact_sets)
             for i in range(to_remove):
                 run_id, artifacts_path = artifacts[i]
                 # Remove directory
@@ -993,6 +1338,10 @@ class DbtExecutor:
                     shutil.rmtree(artifacts_path, ignore_errors=True)
                 del self.run_artifacts[run_id]
 
+            # Drop stored artifact content no remaining run directory links to.
+            for store in self.artifact_stores.values():
+                store.prune()
+
 
 # Global executor instance
 executor = DbtExecutor()
@@ -0,0 +1,105 @@
+"""Parse dbt's ``--log-format json`` output into structured records.
+
+Each stdout line of a dbt invocation run with JSON logging is one event::
+
+    {"info": {"name": "LogModelResult", "level": "info", "msg": "...", "ts": "..."},
+     "data": {"node_info": {"unique_id": "model.x.y", "node_status": "success", ...},
+              "execution_time": 0.42, "index": 1, "total": 3}}
+
+Lines that are not JSON events (output printed before dbt's logger starts,
+or from other tools) are passed through as plain INFO records.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+
+@dataclass
+class DbtLogRecord:
+    message: str
+    level: str = "INFO"
+    timestamp: Optional[datetime] = None
+    event_name: Optional[str] = None
+    node_id: Optional[str] = None
+    node_status: Optional[str] = None
+    node_started_at: Optional[datetime] = None
+    node_finished_at: Optional[datetime] = None
+    execution_time: Optional[float] = None
+    index: Optional[int] = None
+    total: Optional[int] = None
+    structured: bool = False
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_dbt_log_line(line: str) -> DbtLogRecord:
+    """Return the structured record for one output line."""
+
+    stripped = line.strip()
+    if not stripped.startswith("{"):
+        return DbtLogRecord(message=line)
+    try:
+        event = json.loads(stripped)
+    except ValueError:
+        return DbtLogRecord(message=line)
+    if not isinstance(event, dict):
+        return DbtLogRecord(message=line)
+
+    # dbt >= 1.5 nests metadata under "info"; older versions keep it at the top level.
+    info = event.get("info") if isinstance(event.get("info"), dict) else event
+    data = event.get("data") if isinstance(event.get("data"), dict) else {}
+    if "msg" not in info and "level" not in info:
+        return DbtLogRecord(message=line)
+
+    node_info = data.get("node_info") or event.get("node_info") or {}
+    if not isinstance(node_info, dict):
+        node_info = {}
+    run_result = data.get("run_result") if isinstance(data.get("run_result"), dict) else {}
+
+    execution_time = _as_float(data.get("execution_time"))
+    if execution_time is None:
+        execution_time = _as_float(run_result.get("execution_time"))
+
+    level = str(info.get("level") or "info").upper()
+    if level == "WARNING":
+        level = "WARN"
+
+    return DbtLogRecord(
+        message=str(info.get("msg") or ""),
+        level=level,
+        timestamp=_parse_timestamp(info.get("ts")),
+        event_name=info.get("name") or info.get("code"),
+        node_id=node_info.get("unique_id") or None,
+        node_status=node_info.get("node_status") or data.get("status") or None,
+        node_started_at=_parse_timestamp(node_info.get("node_started_at")),
+        node_finished_at=_parse_timestamp(node_info.get("node_finished_at")),
+        execution_time=execution_time,
+        index=_as_int(data.get("index")),
+        total=_as_int(data.get("total")),
+        structured=True,
+    )
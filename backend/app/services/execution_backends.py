@@ -0,0 +1,447 @@
+"""Where dbt invocations run: in the API process or on a pool of workers.
+
+``DbtExecutor`` builds the command line and handles logs, artifacts and run
+history; an :class:`ExecutionBackend` only starts the command, forwards its
+output line by line and reports the exit code.
+
+* :class:`LocalProcessBackend` runs dbt as a child of the API process.
+* :class:`DbtRunnerBackend` invokes dbt in-process through its programmatic
+  ``dbtRunner`` API, reusing a parsed manifest between runs, and falls back to
+  the CLI when dbt is not importable.
+* :class:`WorkerPoolBackend` inserts the command into the ``execution_jobs``
+  table. Execution workers (``python -m app.services.execution_worker``), on
+  this or other machines, claim jobs, heartbeat while they run, and write
+  output lines and the standard dbt artifacts back to the database, where
+  the backend picks them up. A job's log and artifact rows are deleted once
+  the backend has forwarded them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+
+from app.database.connection import SessionLocal
+from app.database.models import models as db_models
+
+# Bytes read from a subprocess pipe per call; lines may span several reads.
+STREAM_READ_CHUNK_SIZE = 64 * 1024
+
+# Files from ``target/`` that workers report back with a finished job.
+REPORTED_ARTIFACT_FILES = [
+    "manifest.json",
+    "run_results.json",
+    "catalog.json",
+    "sources.json",
+    "index.html",
+]
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_JOB_STATUSES = {JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED}
+
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp, matching how DateTime columns are stored."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def read_stream_lines(stream: asyncio.StreamReader) -> AsyncIterator[str]:
+    """Yield decoded lines from ``stream`` without blocking the event loop.
+
+    Reads fixed-size chunks instead of ``readline`` so arbitrarily long lines
+    (dbt JSON log events, compiled SQL) never hit the reader's buffer limit.
+    """
+    pending = b""
+    while True:
+        chunk = await stream.read(STREAM_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip()
+    if pending:
+        yield pending.decode("utf-8", errors="replace").rstrip()
+
+
+@dataclass
+class ExecutionJob:
+    run_id: str
+    command: List[str]
+    cwd: str
+
+
+class ExecutionBackend(ABC):
+    name: str = ""
+
+    @abstractmethod
+    async def execute(self, job: ExecutionJob, on_output: Callable[[str], None]) -> int:
+        """Run ``job`` to completion, passing each output line to ``on_output``; return the exit code."""
+
+    @abstractmethod
+    def cancel(self, run_id: str) -> bool:
+        """Ask a running job to stop; return ``False`` when it is not running."""
+
+
+class LocalProcessBackend(ExecutionBackend):
+    name = "local"
+
+    def __init__(self, processes: Optional[Dict[str, asyncio.subprocess.Process]] = None):
+        # Shared with DbtExecutor.active_runs so existing run accounting keeps working.
+        self.processes = processes if processes is not None else {}
+
+    async def execute(self, job: ExecutionJob, on_output: Callable[[str], None]) -> int:
+        process = await asyncio.create_subprocess_exec(
+            *job.command,
+            cwd=job.cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        self.processes[job.run_id] = process
+        async for line in read_stream_lines(process.stdout):
+            on_output(line)
+        return await process.wait()
+
+    def cancel(self, run_id: str) -> bool:
+        process = self.processes.get(run_id)
+        if process is None or process.returncode is not None:
+            return False
+        process.terminate()
+        return True
+
+
+# Flags that change how a project parses; part of the cached manifest's key.
+PARSE_FLAGS = ("--profiles-dir", "--profile", "--target", "--vars")
+# Commands that always run through the CLI (deps rewrites installed packages).
+CLI_ONLY_COMMANDS = {"deps"}
+# Directories dbt writes to; changes there do not invalidate a parsed manifest.
+BUILD_OUTPUT_DIRS = {"target", "logs", "dbt_packages"}
+
+
+def _load_dbt_runner() -> Optional[Tuple[Callable[..., Any], Callable[[Any], str]]]:
+    """``(dbtRunner, msg_to_json)`` when dbt is importable in this interpreter."""
+    try:
+        from dbt.cli.main import dbtRunner
+        from dbt_common.events.functions import msg_to_json
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return dbtRunner, msg_to_json
+
+
+def _is_build_output(path: Path, cwd: str) -> bool:
+    try:
+        relative = path.resolve().relative_to(Path(cwd).resolve())
+    except ValueError:
+        return False
+    return bool(relative.parts) and relative.parts[0] in BUILD_OUTPUT_DIRS
+
+
+def _project_fingerprint(cwd: str, args: List[str]) -> Optional[Tuple[Any, ...]]:
+    """Git state of the project (HEAD plus dirty files) and the profiles file.
+
+    ``None`` when the project is not a git checkout; its manifest is then
+    never cached.
+    """
+    try:
+        from git import Repo
+
+        repo = Repo(cwd, search_parent_directories=True)
+        head = repo.head.commit.hexsha
+        dirty = []
+        for entry in repo.git.status("--porcelain", "--untracked-files=all").splitlines():
+            path = Path(repo.working_tree_dir) / entry[3:].split(" -> ")[-1].strip('"')
+            if _is_build_output(path, cwd):
+                continue
+            dirty.append((str(path), path.stat().st_mtime_ns if path.exists() else None))
+    except Exception:
+        return None
+    profiles_mtime = None
+    if "--profiles-dir" in args:
+        profiles_file = Path(args[args.index("--profiles-dir") + 1]) / "profiles.yml"
+        profiles_mtime = profiles_file.stat().st_mtime_ns if profiles_file.exists() else None
+    return head, tuple(sorted(dirty, key=lambda item: item[0])), profiles_mtime
+
+
+class DbtRunnerBackend(ExecutionBackend):
+    """Run dbt inside the API process, skipping interpreter start-up and re-parsing.
+
+    The parsed manifest of each project (per profile/target/vars) is cached and
+    passed to later invocations until the project's git state changes. dbt keeps
+    global state, so in-process invocations run one at a time; in-process runs
+    cannot be cancelled.
+    """
+
+    name = "dbt_runner"
+
+    def __init__(
+        self,
+        fallback: ExecutionBackend,
+        runner_factory: Optional[Callable[..., Any]] = None,
+        event_to_line: Optional[Callable[[Any], str]] = None,
+    ):
+        self.fallback = fallback
+        if runner_factory is None:
+            loaded = _load_dbt_runner()
+            if loaded is not None:
+                runner_factory, event_to_line = loaded
+        self.runner_factory = runner_factory
+        self.event_to_line = event_to_line or str
+        self._manifests: Dict[Tuple[str, Tuple[str, ...]], Tuple[Tuple[Any, ...], Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._invoke_lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return self.runner_factory is not None
+
+    def invalidate(self, cwd: Optional[str] = None) -> None:
+        """Forget cached manifests (of one project, or all of them)."""
+        with self._cache_lock:
+            for key in list(self._manifests):
+                if cwd is None or key[0] == cwd:
+                    del self._manifests[key]
+
+    @staticmethod
+    def _parse_args(command: List[str]) -> Tuple[str, ...]:
+        flags: List[str] = []
+        for index, arg in enumerate(command):
+            if arg in PARSE_FLAGS and index + 1 < len(command):
+                flags.extend([arg, command[index + 1]])
+        return tuple(flags)
+
+    def _manifest(self, job: ExecutionJob, emit: Callable[[Any], None]) -> Any:
+        parse_flags = self._parse_args(job.command)
+        fingerprint = _project_fingerprint(job.cwd, list(parse_flags))
+        if fingerprint is None:
+            return None
+        key = (job.cwd, parse_flags)
+        with self._cache_lock:
+            cached = self._manifests.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        result = self.runner_factory(callbacks=[emit]).invoke(
+            ["parse", "--project-dir", job.cwd, "--log-level", "none", *parse_flags]
+        )
+        with self._cache_lock:
+            if not result.success or result.result is None:
+                self._manifests.pop(key, None)
+                return None
+            self._manifests[key] = (fingerprint, result.result)
+        return result.result
+
+    def _invoke(self, job: ExecutionJob, emit: Callable[[Any], None]) -> int:
+        with self._invoke_lock:
+            manifest = self._manifest(job, emit)
+            args = [*job.command[1:], "--project-dir", job.cwd, "--log-level", "none"]
+            result = self.runner_factory(manifest=manifest, callbacks=[emit]).invoke(args)
+        if result.exception is not None:
+            emit(f"dbt invocation failed: {result.exception}")
+            return 2
+        return 0 if result.success else 1
+
+    async def execute(self, job: ExecutionJob, on_output: Callable[[str], None]) -> int:
+        subcommand = job.command[1] if len(job.command) > 1 else ""
+        if not self.available or job.command[:1] != ["dbt"] or subcommand in CLI_ONLY_COMMANDS:
+            try:
+                return await self.fallback.execute(job, on_output)
+            finally:
+                if subcommand in CLI_ONLY_COMMANDS:
+                    self.invalidate(job.cwd)
+
+        loop = asyncio.get_running_loop()
+        show_debug = "--debug" in job.command
+
+        def emit(event: Any) -> None:
+            # Called on the dbt thread; lines are handed to the loop in order.
+            if isinstance(event, str):
+                line = event
+            else:
+                if not show_debug and getattr(getattr(event, "info", None), "level", "") == "debug":
+                    return
+                line = self.event_to_line(event)
+            loop.call_soon_threadsafe(on_output, line)
+
+        return await asyncio.to_thread(self._invoke, job, emit)
+
+    def cancel(self, run_id: str) -> bool:
+        return self.fallback.cancel(run_id)
+
+
+class WorkerPoolBackend(ExecutionBackend):
+    """Queue jobs in the database and follow them while a worker runs them."""
+
+    name = "worker_pool"
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        poll_interval_seconds: float = 0.5,
+        heartbeat_timeout_seconds: float = 60.0,
+        claim_timeout_seconds: float = 300.0,
+    ):
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+        self.heartbeat_timeout_seconds = heartbeat_timeout_seconds
+        self.claim_timeout_seconds = claim_timeout_seconds
+
+    def _submit(self, job: ExecutionJob) -> int:
+        db = self.session_factory()
+        try:
+            row = db_models.ExecutionJob(
+                run_id=job.run_id,
+                command=list(job.command),
+                cwd=job.cwd,
+                status=JOB_QUEUED,
+                created_at=utcnow(),
+            )
+            db.add(row)
+            db.commit()
+            return row.id
+        finally:
+            db.close()
+
+    def _poll(self, job_id: int, after_seq: int) -> Tuple[List[Tuple[int, str]], Optional[db_models.ExecutionJob]]:
+        """New output lines after ``after_seq`` and the job row once it has finished."""
+        db = self.session_factory()
+        try:
+            # Read the status first so lines written before a job finished are never missed.
+            row = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).first()
+            lines = (
+                db.query(db_models.ExecutionJobLog.seq, db_models.ExecutionJobLog.line)
+                .filter(db_models.ExecutionJobLog.job_id == job_id, db_models.ExecutionJobLog.seq > after_seq)
+                .order_by(db_models.ExecutionJobLog.seq)
+                .all()
+            )
+            if row is not None and row.status not in FINISHED_JOB_STATUSES:
+                stale_before = utcnow() - timedelta(seconds=self.heartbeat_timeout_seconds)
+                unclaimed_before = utcnow() - timedelta(seconds=self.claim_timeout_seconds)
+                if row.status == JOB_RUNNING and row.heartbeat_at is not None and row.heartbeat_at < stale_before:
+                    row.status = JOB_FAILED
+                    row.error_message = f"Execution worker {row.worker_id} stopped sending heartbeats"
+                    row.finished_at = utcnow()
+                    db.add(row)
+                    db.commit()
+                    db.refresh(row)
+                elif row.status == JOB_QUEUED and row.created_at is not None and row.created_at < unclaimed_before:
+                    # Conditional like a worker's claim, so a job claimed meanwhile is left running.
+                    result = db.execute(
+                        update(db_models.ExecutionJob)
+                        .where(db_models.ExecutionJob.id == job_id, db_models.ExecutionJob.status == JOB_QUEUED)
+                        .values(
+                            status=JOB_FAILED,
+                            error_message=(
+                                f"No execution worker claimed the job within {self.claim_timeout_seconds:g} seconds"
+                            ),
+                            finished_at=utcnow(),
+                        )
+                    )
+                    db.commit()
+                    if result.rowcount == 1:
+                        db.refresh(row)
+                    else:
+                        row = None
+                else:
+                    row = None
+            if row is not None:
+                db.expunge(row)
+            return [(seq, line) for seq, line in lines], row
+        finally:
+            db.close()
+
+    def _materialize_artifacts(self, job_id: int, cwd: str) -> None:
+        """Write the artifacts a worker reported into the project's target directory."""
+        db = self.session_factory()
+        try:
+            artifacts = (
+                db.query(db_models.ExecutionJobArtifact)
+                .filter(db_models.ExecutionJobArtifact.job_id == job_id)
+                .all()
+            )
+            if not artifacts:
+                return
+            target_dir = Path(cwd) / "target"
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for artifact in artifacts:
+                (target_dir / Path(artifact.filename).name).write_bytes(artifact.content)
+        finally:
+            db.close()
+
+    def _release(self, job_id: int) -> None:
+        """Delete a finished job's output and artifact rows once they have been forwarded."""
+        db = self.session_factory()
+        try:
+            db.query(db_models.ExecutionJobLog).filter(db_models.ExecutionJobLog.job_id == job_id).delete(
+                synchronize_session=False
+            )
+            db.query(db_models.ExecutionJobArtifact).filter(
+                db_models.ExecutionJobArtifact.job_id == job_id
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    async def execute(self, job: ExecutionJob, on_output: Callable[[str], None]) -> int:
+        job_id = await asyncio.to_thread(self._submit, job)
+        last_seq = 0
+        while True:
+            lines, finished = await asyncio.to_thread(self._poll, job_id, last_seq)
+            for seq, line in lines:
+                on_output(line)
+                last_seq = seq
+            if finished is not None:
+                if finished.error_message:
+                    on_output(finished.error_message)
+                if finished.status == JOB_SUCCEEDED:
+                    await asyncio.to_thread(self._materialize_artifacts, job_id, job.cwd)
+                await asyncio.to_thread(self._release, job_id)
+                if finished.exit_code is not None:
+                    return finished.exit_code
+                return 0 if finished.status == JOB_SUCCEEDED else 1
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    def cancel(self, run_id: str) -> bool:
+        db = self.session_factory()
+        try:
+            row = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.run_id == run_id).first()
+            if row is None or row.status in FINISHED_JOB_STATUSES:
+                return False
+            if row.status == JOB_QUEUED:
+                row.status = JOB_CANCELLED
+                row.finished_at = utcnow()
+            row.cancel_requested = True
+            db.add(row)
+            db.commit()
+            return True
+        finally:
+            db.close()
+
+
+def create_backend(
+    name: str,
+    processes: Optional[Dict[str, asyncio.subprocess.Process]] = None,
+    poll_interval_seconds: float = 0.5,
+    heartbeat_timeout_seconds: float = 60.0,
+    claim_timeout_seconds: float = 300.0,
+) -> ExecutionBackend:
+    if name == DbtRunnerBackend.name:
+        return DbtRunnerBackend(LocalProcessBackend(processes))
+    if name == WorkerPoolBackend.name:
+        return WorkerPoolBackend(
+            poll_interval_seconds=poll_interval_seconds,
+            heartbeat_timeout_seconds=heartbeat_timeout_seconds,
+            claim_timeout_seconds=claim_timeout_seconds,
+        )
+    if name != LocalProcessBackend.name:
+        raise ValueError(f"Unknown execution backend: {name}")
+    return LocalProcessBackend(processes)
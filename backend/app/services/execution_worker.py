@@ -0,0 +1,243 @@
+"""Execution worker: claims dbt jobs from the database and runs them.
+
+Start one or more workers next to an API configured with
+``EXECUTION_BACKEND=worker_pool``::
+
+    python -m app.services.execution_worker
+
+Each worker runs one job at a time in its own process, so a crashing or
+memory-hungry dbt invocation cannot take the API down with it. While a job
+runs the worker batches its output into ``execution_job_logs``, refreshes the
+job's heartbeat and watches for cancellation requests; when it finishes the
+standard artifacts from ``target/`` are uploaded and the exit code recorded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import update
+
+from app.core.config import get_settings
+from app.database.connection import SessionLocal
+from app.database.models import models as db_models
+from app.services.execution_backends import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    REPORTED_ARTIFACT_FILES,
+    read_stream_lines,
+    utcnow,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionWorker:
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        session_factory: Callable = SessionLocal,
+        poll_interval_seconds: float = 0.5,
+        heartbeat_interval_seconds: float = 5.0,
+    ):
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+
+    # ---- database access (runs in worker threads) ----
+
+    def _claim(self) -> Optional[Tuple[int, List[str], str]]:
+        """Claim the oldest queued job; the conditional update makes claims atomic across workers."""
+        db = self.session_factory()
+        try:
+            candidates = (
+                db.query(db_models.ExecutionJob.id)
+                .filter(db_models.ExecutionJob.status == JOB_QUEUED)
+                .order_by(db_models.ExecutionJob.created_at, db_models.ExecutionJob.id)
+                .limit(5)
+                .all()
+            )
+            for (job_id,) in candidates:
+                now = utcnow()
+                result = db.execute(
+                    update(db_models.ExecutionJob)
+                    .where(db_models.ExecutionJob.id == job_id, db_models.ExecutionJob.status == JOB_QUEUED)
+                    .values(status=JOB_RUNNING, worker_id=self.worker_id, claimed_at=now, heartbeat_at=now)
+                )
+                db.commit()
+                if result.rowcount == 1:
+                    job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).first()
+                    return job.id, list(job.command), job.cwd
+            return None
+        finally:
+            db.close()
+
+    def _write_lines(self, job_id: int, lines: List[Tuple[int, str]]) -> None:
+        db = self.session_factory()
+        try:
+            db.add_all(db_models.ExecutionJobLog(job_id=job_id, seq=seq, line=line) for seq, line in lines)
+            db.commit()
+        finally:
+            db.close()
+
+    def _owned(self, job_id: int):
+        """Condition matching ``job_id`` only while this worker still owns it as running."""
+        return (
+            db_models.ExecutionJob.id == job_id,
+            db_models.ExecutionJob.status == JOB_RUNNING,
+            db_models.ExecutionJob.worker_id == self.worker_id,
+        )
+
+    def _heartbeat(self, job_id: int) -> bool:
+        """Refresh the heartbeat; return ``True`` when the job should stop.
+
+        That is when cancellation was requested or the job is no longer this
+        worker's running job (e.g. the API already failed it as stale).
+        """
+        db = self.session_factory()
+        try:
+            result = db.execute(
+                update(db_models.ExecutionJob).where(*self._owned(job_id)).values(heartbeat_at=utcnow())
+            )
+            db.commit()
+            if result.rowcount != 1:
+                return True
+            job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).first()
+            return job is None or bool(job.cancel_requested)
+        finally:
+            db.close()
+
+    def _finish(self, job_id: int, cwd: str, exit_code: Optional[int], cancelled: bool, error: Optional[str]) -> None:
+        """Record the outcome unless the job was already finished elsewhere, e.g. failed by the API as stale."""
+        if cancelled:
+            status = JOB_CANCELLED
+        elif exit_code == 0:
+            status = JOB_SUCCEEDED
+        else:
+            status = JOB_FAILED
+        db = self.session_factory()
+        try:
+            result = db.execute(
+                update(db_models.ExecutionJob)
+                .where(*self._owned(job_id))
+                .values(status=status, exit_code=exit_code, error_message=error, finished_at=utcnow())
+            )
+            if result.rowcount != 1:
+                db.rollback()
+                logger.warning(
+                    "Execution job %s is no longer owned by worker %s; dropping its result", job_id, self.worker_id
+                )
+                return
+            if status == JOB_SUCCEEDED:
+                target_dir = Path(cwd) / "target"
+                for filename in REPORTED_ARTIFACT_FILES:
+                    path = target_dir / filename
+                    if path.is_file():
+                        db.add(db_models.ExecutionJobArtifact(job_id=job_id, filename=filename, content=path.read_bytes()))
+            db.commit()
+        finally:
+            db.close()
+
+    # ---- execution ----
+
+    async def _run_job(self, job_id: int, command: List[str], cwd: str) -> None:
+        pending: List[Tuple[int, str]] = []
+        seq = 0
+        cancelled = False
+        exit_code: Optional[int] = None
+        error: Optional[str] = None
+        process: Optional[asyncio.subprocess.Process] = None
+
+        async def flush() -> None:
+            if pending:
+                batch = pending[:]
+                pending.clear()
+                await asyncio.to_thread(self._write_lines, job_id, batch)
+
+        async def watch() -> None:
+            nonlocal cancelled
+            while True:
+                await asyncio.sleep(self.heartbeat_interval_seconds)
+                try:
+                    stop = await asyncio.to_thread(self._heartbeat, job_id)
+                except Exception:
+                    # A transient database error must not end the heartbeats for good.
+                    logger.exception("Heartbeat for execution job %s failed on worker %s", job_id, self.worker_id)
+                    continue
+                if stop and process and process.returncode is None:
+                    cancelled = True
+                    process.terminate()
+
+        watcher = asyncio.create_task(watch())
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+            loop = asyncio.get_running_loop()
+            last_flush = loop.time()
+            async for line in read_stream_lines(process.stdout):
+                seq += 1
+                pending.append((seq, line))
+                if len(pending) >= 200 or loop.time() - last_flush >= self.poll_interval_seconds:
+                    await flush()
+                    last_flush = loop.time()
+            exit_code = await process.wait()
+        except Exception as exc:
+            error = str(exc)
+            logger.exception("Execution job %s failed on worker %s", job_id, self.worker_id)
+        finally:
+            watcher.cancel()
+            await flush()
+            await asyncio.to_thread(self._finish, job_id, cwd, exit_code, cancelled, error)
+
+    async def run_once(self) -> bool:
+        """Claim and run a single job; return ``False`` when none was queued."""
+        claimed = await asyncio.to_thread(self._claim)
+        if claimed is None:
+            return False
+        await self._run_job(*claimed)
+        return True
+
+    async def run_forever(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        logger.info("Execution worker %s started", self.worker_id)
+        stop_event = stop_event or asyncio.Event()
+        while not stop_event.is_set():
+            try:
+                if await self.run_once():
+                    continue
+            except Exception:
+                logger.exception("Execution worker %s failed to claim a job", self.worker_id)
+            try:
+                await asyncio.wait_for(stop_event.wait(), self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+def main() -> None:
+    from app.database.connection import Base, engine
+
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    Base.metadata.create_all(bind=engine)
+    worker = ExecutionWorker(
+        poll_interval_seconds=settings.execution_worker_poll_seconds,
+        heartbeat_interval_seconds=settings.execution_worker_heartbeat_seconds,
+    )
+    asyncio.run(worker.run_forever())
+
+
+if __name__ == "__main__":
+    main()
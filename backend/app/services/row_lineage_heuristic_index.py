@@ -0,0 +1,126 @@
+"""On-disk trace id index for relations without a ``_row_trace_id`` column.
+
+Rows of such relations are identified by hashing their values with
+``new_trace_id``. Instead of re-reading and re-hashing the table for every
+lookup, the relation is streamed once in chunks into a small SQLite file that
+maps each computed trace id to the row's key (its primary key columns, or a
+database row id). Rows themselves stay in the warehouse and are fetched by key
+on lookup. The file records the run signature of the model that produced the
+relation and is rebuilt when the model runs again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+INDEX_FORMAT_VERSION = 2
+
+_LOOKUP_BATCH_SIZE = 500
+
+
+def index_dir_for(artifacts_path: Path) -> Path:
+    return artifacts_path / ".row_lineage" / "heuristic"
+
+
+def index_key(connection_key: str, relation_name: str, scan_limit: int) -> str:
+    raw = json.dumps([connection_key, relation_name, scan_limit])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class HeuristicTraceIndex:
+    """Read-only view over a built index file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def lookup(self, trace_ids: Sequence[str]) -> Dict[str, List[Any]]:
+        """Row keys for the given trace ids; unknown ids are omitted."""
+        keys: Dict[str, List[Any]] = {}
+        wanted = list(dict.fromkeys(trace_ids))
+        with closing(sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)) as conn:
+            for start in range(0, len(wanted), _LOOKUP_BATCH_SIZE):
+                batch = wanted[start:start + _LOOKUP_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                cursor = conn.execute(
+                    f"SELECT trace_id, row_key FROM row_keys WHERE trace_id IN ({placeholders})",
+                    batch,
+                )
+                for trace_id, row_key in cursor:
+                    keys[trace_id] = json.loads(row_key)
+        return keys
+
+
+def _read_meta(path: Path) -> Optional[Dict[str, str]]:
+    try:
+        with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as conn:
+            return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+    except sqlite3.Error:
+        return None
+
+
+def open_heuristic_index(index_dir: Path, key: str, signature: str) -> Optional[HeuristicTraceIndex]:
+    """Return the index for ``key`` if one was built for ``signature``."""
+
+    path = index_dir / f"{key}.sqlite"
+    if not path.exists():
+        return None
+    meta = _read_meta(path)
+    if meta and meta.get("format_version") == str(INDEX_FORMAT_VERSION) and meta.get("signature") == signature:
+        return HeuristicTraceIndex(path)
+    return None
+
+
+def build_heuristic_index(
+    index_dir: Path,
+    key: str,
+    signature: str,
+    chunks: Iterable[List[Dict[str, Any]]],
+    trace_id_and_key: Callable[[Dict[str, Any]], Tuple[str, List[Any]]],
+) -> HeuristicTraceIndex:
+    """Stream ``chunks`` into a new index stored under ``index_dir``.
+
+    The directory is private to the server user; raises ``OSError`` or
+    ``sqlite3.Error`` when it cannot be written.
+    """
+
+    index_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    path = index_dir / f"{key}.sqlite"
+    staging = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+    try:
+        conn = sqlite3.connect(staging)
+        try:
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE TABLE row_keys (trace_id TEXT PRIMARY KEY, row_key TEXT NOT NULL)")
+            count = 0
+            for chunk in chunks:
+                entries = []
+                for row in chunk:
+                    trace_id, row_key = trace_id_and_key(row)
+                    entries.append((trace_id, json.dumps(row_key)))
+                # The first row with a given trace id wins, as in a sequential scan.
+                conn.executemany("INSERT OR IGNORE INTO row_keys (trace_id, row_key) VALUES (?, ?)", entries)
+                count += len(entries)
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("format_version", str(INDEX_FORMAT_VERSION)),
+                    ("signature", signature),
+                    ("scanned_rows", str(count)),
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(staging, path)
+    except Exception:
+        if staging.exists():
+            staging.unlink()
+        raise
+    return HeuristicTraceIndex(path)
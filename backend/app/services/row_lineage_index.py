@@ -0,0 +1,841 @@
+"""Compact on-disk index for dbt-rowlineage mapping files.
+
+A mapping file is converted once into a directory of NumPy column files:
+model names are interned to integer ids, trace ids are stored as fixed-width
+bytes and compiled SQL / execution timestamps are deduplicated into a shared
+string table. Rows are sorted by ``(target_model, target_trace_id)`` so a
+lookup is two binary searches over memory-mapped arrays instead of a dict
+holding every mapping as a Python object. A permutation array ordering the
+same rows by ``(source_model, source_trace_id)`` answers downstream lookups
+without duplicating any column.
+
+JSONL files are parsed line by line. Parquet files are read column-wise
+with pyarrow: only the mapping columns are loaded, row groups whose
+statistics show a required column is entirely null are skipped, and model
+names and trace ids are converted with vectorized operations.
+
+The index directory sits next to the mapping file and records the file
+signature it was built from, so it is reused across processes and restarts.
+For JSONL files it also records how far the file was parsed and a checksum of
+that prefix: when dbt-rowlineage appends mappings, only the new tail is parsed
+and written as a small sorted delta segment next to the base columns; lookups
+consult every segment. Once ``MAX_DELTA_SEGMENTS`` deltas exist they are
+compacted into a new base by merging the already encoded columns, without
+re-parsing the file. Truncated or rewritten files are rebuilt from scratch.
+
+Extending, compacting and rebuilding an index happen under an exclusive lock
+file per mapping file, so concurrent processes never lose each other's delta.
+A rebuilt index replaces the old directory by renaming it aside first, so no
+reader ever sees a half-deleted index.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:  # POSIX only; elsewhere the lock only serializes threads of this process.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+INDEX_FORMAT_VERSION = 4
+MAX_INDEX_WARNINGS = 100
+MAX_DELTA_SEGMENTS = 8
+
+_DELTAS_DIRNAME = "deltas"
+
+_CHUNK_SIZE = 250_000
+_PREFIX_CHECKSUM_WINDOW = 64 * 1024
+_REQUIRED_FIELDS = ("source_model", "target_model", "source_trace_id", "target_trace_id")
+_OPTIONAL_FIELDS = ("compiled_sql", "executed_at")
+_COLUMN_FILES = (
+    "target_model",
+    "target_trace",
+    "source_model",
+    "source_trace",
+    "compiled_sql",
+    "executed_at",
+)
+
+
+@dataclass(frozen=True)
+class MappingRecord:
+    source_model: str
+    target_model: str
+    source_trace_id: str
+    target_trace_id: str
+    compiled_sql: str = ""
+    executed_at: str = ""
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any]) -> "MappingRecord":
+        return cls(
+            source_model=str(payload.get("source_model", "")),
+            target_model=str(payload.get("target_model", "")),
+            source_trace_id=str(payload.get("source_trace_id", "")),
+            target_trace_id=str(payload.get("target_trace_id", "")),
+            compiled_sql=str(payload.get("compiled_sql", "")),
+            executed_at=str(payload.get("executed_at", "")),
+        )
+
+
+def _temp_index_base(mapping_path: Path) -> Path:
+    digest = hashlib.sha1(str(mapping_path).encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / "dbt-workbench-row-lineage" / f"{mapping_path.name}-{digest}"
+
+
+def index_dirs_for(mapping_path: Path) -> List[Path]:
+    """Candidate index locations: next to the mapping file, then a temp fallback."""
+
+    return [mapping_path.parent / f".{mapping_path.name}.index", _temp_index_base(mapping_path)]
+
+
+_THREAD_LOCKS: Dict[str, threading.Lock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+@contextlib.contextmanager
+def _index_lock(mapping_path: Path) -> Iterator[None]:
+    """Hold the exclusive lock guarding every index of ``mapping_path``.
+
+    The lock file lives in the temp directory, which is writable even when the
+    mapping file's directory is not.
+    """
+
+    lock_path = _temp_index_base(mapping_path).with_suffix(".lock")
+    with _THREAD_LOCKS_GUARD:
+        thread_lock = _THREAD_LOCKS.setdefault(str(lock_path), threading.Lock())
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with lock_path.open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def file_signature(path: Path) -> Dict[str, int]:
+    stat = path.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+class _Segment:
+    """One sorted run of mappings: the base columns or an appended delta."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.columns = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in _COLUMN_FILES
+        }
+        self.source_order = np.load(directory / "source_order.npy", mmap_mode="r")
+        self.strings = np.load(directory / "strings.npy", mmap_mode="r")
+        self.string_offsets = np.load(directory / "string_offsets.npy", mmap_mode="r")
+
+    @property
+    def count(self) -> int:
+        return int(self.columns["target_model"].shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        total = sum(int(column.nbytes) for column in self.columns.values())
+        total += int(self.source_order.nbytes)
+        return total + int(self.strings.nbytes) + int(self.string_offsets.nbytes)
+
+    @property
+    def string_count(self) -> int:
+        return len(self.string_offsets) - 1
+
+    def string(self, string_id: int) -> str:
+        start = int(self.string_offsets[string_id])
+        end = int(self.string_offsets[string_id + 1])
+        return bytes(self.strings[start:end]).decode("utf-8")
+
+    def record(self, row: int, models: List[str]) -> MappingRecord:
+        columns = self.columns
+        return MappingRecord(
+            source_model=models[int(columns["source_model"][row])],
+            target_model=models[int(columns["target_model"][row])],
+            source_trace_id=bytes(columns["source_trace"][row]).decode("utf-8"),
+            target_trace_id=bytes(columns["target_trace"][row]).decode("utf-8"),
+            compiled_sql=self.string(int(columns["compiled_sql"][row])),
+            executed_at=self.string(int(columns["executed_at"][row])),
+        )
+
+    def target_rows(self, model_id: int, key: bytes) -> range:
+        traces = self.columns["target_trace"]
+        if len(key) > traces.dtype.itemsize:
+            return range(0)
+        models = self.columns["target_model"]
+        low = int(np.searchsorted(models, model_id, side="left"))
+        high = int(np.searchsorted(models, model_id, side="right"))
+        block = traces[low:high]
+        start = low + int(np.searchsorted(block, key, side="left"))
+        end = low + int(np.searchsorted(block, key, side="right"))
+        return range(start, end)
+
+    def _source_key(self, position: int) -> Tuple[int, bytes]:
+        row = int(self.source_order[position])
+        return int(self.columns["source_model"][row]), bytes(self.columns["source_trace"][row])
+
+    def source_rows(self, model_id: int, key: bytes) -> List[int]:
+        positions = range(len(self.source_order))
+        start = bisect.bisect_left(positions, (model_id, key), key=self._source_key)
+        end = bisect.bisect_right(positions, (model_id, key), lo=start, key=self._source_key)
+        return [int(self.source_order[position]) for position in range(start, end)]
+
+
+class MappingStore:
+    """Read-only view over a built index directory and its delta segments."""
+
+    def __init__(self, directory: Path, meta: Dict[str, Any]):
+        self.directory = directory
+        self.meta = meta
+        self.models: List[str] = list(meta["models"])
+        self._model_ids = {name: model_id for model_id, name in enumerate(self.models)}
+        # Segments are in file order: the base, then deltas in the order they were appended.
+        self._segments = [_Segment(directory)] + [
+            _Segment(directory / _DELTAS_DIRNAME / name) for name in meta.get("deltas", [])
+        ]
+
+    @property
+    def count(self) -> int:
+        return sum(segment.count for segment in self._segments)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(segment.nbytes for segment in self._segments)
+
+    def lookup_target(self, model_name: str, trace_id: str) -> List[MappingRecord]:
+        """Return mappings whose target is ``(model_name, trace_id)`` in file order."""
+
+        model_id = self._model_ids.get(model_name)
+        if model_id is None:
+            return []
+        key = trace_id.encode("utf-8")
+        return [
+            segment.record(row, self.models)
+            for segment in self._segments
+            for row in segment.target_rows(model_id, key)
+        ]
+
+    def lookup_source(self, model_name: str, trace_id: str) -> List[MappingRecord]:
+        """Return mappings whose source is ``(model_name, trace_id)``, ordered by target."""
+
+        model_id = self._model_ids.get(model_name)
+        if model_id is None:
+            return []
+        key = trace_id.encode("utf-8")
+        records = [
+            segment.record(row, self.models)
+            for segment in self._segments
+            for row in segment.source_rows(model_id, key)
+        ]
+        if len(self._segments) > 1:
+            records.sort(key=lambda record: (self._model_ids[record.target_model], record.target_trace_id.encode("utf-8")))
+        return records
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        existing = self.ids.get(value)
+        if existing is not None:
+            return existing
+        new_id = len(self.values)
+        self.ids[value] = new_id
+        self.values.append(value)
+        return new_id
+
+
+class _ColumnBuffer:
+    """Accumulates parsed mappings and flushes them into compact NumPy chunks."""
+
+    def __init__(self) -> None:
+        self.models = _Interner()
+        self.strings = _Interner()
+        self._pending: Dict[str, List[Any]] = {name: [] for name in _COLUMN_FILES}
+        self._chunks: Dict[str, List[np.ndarray]] = {name: [] for name in _COLUMN_FILES}
+
+    @classmethod
+    def for_delta(cls, store: MappingStore) -> "_ColumnBuffer":
+        """A buffer for rows appended to ``store``: model ids are shared, strings are per segment."""
+
+        buffer = cls()
+        for name in store.models:
+            buffer.models.intern(name)
+        return buffer
+
+    @classmethod
+    def from_segments(cls, store: MappingStore) -> "_ColumnBuffer":
+        """Merge every segment of ``store`` into one buffer, re-mapping per-segment string ids."""
+
+        buffer = cls.for_delta(store)
+        for segment in store._segments:
+            if not segment.count:
+                continue
+            string_ids = np.array(
+                [buffer.strings.intern(segment.string(string_id)) for string_id in range(segment.string_count)],
+                dtype=np.uint32,
+            )
+            columns = {name: np.asarray(column) for name, column in segment.columns.items()}
+            for name in _OPTIONAL_FIELDS:
+                columns[name] = string_ids[columns[name]]
+            buffer.extend(columns)
+        return buffer
+
+    def add(self, record: MappingRecord) -> None:
+        pending = self._pending
+        pending["target_model"].append(self.models.intern(record.target_model))
+        pending["target_trace"].append(record.target_trace_id.encode("utf-8"))
+        pending["source_model"].append(self.models.intern(record.source_model))
+        pending["source_trace"].append(record.source_trace_id.encode("utf-8"))
+        pending["compiled_sql"].append(self.strings.intern(record.compiled_sql))
+        pending["executed_at"].append(self.strings.intern(record.executed_at))
+        if len(pending["target_model"]) >= _CHUNK_SIZE:
+            self.flush()
+
+    def extend(self, columns: Dict[str, np.ndarray]) -> None:
+        """Append an already-encoded batch (model and string columns hold interned ids)."""
+
+        self.flush()
+        for name in _COLUMN_FILES:
+            self._chunks[name].append(columns[name])
+
+    def flush(self) -> None:
+        if not self._pending["target_model"]:
+            return
+        for name, values in self._pending.items():
+            if name.endswith("_trace"):
+                self._chunks[name].append(np.array(values, dtype=np.bytes_))
+            else:
+                self._chunks[name].append(np.array(values, dtype=np.uint32))
+            self._pending[name] = []
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        self.flush()
+        columns: Dict[str, np.ndarray] = {}
+        for name, chunks in self._chunks.items():
+            if chunks:
+                columns[name] = np.concatenate(chunks)
+            elif name.endswith("_trace"):
+                columns[name] = np.array([], dtype="S1")
+            else:
+                columns[name] = np.array([], dtype=np.uint32)
+        return columns
+
+
+@dataclass
+class _JsonlCursor:
+    """Parse position within a JSONL mapping file, persisted as ``meta["tail"]``."""
+
+    offset: int = 0
+    line_count: int = 0
+    ends_mid_line: bool = False
+    warnings: List[str] = field(default_factory=list)
+    warning_total: int = 0
+    pending_warnings: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_meta(cls, tail: Dict[str, Any]) -> "_JsonlCursor":
+        return cls(
+            offset=int(tail["offset"]),
+            line_count=int(tail["line_count"]),
+            ends_mid_line=bool(tail["ends_mid_line"]),
+            warnings=list(tail["warnings"]),
+            warning_total=int(tail["warning_total"]),
+        )
+
+    def warn(self, message: str) -> None:
+        self.warning_total += 1
+        if len(self.warnings) < MAX_INDEX_WARNINGS:
+            self.warnings.append(message)
+
+    def display_warnings(self) -> List[str]:
+        shown = (self.warnings + self.pending_warnings)[:MAX_INDEX_WARNINGS]
+        hidden = self.warning_total + len(self.pending_warnings) - len(shown)
+        if hidden:
+            shown.append(f"{hidden} more row lineage mapping warnings suppressed.")
+        return shown
+
+    def to_meta(self, prefix_checksum: str) -> Dict[str, Any]:
+        return {
+            "offset": self.offset,
+            "line_count": self.line_count,
+            "ends_mid_line": self.ends_mid_line,
+            "warnings": self.warnings,
+            "warning_total": self.warning_total,
+            "prefix_checksum": prefix_checksum,
+        }
+
+
+def _read_jsonl_records(mapping_path: Path, buffer: _ColumnBuffer, cursor: _JsonlCursor) -> None:
+    """Parse ``mapping_path`` from ``cursor.offset`` to the end of the file.
+
+    An unterminated last line that is not valid JSON is most likely still
+    being written, so the cursor stops in front of it and its warning is only
+    kept until the next pass re-reads it.
+    """
+
+    if cursor.ends_mid_line:
+        # The next chunk of bytes continues the line that was last counted.
+        cursor.line_count -= 1
+    with mapping_path.open("rb") as handle:
+        handle.seek(cursor.offset)
+        for raw_line in handle:
+            line_number = cursor.line_count + 1
+            terminated = raw_line.endswith(b"\n")
+            line = raw_line.strip()
+            if line:
+                try:
+                    payload = json.loads(line)
+                except ValueError:
+                    message = f"Invalid JSON in row lineage mapping at line {line_number}."
+                    if not terminated:
+                        cursor.pending_warnings.append(message)
+                        break
+                    cursor.warn(message)
+                else:
+                    record = MappingRecord.from_json(payload) if isinstance(payload, dict) else None
+                    if record and record.source_model and record.target_model and record.source_trace_id and record.target_trace_id:
+                        buffer.add(record)
+                    else:
+                        cursor.warn(f"Incomplete row lineage mapping at line {line_number}.")
+            cursor.offset += len(raw_line)
+            cursor.line_count = line_number
+            cursor.ends_mid_line = not terminated
+
+
+def _prefix_checksum(mapping_path: Path, offset: int) -> str:
+    """Checksum the head and tail of the first ``offset`` bytes of the file.
+
+    Hashing both ends of the parsed prefix detects rewrites and truncation
+    followed by regrowth without re-reading the whole file on every append.
+    """
+
+    digest = hashlib.sha256(str(offset).encode("ascii"))
+    with mapping_path.open("rb") as handle:
+        digest.update(handle.read(min(offset, _PREFIX_CHECKSUM_WINDOW)))
+        tail_start = max(offset - _PREFIX_CHECKSUM_WINDOW, _PREFIX_CHECKSUM_WINDOW)
+        if tail_start < offset:
+            handle.seek(tail_start)
+            digest.update(handle.read(offset - tail_start))
+    return digest.hexdigest()
+
+
+def _fixed_width_bytes(array: Any) -> np.ndarray:
+    """Convert an Arrow string array without nulls into a fixed-width ``S`` array."""
+
+    import pyarrow as pa
+
+    array = array.cast(pa.large_binary())
+    size = len(array)
+    offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)[array.offset:array.offset + size + 1]
+    lengths = np.diff(offsets)
+    width = max(int(lengths.max()) if size else 0, 1)
+    data_buffer = array.buffers()[2]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.zeros(0, dtype=np.uint8)
+    matrix = np.zeros((size, width), dtype=np.uint8)
+    rows = np.repeat(np.arange(size), lengths)
+    positions = np.arange(int(lengths.sum())) - np.repeat(offsets[:-1] - offsets[0], lengths)
+    matrix[rows, positions] = data[offsets[0]:offsets[-1]]
+    return matrix.view(f"S{width}").reshape(size)
+
+
+def _dictionary_codes(column: Any) -> Tuple[np.ndarray, List[Optional[str]]]:
+    """Return per-row dictionary codes (``-1`` for nulls) and the dictionary values."""
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    if not pa.types.is_dictionary(array.type):
+        array = pc.dictionary_encode(array.cast(pa.string()))
+    dictionary = array.dictionary.cast(pa.string()).to_pylist()
+    codes = pc.fill_null(array.indices.cast(pa.int64()), -1).to_numpy(zero_copy_only=False)
+    return codes, dictionary
+
+
+def _intern_codes(codes: np.ndarray, dictionary: List[Optional[str]], interner: _Interner) -> np.ndarray:
+    lookup = np.zeros(len(dictionary), dtype=np.uint32)
+    for code in np.unique(codes[codes >= 0]).tolist():
+        lookup[code] = interner.intern(dictionary[code] or "")
+    interned = lookup[np.maximum(codes, 0)]
+    nulls = codes < 0
+    if nulls.any():
+        interned[nulls] = interner.intern("")
+    return interned
+
+
+def _skippable_row_groups(metadata: Any) -> List[int]:
+    """Row groups where statistics prove a required column is entirely null."""
+
+    skipped: List[int] = []
+    for group_index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(group_index)
+        if row_group.num_rows == 0:
+            skipped.append(group_index)
+            continue
+        for column_index in range(row_group.num_columns):
+            chunk = row_group.column(column_index)
+            if chunk.path_in_schema not in _REQUIRED_FIELDS:
+                continue
+            stats = chunk.statistics
+            if stats is not None and stats.has_null_count and stats.null_count == row_group.num_rows:
+                skipped.append(group_index)
+                break
+    return skipped
+
+
+def _read_parquet_records(mapping_path: Path, buffer: _ColumnBuffer, warnings: List[str]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ValueError("Reading Parquet row lineage mappings requires pyarrow.") from exc
+
+    parquet_file = pq.ParquetFile(mapping_path)
+    names = set(parquet_file.schema_arrow.names)
+    missing = [name for name in _REQUIRED_FIELDS if name not in names]
+    if missing:
+        raise ValueError(f"Row lineage Parquet file is missing columns: {', '.join(missing)}")
+    columns = list(_REQUIRED_FIELDS) + [name for name in _OPTIONAL_FIELDS if name in names]
+    parquet_file = pq.ParquetFile(
+        mapping_path,
+        read_dictionary=["source_model", "target_model"] + [name for name in _OPTIONAL_FIELDS if name in names],
+    )
+
+    skipped = set(_skippable_row_groups(parquet_file.metadata))
+    for group_index in range(parquet_file.metadata.num_row_groups):
+        if group_index in skipped:
+            rows = parquet_file.metadata.row_group(group_index).num_rows
+            if rows:
+                warnings.append(f"Skipped {rows} incomplete row lineage mappings in row group {group_index}.")
+            continue
+        table = parquet_file.read_row_group(group_index, columns=columns)
+
+        valid = np.ones(table.num_rows, dtype=bool)
+        for name in ("source_trace_id", "target_trace_id"):
+            column = table.column(name).cast(pa.string())
+            table = table.set_column(table.schema.get_field_index(name), name, column)
+            lengths = pc.fill_null(pc.binary_length(column), 0).to_numpy(zero_copy_only=False)
+            valid &= lengths > 0
+        model_codes: Dict[str, Tuple[np.ndarray, List[Optional[str]]]] = {}
+        for name in ("source_model", "target_model"):
+            codes, dictionary = _dictionary_codes(table.column(name))
+            # The trailing ``False`` is what null rows (code ``-1``) index into.
+            present = np.array([bool(value) for value in dictionary] + [False], dtype=bool)
+            valid &= present[codes]
+            model_codes[name] = (codes, dictionary)
+
+        invalid = int(table.num_rows - valid.sum())
+        if invalid:
+            warnings.append(f"Skipped {invalid} incomplete row lineage mappings in row group {group_index}.")
+        if not valid.any():
+            continue
+
+        mask = pa.array(valid)
+        batch: Dict[str, np.ndarray] = {}
+        for name, prefix in (("source_model", "source"), ("target_model", "target")):
+            codes, dictionary = model_codes[name]
+            batch[f"{prefix}_model"] = _intern_codes(codes[valid], dictionary, buffer.models)
+            trace = table.column(f"{prefix}_trace_id").filter(mask).combine_chunks()
+            batch[f"{prefix}_trace"] = _fixed_width_bytes(trace)
+        for name in _OPTIONAL_FIELDS:
+            if name in names:
+                codes, dictionary = _dictionary_codes(table.column(name))
+                batch[name] = _intern_codes(codes[valid], dictionary, buffer.strings)
+            else:
+                batch[name] = np.full(int(valid.sum()), buffer.strings.intern(""), dtype=np.uint32)
+        buffer.extend(batch)
+
+
+def _encode_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(item) for item in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _model_names(models: List[str], model_ids: np.ndarray) -> List[str]:
+    return sorted(models[model_id] for model_id in np.unique(model_ids).tolist())
+
+
+def _compute_roots(target_models: Iterable[str], source_models: Iterable[str]) -> List[str]:
+    target_models, source_models = set(target_models), set(source_models)
+    roots = sorted(target_models - source_models)
+    if not roots:
+        roots = sorted(target_models) if target_models else sorted(source_models)
+    return roots
+
+
+def _target_counts(models: List[str], target_ids: np.ndarray) -> Dict[str, int]:
+    counts = np.bincount(target_ids, minlength=len(models)) if models else np.array([])
+    return {models[model_id]: int(count) for model_id, count in enumerate(counts.tolist()) if count}
+
+
+def _cap_warnings(warnings: List[str]) -> List[str]:
+    if len(warnings) <= MAX_INDEX_WARNINGS:
+        return warnings
+    hidden = len(warnings) - MAX_INDEX_WARNINGS
+    return warnings[:MAX_INDEX_WARNINGS] + [f"{hidden} more row lineage mapping warnings suppressed."]
+
+
+def _save_segment(directory: Path, buffer: _ColumnBuffer) -> Dict[str, np.ndarray]:
+    """Sort the buffered rows by target and save them as a segment; returns the sorted columns."""
+
+    columns = buffer.columns()
+    order = np.lexsort((columns["target_trace"], columns["target_model"]))
+    columns = {name: values[order] for name, values in columns.items()}
+    source_order = np.lexsort((columns["source_trace"], columns["source_model"])).astype(np.int64)
+    for name, values in columns.items():
+        np.save(directory / f"{name}.npy", values)
+    blob, offsets = _encode_strings(buffer.strings.values)
+    np.save(directory / "source_order.npy", source_order)
+    np.save(directory / "strings.npy", blob)
+    np.save(directory / "string_offsets.npy", offsets)
+    return columns
+
+
+def _write_meta(directory: Path, meta: Dict[str, Any]) -> None:
+    staging = directory / f"meta.json.tmp-{uuid.uuid4().hex}"
+    try:
+        staging.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(staging, directory / "meta.json")
+    except Exception:
+        staging.unlink(missing_ok=True)
+        raise
+
+
+def _write_index(
+    index_dir: Path,
+    buffer: _ColumnBuffer,
+    signature: Dict[str, int],
+    warnings: List[str],
+    tail: Optional[Dict[str, Any]] = None,
+) -> MappingStore:
+    staging_dir = index_dir.with_name(f"{index_dir.name}.tmp-{uuid.uuid4().hex}")
+    staging_dir.mkdir(parents=True)
+    try:
+        columns = _save_segment(staging_dir, buffer)
+        models = buffer.models.values
+        source_models = _model_names(models, columns["source_model"])
+        mappings_as_target = _target_counts(models, columns["target_model"])
+        meta = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "signature": signature,
+            "count": int(columns["target_model"].shape[0]),
+            "models": models,
+            "mappings_as_target": mappings_as_target,
+            "source_models": source_models,
+            "roots": _compute_roots(mappings_as_target, source_models),
+            "warnings": warnings,
+            "tail": tail,
+            "deltas": [],
+        }
+        (staging_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+        _swap_in(staging_dir, index_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    return MappingStore(index_dir, meta)
+
+
+def _swap_in(staging_dir: Path, index_dir: Path) -> None:
+    """Move ``staging_dir`` to ``index_dir``, renaming any existing index aside first.
+
+    A directory cannot be renamed over a non-empty one, so the old index is
+    moved out of the way and only deleted once the new one is in place; a
+    failed swap restores it.
+    """
+
+    retired: Optional[Path] = None
+    if index_dir.exists():
+        retired = index_dir.with_name(f"{index_dir.name}.old-{uuid.uuid4().hex}")
+        os.replace(index_dir, retired)
+    try:
+        os.replace(staging_dir, index_dir)
+    except Exception:
+        if retired is not None:
+            os.replace(retired, index_dir)
+        raise
+    if retired is not None:
+        shutil.rmtree(retired, ignore_errors=True)
+
+
+def _append_delta(
+    store: MappingStore,
+    buffer: _ColumnBuffer,
+    signature: Dict[str, int],
+    warnings: List[str],
+    tail: Dict[str, Any],
+) -> MappingStore:
+    """Write the appended rows in ``buffer`` as a new delta segment of ``store``.
+
+    The segment directory is complete before ``meta.json`` is replaced to list
+    it, so readers see either the old or the new set of segments.
+    """
+
+    meta = dict(store.meta)
+    columns = buffer.columns()
+    if columns["target_model"].shape[0]:
+        name = uuid.uuid4().hex
+        segment_dir = store.directory / _DELTAS_DIRNAME / name
+        segment_dir.mkdir(parents=True)
+        try:
+            columns = _save_segment(segment_dir, buffer)
+        except Exception:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+            raise
+        models = buffer.models.values
+        mappings_as_target = dict(meta["mappings_as_target"])
+        for model, count in _target_counts(models, columns["target_model"]).items():
+            mappings_as_target[model] = mappings_as_target.get(model, 0) + count
+        source_models = sorted(set(meta["source_models"]) | set(_model_names(models, columns["source_model"])))
+        meta.update(
+            count=int(meta["count"]) + int(columns["target_model"].shape[0]),
+            models=models,
+            mappings_as_target=mappings_as_target,
+            source_models=source_models,
+            roots=_compute_roots(mappings_as_target, source_models),
+            deltas=list(meta.get("deltas", [])) + [name],
+        )
+    meta.update(signature=signature, warnings=warnings, tail=tail)
+    _write_meta(store.directory, meta)
+    return MappingStore(store.directory, meta)
+
+
+def _existing_indexes(mapping_path: Path) -> Iterable[Tuple[Path, Dict[str, Any]]]:
+    for index_dir in index_dirs_for(mapping_path):
+        meta_path = index_dir / "meta.json"
+        if not meta_path.exists():
+            continue
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if meta.get("format_version") == INDEX_FORMAT_VERSION:
+            yield index_dir, meta
+
+
+def open_mapping_store(mapping_path: Path) -> Optional[MappingStore]:
+    """Open the existing index for ``mapping_path`` if it matches the file."""
+
+    signature = file_signature(mapping_path)
+    for index_dir, meta in _existing_indexes(mapping_path):
+        if meta.get("signature") != signature:
+            continue
+        try:
+            return MappingStore(index_dir, meta)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def build_mapping_store(mapping_path: Path) -> MappingStore:
+    """Convert a JSONL or Parquet mapping file into an on-disk index and open it."""
+
+    signature = file_signature(mapping_path)
+    buffer = _ColumnBuffer()
+    if mapping_path.suffix.lower() == ".parquet":
+        warnings: List[str] = []
+        _read_parquet_records(mapping_path, buffer, warnings)
+        return _write_index_with_fallback(mapping_path, buffer, signature, _cap_warnings(warnings))
+
+    cursor = _JsonlCursor()
+    _read_jsonl_records(mapping_path, buffer, cursor)
+    tail = cursor.to_meta(_prefix_checksum(mapping_path, cursor.offset))
+    return _write_index_with_fallback(mapping_path, buffer, signature, cursor.display_warnings(), tail)
+
+
+def extend_mapping_store(mapping_path: Path, store: MappingStore) -> Optional[MappingStore]:
+    """Index mappings appended since ``store`` was built; ``None`` if a rebuild is needed."""
+
+    tail = store.meta.get("tail")
+    if not tail:
+        return None
+    signature = file_signature(mapping_path)
+    if signature["size"] < tail["offset"]:
+        return None
+    if _prefix_checksum(mapping_path, tail["offset"]) != tail["prefix_checksum"]:
+        return None
+
+    buffer = _ColumnBuffer.for_delta(store)
+    cursor = _JsonlCursor.from_meta(tail)
+    _read_jsonl_records(mapping_path, buffer, cursor)
+    tail = cursor.to_meta(_prefix_checksum(mapping_path, cursor.offset))
+    extended = _append_delta(store, buffer, signature, cursor.display_warnings(), tail)
+    if len(extended.meta["deltas"]) < MAX_DELTA_SEGMENTS:
+        return extended
+    return _write_index(
+        extended.directory, _ColumnBuffer.from_segments(extended), signature, extended.meta["warnings"], tail
+    )
+
+
+def _write_index_with_fallback(
+    mapping_path: Path,
+    buffer: _ColumnBuffer,
+    signature: Dict[str, int],
+    warnings: List[str],
+    tail: Optional[Dict[str, Any]] = None,
+) -> MappingStore:
+    preferred, fallback = index_dirs_for(mapping_path)
+    try:
+        return _write_index(preferred, buffer, signature, warnings, tail)
+    except OSError:
+        fallback.parent.mkdir(parents=True, exist_ok=True)
+        return _write_index(fallback, buffer, signature, warnings, tail)
+
+
+def load_mapping_store(mapping_path: Path) -> MappingStore:
+    """Open the index for ``mapping_path``, extending or rebuilding it when stale."""
+
+    store = open_mapping_store(mapping_path)
+    if store is not None:
+        return store
+    with _index_lock(mapping_path):
+        # Re-read under the lock: another process may have updated the index meanwhile.
+        return _refresh_mapping_store(mapping_path)
+
+
+def _refresh_mapping_store(mapping_path: Path) -> MappingStore:
+    signature = file_signature(mapping_path)
+    stale: Optional[Tuple[Path, Dict[str, Any]]] = None
+    for index_dir, meta in _existing_indexes(mapping_path):
+        if meta.get("signature") == signature:
+            try:
+                return MappingStore(index_dir, meta)
+            except (OSError, ValueError):
+                continue
+        if stale is None:
+            stale = (index_dir, meta)
+    if stale is not None:
+        try:
+            extended = extend_mapping_store(mapping_path, MappingStore(*stale))
+        except (OSError, ValueError, KeyError):
+            extended = None
+        if extended is not None:
+            return extended
+    return build_mapping_store(mapping_path)
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
 import json
 import shutil
+import sqlite3
 import threading
+import time as time_module
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from sqlalchemy import inspect, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.auth import WorkspaceContext
@@ -19,6 +25,7 @@ from app.core.config import Settings
 from app.database.connection import SessionLocal
 from app.schemas.execution import DbtCommand, RunDetail, RunStatus
 from app.schemas.row_lineage import (
+    RowLineageCacheStats,
     RowLineageEdge,
     RowLineageExportResponse,
     RowLineageGraph,
@@ -33,7 +40,10 @@ from app.schemas.row_lineage import (
 )
 from app.services import git_service
 from app.services.artifact_service import ArtifactService
+from app.services.bounded_cache import BoundedCache
 from app.services.dbt_executor import executor
+from app.services import row_lineage_heuristic_index
+from app.services.row_lineage_index import MappingRecord, MappingStore, load_mapping_store
 from app.services.sql_engine import connection_url_for_environment, get_engine, resolve_environment
 from dbt_rowlineage.utils.sql import TRACE_COLUMN
 from dbt_rowlineage.utils.uuid import new_trace_id
@@ -46,30 +56,45 @@ RESOURCE_TYPE_PRIORITY = {
     "snapshot": 2,
 }
 
-_mapping_cache_by_path: Dict[str, "MappingIndex"] = {}
-_mapping_signature_by_path: Dict[str, Tuple[float, int]] = {}
-_mapping_cache_lock = threading.Lock()
-
-
-@dataclass(frozen=True)
-class MappingRecord:
-    source_model: str
-    target_model: str
-    source_trace_id: str
-    target_trace_id: str
-    compiled_sql: str = ""
-    executed_at: str = ""
-
-    @classmethod
-    def from_json(cls, payload: Dict[str, Any]) -> "MappingRecord":
-        return cls(
-            source_model=str(payload.get("source_model", "")),
-            target_model=str(payload.get("target_model", "")),
-            source_trace_id=str(payload.get("source_trace_id", "")),
-            target_trace_id=str(payload.get("target_trace_id", "")),
-            compiled_sql=str(payload.get("compiled_sql", "")),
-            executed_at=str(payload.get("executed_at", "")),
-        )
+# Mapping indexes keyed by mapping file path, shared by every workspace and
+# bounded by ROW_LINEAGE_INDEX_CACHE_MAX_MB.
+_mapping_index_cache: BoundedCache[str, "MappingIndex"] = BoundedCache(max_bytes=0)
+
+# Finished trace graphs keyed by everything that shapes them, bounded by
+# ROW_LINEAGE_TRACE_CACHE_MAX_MB and expired after
+# ROW_LINEAGE_TRACE_CACHE_TTL_SECONDS so warehouse rows are eventually re-read.
+_trace_cache: BoundedCache[Tuple[Any, ...], "RowLineageTraceResponse"] = BoundedCache(max_bytes=0)
+
+TRACE_TIMEOUT_WARNING = "Row lineage trace exceeded its time limit; the graph is partial."
+
+_schema_cache: Dict[Tuple[str, Optional[str], str], "TableSchema"] = {}
+_schema_cache_lock = threading.Lock()
+
+# Rows fetched per round trip while building heuristic trace indexes.
+HEURISTIC_SCAN_CHUNK_SIZE = 5000
+# Column alias prefix for row key values selected alongside each scanned row.
+HEURISTIC_KEY_ALIAS = "_row_lineage_key_"
+
+# Streaming preview pages: rows per page by default / at most, and rows
+# fetched from the warehouse per round trip while streaming a page.
+PREVIEW_STREAM_DEFAULT_PAGE_SIZE = 1000
+PREVIEW_STREAM_MAX_PAGE_SIZE = 10000
+PREVIEW_STREAM_BATCH_SIZE = 500
+
+# Upper bound on bound parameters per ``IN (...)`` lookup; stays below the
+# SQLite limit and keeps statements small on other warehouses.
+TRACE_FETCH_BATCH_SIZE = 500
+
+
+def _engine_key(engine: Engine) -> str:
+    """Cache key for an engine's database: a digest of its URL, so credentials are never kept."""
+
+    url = engine.url.render_as_string(hide_password=False)
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a preview pagination cursor cannot be decoded."""
 
 
 @dataclass
@@ -83,6 +108,14 @@ class RelationInfo:
     resource_type: Optional[str]
 
 
+@dataclass
+class TableSchema:
+    columns: Optional[List[str]]
+    primary_key: List[str]
+    fetched_at: float
+    manifest_signature: Optional[str]
+
+
 @dataclass
 class MappingIndex:
     mapping_path: Optional[Path]
@@ -91,11 +124,32 @@ class MappingIndex:
     mtime: Optional[float]
     size: Optional[int]
     count: int
-    by_target: Dict[Tuple[str, str], List[MappingRecord]]
+    store: Optional[MappingStore]
     mappings_as_target: Dict[str, int]
     models: Set[str]
     roots: List[str]
     warnings: List[str]
+    signature: Optional[Tuple[int, int]] = None
+
+    @property
+    def cache_size(self) -> int:
+        """Approximate memory held by this index, used for cache accounting."""
+
+        size = self.store.nbytes if self.store is not None else 0
+        size += sum(len(name) + 64 for name in self.models)
+        size += sum(len(name) + 64 for name in self.mappings_as_target)
+        size += sum(len(message) + 64 for message in self.warnings)
+        return size + 1024
+
+    def parents(self, model_name: str, trace_id: str) -> List[MappingRecord]:
+        if self.store is None:
+            return []
+        return self.store.lookup_target(model_name, trace_id)
+
+    def children(self, model_name: str, trace_id: str) -> List[MappingRecord]:
+        if self.store is None:
+            return []
+        return self.store.lookup_source(model_name, trace_id)
 
 
 class RowLineageService:
@@ -108,6 +162,8 @@ class RowLineageService:
         self._manifest_nodes_cache: Optional[Dict[str, Dict[str, Any]]] = None
         self._nodes_by_name_cache: Optional[Dict[str, List[Tuple[str, Dict[str, Any]]]]] = None
         self._project_name_cache: Optional[str] = None
+        self._manifest_signature_cache: Optional[str] = None
+        self._run_completions_cache: Optional[Dict[str, str]] = None
 
     # ---- Warnings helpers ----
 
@@ -182,10 +238,22 @@ class RowLineageService:
         fallback = bases[0][1] / relative
         return None, str(fallback), warnings
 
+    def _mapping_index_cache(self) -> BoundedCache[str, MappingIndex]:
+        max_bytes = max(0, self.settings.row_lineage_index_cache_max_mb) * 1024 * 1024
+        if _mapping_index_cache.max_bytes != max_bytes:
+            _mapping_index_cache.resize(max_bytes)
+        return _mapping_index_cache
+
+    def _trace_cache(self) -> BoundedCache[Tuple[Any, ...], RowLineageTraceResponse]:
+        max_bytes = max(0, self.settings.row_lineage_trace_cache_max_mb) * 1024 * 1024
+        if _trace_cache.max_bytes != max_bytes:
+            _trace_cache.resize(max_bytes)
+        _trace_cache.ttl_seconds = max(0.0, self.settings.row_lineage_trace_cache_ttl_seconds)
+        return _trace_cache
+
     def _invalidate_mapping_cache(self) -> None:
-        with _mapping_cache_lock:
-            _mapping_cache_by_path.clear()
-            _mapping_signature_by_path.clear()
+        _, mapping_path_str, _ = self._resolve_mapping_path()
+        self._mapping_index_cache().invalidate(mapping_path_str)
 
     def _workspace_repo_path(self) -> Optional[Path]:
         if not self.workspace.id:
@@ -303,7 +371,7 @@ class RowLineageService:
             mtime=None,
             size=None,
             count=0,
-            by_target={},
+            store=None,
             mappings_as_target={},
             models=set(),
             roots=[],
@@ -322,50 +390,24 @@ class RowLineageService:
             return self._empty_mapping_index(mapping_path, mapping_path_str, resolve_warnings)
 
         stat = mapping_path.stat()
-        signature = (stat.st_mtime, stat.st_size)
-        cache_key = mapping_path_str
-        with _mapping_cache_lock:
-            cached = _mapping_cache_by_path.get(cache_key)
-            cached_signature = _mapping_signature_by_path.get(cache_key)
-        if cached and cached_signature == signature and cached.mapping_path == mapping_path:
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache = self._mapping_index_cache()
+        cached = cache.get(
+            mapping_path_str,
+            is_valid=lambda entry: entry.signature == signature and entry.mapping_path == mapping_path,
+        )
+        if cached is not None:
             if resolve_warnings:
                 merged_warnings = list(dict.fromkeys(cached.warnings + resolve_warnings))
                 return MappingIndex(**{**cached.__dict__, "warnings": merged_warnings})
             return cached
 
-        warnings: List[str] = list(resolve_warnings)
-        by_target: Dict[Tuple[str, str], List[MappingRecord]] = {}
-        mappings_as_target: Dict[str, int] = {}
-        models: Set[str] = set()
-        source_models: Set[str] = set()
-        target_models: Set[str] = set()
-
-        with mapping_path.open("r", encoding="utf-8") as handle:
-            for line_number, raw_line in enumerate(handle, start=1):
-                line = raw_line.strip()
-                if not line:
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    warnings.append(f"Invalid JSON in row lineage mapping at line {line_number}.")
-                    continue
-                record = MappingRecord.from_json(payload)
-                if not (record.source_model and record.target_model and record.source_trace_id and record.target_trace_id):
-                    warnings.append(f"Incomplete row lineage mapping at line {line_number}.")
-                    continue
-
-                key = (record.target_model, record.target_trace_id)
-                by_target.setdefault(key, []).append(record)
-                mappings_as_target[record.target_model] = mappings_as_target.get(record.target_model, 0) + 1
-                models.add(record.source_model)
-                models.add(record.target_model)
-                source_models.add(record.source_model)
-                target_models.add(record.target_model)
-
-        roots = sorted(target_models - source_models)
-        if not roots:
-            roots = sorted(target_models) if target_models else sorted(source_models)
+        try:
+            store = load_mapping_store(mapping_path)
+        except (OSError, ValueError) as exc:
+            warnings = list(resolve_warnings)
+            warnings.append(f"Failed to index row lineage mappings: {exc}")
+            return self._empty_mapping_index(mapping_path, mapping_path_str, warnings)
 
         index = MappingIndex(
             mapping_path=mapping_path,
@@ -373,16 +415,15 @@ class RowLineageService:
             available=True,
             mtime=stat.st_mtime,
             size=stat.st_size,
-            count=sum(len(v) for v in by_target.values()),
-            by_target=by_target,
-            mappings_as_target=mappings_as_target,
-            models=models,
-            roots=roots,
-            warnings=warnings,
+            count=store.count,
+            store=store,
+            mappings_as_target=dict(store.meta.get("mappings_as_target", {})),
+            models=set(store.models),
+            roots=list(store.meta.get("roots", [])),
+            warnings=list(resolve_warnings) + list(store.meta.get("warnings", [])),
+            signature=signature,
         )
-        with _mapping_cache_lock:
-            _mapping_cache_by_path[cache_key] = index
-            _mapping_signature_by_path[cache_key] = signature
+        cache.put(mapping_path_str, index, index.cache_size)
         return index
 
     # ---- Manifest helpers ----
@@ -513,15 +554,55 @@ class RowLineageService:
         connection_url = connection_url_for_environment(self.settings, environment)
         return get_engine(connection_url)
 
-    @staticmethod
-    def _has_trace_column(engine: Engine, schema: Optional[str], table: str) -> bool:
-        inspector = inspect(engine)
+    def _manifest_signature(self) -> Optional[str]:
+        if self._manifest_signature_cache is None:
+            self._manifest_signature_cache = self.artifact_service.get_artifact_signature("manifest.json") or ""
+        return self._manifest_signature_cache
+
+    def _table_schema(self, bind: Union[Engine, Connection], schema: Optional[str], table: str) -> TableSchema:
+        """Columns and primary key of ``schema.table``; ``columns`` is ``None`` when it cannot be introspected.
+
+        Results are shared per engine and reused until the TTL expires or a
+        new manifest version is loaded. Failed introspections are not cached.
+        """
+
+        key = (_engine_key(bind.engine), schema, table)
+        manifest_signature = self._manifest_signature()
+        now = time_module.monotonic()
+        ttl = self.settings.row_lineage_schema_cache_ttl_seconds
+        with _schema_cache_lock:
+            cached = _schema_cache.get(key)
+        if (
+            cached is not None
+            and cached.manifest_signature == manifest_signature
+            and now - cached.fetched_at < ttl
+        ):
+            return cached
+
+        inspector = inspect(bind)
+        primary_key: List[str] = []
         try:
-            columns = inspector.get_columns(table, schema=schema)
+            columns: Optional[List[str]] = [col.get("name") for col in inspector.get_columns(table, schema=schema)]
+            primary_key = list(inspector.get_pk_constraint(table, schema=schema).get("constrained_columns") or [])
         except SQLAlchemyError:
-            return False
-        column_names = {col.get("name") for col in columns}
-        return TRACE_COLUMN in column_names
+            columns = None
+        table_schema = TableSchema(
+            columns=columns,
+            primary_key=primary_key,
+            fetched_at=now,
+            manifest_signature=manifest_signature,
+        )
+        if columns is not None:
+            with _schema_cache_lock:
+                _schema_cache[key] = table_schema
+        return table_schema
+
+    def _table_columns(self, bind: Union[Engine, Connection], schema: Optional[str], table: str) -> Optional[List[str]]:
+        return self._table_schema(bind, schema, table).columns
+
+    def _has_trace_column(self, bind: Union[Engine, Connection], schema: Optional[str], table: str) -> bool:
+        columns = self._table_columns(bind, schema, table)
+        return columns is not None and TRACE_COLUMN in columns
 
     @staticmethod
     def _serialize_value(value: Any) -> Any:
@@ -542,35 +623,179 @@ class RowLineageService:
         return {key: self._serialize_value(value) for key, value in row.items()}
 
     def _fetch_rows(self, engine: Engine, relation_name: str, limit: int) -> List[Dict[str, Any]]:
-        sql = text(f"SELECT * FROM {relation_name} LIMIT :limit")
         with engine.connect() as conn:
-            result = conn.execute(sql, {"limit": limit})
-            return [dict(row._mapping) for row in result.fetchall()]
+            return self._scan_rows(conn, relation_name, limit)
+
+    @staticmethod
+    def _scan_rows(conn: Connection, relation_name: str, limit: int) -> List[Dict[str, Any]]:
+        sql = text(f"SELECT * FROM {relation_name} LIMIT :limit")
+        result = conn.execute(sql, {"limit": limit})
+        return [dict(row._mapping) for row in result.fetchall()]
+
+    def _relation_run_signature(self, relation: RelationInfo) -> str:
+        """Identify the build of ``relation`` so heuristic indexes expire when its model re-runs."""
+
+        if self._run_completions_cache is None:
+            completions: Dict[str, str] = {}
+            run_results = self.artifact_service.get_run_results() or {}
+            for result in run_results.get("results", []) or []:
+                timings = result.get("timing") or []
+                completed_at = timings[-1].get("completed_at") if timings else None
+                if result.get("unique_id") and completed_at:
+                    completions[result["unique_id"]] = str(completed_at)
+            self._run_completions_cache = completions
+        completed_at = self._run_completions_cache.get(relation.model_unique_id or "")
+        if completed_at:
+            return f"run:{completed_at}"
+        return f"manifest:{self._manifest_signature()}"
+
+    @staticmethod
+    def _iter_scan_chunks(conn: Connection, sql: str, limit: int) -> Iterable[List[Dict[str, Any]]]:
+        statement = text(sql).execution_options(stream_results=True)
+        result = conn.execute(statement, {"limit": limit})
+        for partition in result.partitions(HEURISTIC_SCAN_CHUNK_SIZE):
+            yield [dict(row._mapping) for row in partition]
 
-    def _fetch_row_by_trace(
+    @staticmethod
+    def _heuristic_trace_id(row: Dict[str, Any]) -> str:
+        if TRACE_COLUMN not in row:
+            row[TRACE_COLUMN] = new_trace_id(row)
+        return str(row.get(TRACE_COLUMN))
+
+    def _row_key_columns(self, conn: Connection, relation: RelationInfo) -> Optional[List[str]]:
+        """SQL expressions that identify one row of ``relation``, or ``None`` when it has no stable key."""
+
+        primary_key = self._table_schema(conn, relation.schema, relation.table).primary_key
+        if primary_key:
+            preparer = conn.dialect.identifier_preparer
+            return [preparer.quote(column) for column in primary_key]
+        if conn.dialect.name == "sqlite":
+            return ["rowid"]
+        return None
+
+    def _heuristic_index(
         self,
-        engine: Engine,
+        conn: Connection,
         relation: RelationInfo,
-        trace_id: str,
-    ) -> Tuple[Optional[Dict[str, Any]], bool]:
-        trace_column_present = self._has_trace_column(engine, relation.schema, relation.table)
+        key_columns: List[str],
+    ) -> row_lineage_heuristic_index.HeuristicTraceIndex:
+        scan_limit = max(1, self.settings.row_lineage_scan_max_rows)
+        index_dir = row_lineage_heuristic_index.index_dir_for(Path(self.workspace.artifacts_path))
+        key = row_lineage_heuristic_index.index_key(
+            _engine_key(conn.engine),
+            relation.relation_name,
+            scan_limit,
+        )
+        signature = self._relation_run_signature(relation)
+        index = row_lineage_heuristic_index.open_heuristic_index(index_dir, key, signature)
+        if index is not None:
+            return index
+
+        aliases = [f"{HEURISTIC_KEY_ALIAS}{position}" for position in range(len(key_columns))]
+        selected = ", ".join(f"{column} AS {alias}" for column, alias in zip(key_columns, aliases))
+
+        def trace_id_and_key(row: Dict[str, Any]) -> Tuple[str, List[Any]]:
+            # Key values are selected under aliases so they never enter the row hash.
+            row_key = [self._serialize_value(row.pop(alias)) for alias in aliases]
+            return self._heuristic_trace_id(row), row_key
+
+        return row_lineage_heuristic_index.build_heuristic_index(
+            index_dir,
+            key,
+            signature,
+            self._iter_scan_chunks(
+                conn, f"SELECT {selected}, * FROM {relation.relation_name} LIMIT :limit", scan_limit
+            ),
+            trace_id_and_key,
+        )
 
-        if trace_column_present:
+    def _fetch_rows_by_key(
+        self,
+        conn: Connection,
+        relation: RelationInfo,
+        key_columns: List[str],
+        row_keys: Dict[str, List[Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch indexed rows by key, keeping those whose values still hash to the indexed trace id."""
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        items = list(row_keys.items())
+        for start in range(0, len(items), TRACE_FETCH_BATCH_SIZE):
+            batch = items[start:start + TRACE_FETCH_BATCH_SIZE]
+            params: Dict[str, Any] = {}
+            if len(key_columns) == 1:
+                sql = text(
+                    f"SELECT * FROM {relation.relation_name} WHERE {key_columns[0]} IN :keys"
+                ).bindparams(bindparam("keys", expanding=True))
+                params["keys"] = [row_key[0] for _, row_key in batch]
+            else:
+                clauses = []
+                for row_index, (_, row_key) in enumerate(batch):
+                    terms = []
+                    for column_index, column in enumerate(key_columns):
+                        name = f"k{row_index}_{column_index}"
+                        terms.append(f"{column} = :{name}")
+                        params[name] = row_key[column_index]
+                    clauses.append("(" + " AND ".join(terms) + ")")
+                sql = text(f"SELECT * FROM {relation.relation_name} WHERE " + " OR ".join(clauses))
+            wanted = {trace_id for trace_id, _ in batch}
+            for row in conn.execute(sql, params):
+                payload = dict(row._mapping)
+                trace_id = self._heuristic_trace_id(payload)
+                if trace_id in wanted:
+                    rows.setdefault(trace_id, payload)
+        return rows
+
+    def _fetch_rows_by_trace(
+        self,
+        conn: Connection,
+        relation: RelationInfo,
+        trace_ids: Iterable[str],
+    ) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """Fetch the rows for many trace ids of one relation.
+
+        Tables with a trace column are queried with batched ``IN (...)``
+        lookups; the first row per trace id wins. Other tables with a primary
+        key or row id are looked up in an on-disk index mapping heuristic
+        trace ids to row keys, built on first use; the rest are scanned.
+        """
+
+        wanted = list(dict.fromkeys(trace_ids))
+        rows: Dict[str, Dict[str, Any]] = {}
+        if not wanted:
+            return rows, True
+
+        if self._has_trace_column(conn, relation.schema, relation.table):
             sql = text(
-                f"SELECT * FROM {relation.relation_name} WHERE {TRACE_COLUMN} = :trace_id LIMIT 1"
-            )
-            with engine.connect() as conn:
-                result = conn.execute(sql, {"trace_id": trace_id}).fetchone()
-                return (dict(result._mapping), True) if result else (None, True)
+                f"SELECT * FROM {relation.relation_name} WHERE {TRACE_COLUMN} IN :trace_ids"
+            ).bindparams(bindparam("trace_ids", expanding=True))
+            for start in range(0, len(wanted), TRACE_FETCH_BATCH_SIZE):
+                batch = wanted[start:start + TRACE_FETCH_BATCH_SIZE]
+                for row in conn.execute(sql, {"trace_ids": batch}):
+                    payload = dict(row._mapping)
+                    rows.setdefault(str(payload.get(TRACE_COLUMN)), payload)
+            return rows, True
+
+        key_columns = self._row_key_columns(conn, relation)
+        if key_columns:
+            try:
+                index = self._heuristic_index(conn, relation, key_columns)
+                row_keys = index.lookup(wanted)
+            except (OSError, sqlite3.Error):
+                row_keys = None
+            if row_keys is not None:
+                return self._fetch_rows_by_key(conn, relation, key_columns, row_keys), False
 
         scan_limit = max(1, self.settings.row_lineage_scan_max_rows)
-        rows = self._fetch_rows(engine, relation.relation_name, scan_limit)
-        for row in rows:
-            if TRACE_COLUMN not in row:
-                row[TRACE_COLUMN] = new_trace_id(row)
-            if str(row.get(TRACE_COLUMN)) == trace_id:
-                return row, False
-        return None, False
+        remaining = set(wanted)
+        for row in self._scan_rows(conn, relation.relation_name, scan_limit):
+            trace_id = self._heuristic_trace_id(row)
+            if trace_id in remaining:
+                rows[trace_id] = row
+                remaining.discard(trace_id)
+                if not remaining:
+                    break
+        return rows, False
 
     # ---- Public API ----
 
@@ -660,6 +885,8 @@ class RowLineageService:
             roots=mapping_index.roots,
             models=sorted(mapping_index.models),
             warnings=warnings,
+            index_cache=RowLineageCacheStats(**self._mapping_index_cache().stats()),
+            trace_cache=RowLineageCacheStats(**self._trace_cache().stats()),
         )
 
     def list_models(self) -> RowLineageModelsResponse:
@@ -714,11 +941,7 @@ class RowLineageService:
         if enriched_rows:
             columns = list(enriched_rows[0].keys())
         else:
-            inspector = inspect(engine)
-            try:
-                columns = [col.get("name") for col in inspector.get_columns(relation.table, schema=relation.schema)]
-            except SQLAlchemyError:
-                columns = []
+            columns = list(self._table_columns(engine, relation.schema, relation.table) or [])
         if TRACE_COLUMN not in columns:
             columns.append(TRACE_COLUMN)
 
@@ -740,6 +963,145 @@ class RowLineageService:
             warnings=warnings,
         )
 
+    @staticmethod
+    def _encode_cursor(payload: Dict[str, Any]) -> str:
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Dict[str, Any]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise InvalidCursorError("Invalid preview cursor") from exc
+        if not isinstance(payload, dict) or not (
+            isinstance(payload.get("after"), list) or isinstance(payload.get("offset"), int)
+        ):
+            raise InvalidCursorError("Invalid preview cursor")
+        return payload
+
+    def _preview_page_sql(
+        self,
+        engine: Engine,
+        relation: RelationInfo,
+        key_columns: List[str],
+        cursor: Optional[Dict[str, Any]],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        params: Dict[str, Any] = {}
+        if not key_columns:
+            params["offset"] = int(cursor.get("offset", 0)) if cursor else 0
+            return text(f"SELECT * FROM {relation.relation_name} LIMIT :limit OFFSET :offset"), params
+
+        quote = engine.dialect.identifier_preparer.quote
+        quoted = [quote(column) for column in key_columns]
+        where = ""
+        after = cursor.get("after") if cursor else None
+        if after is not None:
+            if len(after) != len(key_columns):
+                raise InvalidCursorError("Invalid preview cursor")
+            # (k1, k2, ...) > (:k1, :k2, ...) spelled out for dialects without row values.
+            clauses = []
+            for position, column in enumerate(quoted):
+                equal = [f"{quoted[index]} = :after_{index}" for index in range(position)]
+                clauses.append(" AND ".join(equal + [f"{column} > :after_{position}"]))
+                params[f"after_{position}"] = after[position]
+            where = "WHERE " + " OR ".join(f"({clause})" for clause in clauses) + " "
+        order_by = ", ".join(quoted)
+        return text(f"SELECT * FROM {relation.relation_name} {where}ORDER BY {order_by} LIMIT :limit"), params
+
+    def stream_preview(
+        self,
+        model_unique_id: str,
+        environment_id: Optional[int],
+        cursor: Optional[str],
+        limit: Optional[int],
+    ) -> Iterator[str]:
+        """Stream one page of preview rows as NDJSON lines.
+
+        The first line describes the relation, each following line holds one
+        row, and the last line carries ``next_cursor`` for the following page.
+        Pages are keyset-paginated on the primary key (or the trace column)
+        so deep pages do not re-read earlier rows; relations without either
+        fall back to offset pagination.
+        """
+
+        warnings: List[str] = []
+        seen: Set[str] = set()
+        relation = self._relation_for_unique_id(model_unique_id, warnings, seen)
+        if relation is None:
+            raise ValueError("Model not found in manifest")
+        decoded = self._decode_cursor(cursor) if cursor else None
+        page_size = PREVIEW_STREAM_DEFAULT_PAGE_SIZE if limit is None else max(1, min(limit, PREVIEW_STREAM_MAX_PAGE_SIZE))
+
+        engine = self._engine_for_environment(environment_id)
+        table_schema = self._table_schema(engine, relation.schema, relation.table)
+        columns = list(table_schema.columns or [])
+        trace_column_present = TRACE_COLUMN in columns
+        if TRACE_COLUMN not in columns:
+            columns.append(TRACE_COLUMN)
+        key_columns = list(table_schema.primary_key) or ([TRACE_COLUMN] if trace_column_present else [])
+        if not key_columns:
+            warnings.append("Relation has no primary key or trace column; pages use offset pagination.")
+        if not trace_column_present:
+            warnings.append(
+                "Table does not contain _row_trace_id; trace ids are computed heuristically for browsing."
+            )
+        sql, params = self._preview_page_sql(engine, relation, key_columns, decoded)
+        params["limit"] = page_size + 1
+
+        def generate() -> Iterator[str]:
+            yield json.dumps(
+                {
+                    "type": "meta",
+                    "model_unique_id": model_unique_id,
+                    "model_name": relation.model_name,
+                    "relation_name": relation.relation_name,
+                    "schema": relation.schema,
+                    "database": relation.database,
+                    "trace_column": TRACE_COLUMN,
+                    "trace_column_present": trace_column_present,
+                    "columns": columns,
+                    "pagination": "keyset" if key_columns else "offset",
+                    "warnings": warnings,
+                }
+            ) + "\n"
+
+            emitted = 0
+            has_more = False
+            last_row: Optional[Dict[str, Any]] = None
+            with engine.connect() as conn:
+                result = conn.execute(sql.execution_options(stream_results=True), params)
+                for partition in result.partitions(PREVIEW_STREAM_BATCH_SIZE):
+                    batch = [dict(row._mapping) for row in partition]
+                    if emitted + len(batch) > page_size:
+                        has_more = True
+                        batch = batch[: page_size - emitted]
+                    if not trace_column_present:
+                        trace_ids = [new_trace_id(row) for row in batch]
+                        for row, row_trace_id in zip(batch, trace_ids):
+                            row[TRACE_COLUMN] = row_trace_id
+                    lines = [json.dumps({"type": "row", "row": self._serialize_row(row)}) for row in batch]
+                    if lines:
+                        yield "\n".join(lines) + "\n"
+                    emitted += len(batch)
+                    if batch:
+                        last_row = batch[-1]
+                    if has_more:
+                        break
+
+            next_cursor: Optional[str] = None
+            if has_more and last_row is not None:
+                if key_columns:
+                    after = [self._serialize_value(last_row.get(column)) for column in key_columns]
+                    next_cursor = self._encode_cursor({"after": after})
+                else:
+                    offset = (decoded or {}).get("offset", 0) + emitted
+                    next_cursor = self._encode_cursor({"offset": offset})
+            yield json.dumps({"type": "end", "count": emitted, "next_cursor": next_cursor}) + "\n"
+
+        return generate()
+
     @staticmethod
     def _node_id(model_name: str, trace_id: str) -> str:
         return f"row:{model_name}:{trace_id}"
@@ -756,7 +1118,73 @@ class RowLineageService:
         environment_id: Optional[int],
         max_hops: Optional[int],
     ) -> RowLineageTraceResponse:
+        """Follow mappings upstream: which rows the selected row was built from."""
+
+        return self._trace(model_unique_id, trace_id, environment_id, max_hops, downstream=False)
+
+    def get_downstream_trace(
+        self,
+        model_unique_id: str,
+        trace_id: str,
+        environment_id: Optional[int],
+        max_hops: Optional[int],
+    ) -> RowLineageTraceResponse:
+        """Follow mappings downstream: which rows the selected row fed into."""
+
+        return self._trace(model_unique_id, trace_id, environment_id, max_hops, downstream=True)
+
+    def _trace(
+        self,
+        model_unique_id: str,
+        trace_id: str,
+        environment_id: Optional[int],
+        max_hops: Optional[int],
+        downstream: bool,
+    ) -> RowLineageTraceResponse:
+        """Return a cached trace graph, building it when none is cached for the current artifacts."""
+
         mapping_index = self._load_mapping_index()
+
+        effective_max_hops = self.settings.row_lineage_max_hops
+        if max_hops is not None:
+            effective_max_hops = max(1, min(max_hops, self.settings.row_lineage_max_hops))
+
+        cache = self._trace_cache()
+        cache_key = (
+            self.workspace.key,
+            str(self.workspace.artifacts_path),
+            model_unique_id,
+            trace_id,
+            effective_max_hops,
+            environment_id,
+            "downstream" if downstream else "upstream",
+            mapping_index.mapping_path_str,
+            mapping_index.signature,
+            self._manifest_signature(),
+            # A model rerun rewrites the rows a trace reads.
+            self.artifact_service.get_artifact_signature("run_results.json"),
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        response = self._build_trace(
+            mapping_index, model_unique_id, trace_id, environment_id, effective_max_hops, downstream
+        )
+        # Graphs cut short by the deadline are not cached so the next request can complete them.
+        if TRACE_TIMEOUT_WARNING not in response.warnings:
+            cache.put(cache_key, response.model_copy(deep=True), len(response.model_dump_json()))
+        return response
+
+    def _build_trace(
+        self,
+        mapping_index: MappingIndex,
+        model_unique_id: str,
+        trace_id: str,
+        environment_id: Optional[int],
+        effective_max_hops: int,
+        downstream: bool,
+    ) -> RowLineageTraceResponse:
         warnings = list(mapping_index.warnings)
         seen = set(warnings)
 
@@ -764,10 +1192,6 @@ class RowLineageService:
         if relation is None:
             raise ValueError("Model not found in manifest")
 
-        effective_max_hops = self.settings.row_lineage_max_hops
-        if max_hops is not None:
-            effective_max_hops = max(1, min(max_hops, self.settings.row_lineage_max_hops))
-
         engine = self._engine_for_environment(environment_id)
 
         relation_cache: Dict[str, Optional[RelationInfo]] = {relation.model_name: relation}
@@ -780,31 +1204,70 @@ class RowLineageService:
             relation_cache[model_name] = resolved
             return resolved
 
-        def fetch_row(model_name: str, row_trace_id: str) -> Optional[Dict[str, Any]]:
-            cache_key = (model_name, row_trace_id)
-            if cache_key in row_cache:
-                return row_cache[cache_key]
-
-            rel = resolve_relation(model_name)
-            if rel is None:
-                row_cache[cache_key] = None
-                return None
-
-            row, trace_column_present = self._fetch_row_by_trace(engine, rel, row_trace_id)
-            if row and TRACE_COLUMN not in row:
-                row[TRACE_COLUMN] = row_trace_id
-            serialized = self._serialize_row(row) if row else None
-            row_cache[cache_key] = serialized
-
-            if not trace_column_present:
-                self._add_warning(
-                    warnings,
-                    seen,
-                    "Some tables do not contain _row_trace_id; trace ids are computed heuristically for browsing.",
-                )
-            return serialized
-
-        target_row = fetch_row(relation.model_name, trace_id)
+        deadline = time_module.monotonic() + max(0.0, self.settings.row_lineage_trace_timeout_seconds)
+        concurrency = max(1, self.settings.row_lineage_fetch_concurrency)
+
+        def fetch_relation(rel: RelationInfo, trace_ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+            with engine.connect() as worker_conn:
+                return self._fetch_rows_by_trace(worker_conn, rel, trace_ids)
+
+        def fetch_rows(
+            conn: Connection,
+            pool: Optional[ThreadPoolExecutor],
+            keys: Iterable[Tuple[str, str]],
+        ) -> bool:
+            """Fill ``row_cache`` for ``keys``; return ``False`` if the deadline cut it short."""
+
+            pending: Dict[str, List[str]] = {}
+            for model_name, row_trace_id in keys:
+                if (model_name, row_trace_id) not in row_cache:
+                    pending.setdefault(model_name, []).append(row_trace_id)
+
+            jobs: List[Tuple[str, RelationInfo, List[str]]] = []
+            for model_name, trace_ids in pending.items():
+                rel = resolve_relation(model_name)
+                if rel is None:
+                    for row_trace_id in trace_ids:
+                        row_cache[(model_name, row_trace_id)] = None
+                    continue
+                jobs.append((model_name, rel, trace_ids))
+
+            results: Dict[str, Tuple[Dict[str, Dict[str, Any]], bool]] = {}
+            completed = True
+            if pool is None or len(jobs) < 2:
+                for model_name, rel, trace_ids in jobs:
+                    if time_module.monotonic() >= deadline:
+                        completed = False
+                        break
+                    results[model_name] = self._fetch_rows_by_trace(conn, rel, trace_ids)
+            else:
+                futures: Dict[Future, str] = {
+                    pool.submit(fetch_relation, rel, trace_ids): model_name for model_name, rel, trace_ids in jobs
+                }
+                done, not_done = wait(futures, timeout=max(0.0, deadline - time_module.monotonic()))
+                for future in not_done:
+                    future.cancel()
+                completed = not not_done
+                for future in done:
+                    results[futures[future]] = future.result()
+
+            for model_name, rel, trace_ids in jobs:
+                if model_name not in results:
+                    continue
+                rows, trace_column_present = results[model_name]
+                for row_trace_id in trace_ids:
+                    row = rows.get(row_trace_id)
+                    if row and TRACE_COLUMN not in row:
+                        row[TRACE_COLUMN] = row_trace_id
+                    row_cache[(model_name, row_trace_id)] = self._serialize_row(row) if row else None
+
+                if not trace_column_present:
+                    self._add_warning(
+                        warnings,
+                        seen,
+                        "Some tables do not contain _row_trace_id; trace ids are computed heuristically for browsing.",
+                    )
+            return completed
 
         nodes: Dict[str, RowLineageNode] = {}
         edges: Dict[Tuple[str, str], RowLineageEdge] = {}
@@ -833,50 +1296,90 @@ class RowLineageService:
             )
             return node_id
 
-        start_id = ensure_node(relation.model_name, trace_id, target_row)
-
-        queue: List[Tuple[str, str, int]] = [(relation.model_name, trace_id, 0)]
-        visited: Set[Tuple[str, str]] = {(relation.model_name, trace_id)}
+        start_key = (relation.model_name, trace_id)
+        visited: Set[Tuple[str, str]] = {start_key}
         truncated = False
 
-        while queue:
-            current_model, current_trace_id, depth = queue.pop(0)
-            current_row = row_cache.get((current_model, current_trace_id))
-            ensure_node(current_model, current_trace_id, current_row)
-
-            parents = mapping_index.by_target.get((current_model, current_trace_id), [])
-            if not parents:
-                continue
-
-            if depth >= effective_max_hops:
-                truncated = True
-                continue
-
-            for mapping in parents:
-                source_row = fetch_row(mapping.source_model, mapping.source_trace_id)
-                target_row_for_hop = fetch_row(mapping.target_model, mapping.target_trace_id)
-
-                source_id = ensure_node(mapping.source_model, mapping.source_trace_id, source_row)
-                target_id = ensure_node(mapping.target_model, mapping.target_trace_id, target_row_for_hop)
-
-                edges[(source_id, target_id)] = RowLineageEdge(source=source_id, target=target_id)
-                hops.append(
-                    RowLineageHop(
-                        source_model=mapping.source_model,
-                        target_model=mapping.target_model,
-                        source_trace_id=mapping.source_trace_id,
-                        target_trace_id=mapping.target_trace_id,
-                        compiled_sql=mapping.compiled_sql,
-                        executed_at=mapping.executed_at,
-                        source_row=source_row,
-                        target_row=target_row_for_hop,
+        # Walk the mappings one hop at a time so every relation is queried
+        # once per level. Relations of the same level are fetched in parallel
+        # on pooled connections when more than one needs rows.
+        pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="row-lineage") if concurrency > 1 else None
+        try:
+            with engine.connect() as conn:
+                trace_completed = fetch_rows(conn, pool, [start_key])
+                target_row = row_cache.get(start_key)
+                start_id = ensure_node(relation.model_name, trace_id, target_row)
+
+                frontier: List[Tuple[str, str]] = [start_key] if trace_completed else []
+                depth = 0
+                while frontier:
+                    if time_module.monotonic() >= deadline:
+                        trace_completed = False
+                        break
+                    level_mappings: List[MappingRecord] = []
+                    for current_model, current_trace_id in frontier:
+                        ensure_node(current_model, current_trace_id, row_cache.get((current_model, current_trace_id)))
+                        if downstream:
+                            neighbours = mapping_index.children(current_model, current_trace_id)
+                        else:
+                            neighbours = mapping_index.parents(current_model, current_trace_id)
+                        if not neighbours:
+                            continue
+                        if depth >= effective_max_hops:
+                            truncated = True
+                            continue
+                        level_mappings.extend(neighbours)
+
+                    level_completed = fetch_rows(
+                        conn,
+                        pool,
+                        [(mapping.source_model, mapping.source_trace_id) for mapping in level_mappings]
+                        + [(mapping.target_model, mapping.target_trace_id) for mapping in level_mappings],
                     )
-                )
 
-                source_key = (mapping.source_model, mapping.source_trace_id)
-                if source_key not in visited:
-                    visited.add(source_key)
-                    queue.append((mapping.source_model, mapping.source_trace_id, depth + 1))
+                    next_frontier: List[Tuple[str, str]] = []
+                    for mapping in level_mappings:
+                        source_row = row_cache.get((mapping.source_model, mapping.source_trace_id))
+                        target_row_for_hop = row_cache.get((mapping.target_model, mapping.target_trace_id))
+
+                        source_id = ensure_node(mapping.source_model, mapping.source_trace_id, source_row)
+                        target_id = ensure_node(mapping.target_model, mapping.target_trace_id, target_row_for_hop)
+
+                        edges[(source_id, target_id)] = RowLineageEdge(source=source_id, target=target_id)
+                        hops.append(
+                            RowLineageHop(
+                                source_model=mapping.source_model,
+                                target_model=mapping.target_model,
+                                source_trace_id=mapping.source_trace_id,
+                                target_trace_id=mapping.target_trace_id,
+                                compiled_sql=mapping.compiled_sql,
+                                executed_at=mapping.executed_at,
+                                source_row=source_row,
+                                target_row=target_row_for_hop,
+                            )
+                        )
+
+                        if downstream:
+                            next_key = (mapping.target_model, mapping.target_trace_id)
+                        else:
+                            next_key = (mapping.source_model, mapping.source_trace_id)
+                        if next_key not in visited:
+                            visited.add(next_key)
+                            next_frontier.append(next_key)
+
+                    if not level_completed:
+                        # Keep the edges of this hop but stop expanding once the deadline passed.
+                        trace_completed = False
+                        break
+                    frontier = next_frontier
+                    depth += 1
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        if not trace_completed:
+            truncated = True
+            self._add_warning(warnings, seen, TRACE_TIMEOUT_WARNING)
 
         target = RowLineageTarget(
             model_unique_id=relation.model_unique_id,
@@ -910,4 +1413,11 @@ class RowLineageService:
                 )
             )
 
-        return RowLineageTraceResponse(target=target, graph=graph, hops=hops, truncated=truncated, warnings=warnings)
+        return RowLineageTraceResponse(
+            target=target,
+            graph=graph,
+            hops=hops,
+            truncated=truncated,
+            direction="downstream" if downstream else "upstream",
+            warnings=warnings,
+        )
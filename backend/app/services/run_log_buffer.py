@@ -0,0 +1,177 @@
+"""Bounded per-run log buffer with sequence numbers and push notification."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple, Union, overload
+
+logger = logging.getLogger(__name__)
+
+
+class RunLogBuffer(Sequence):
+    """Ring buffer of log lines for one run.
+
+    Every appended line gets a monotonically increasing sequence number
+    starting at 1, so subscribers can resume after the last line they saw
+    even once older lines have been evicted. Appends are O(1), safe from any
+    thread, and wake asyncio subscribers waiting in :meth:`wait_for`.
+    Each line may carry an opaque ``meta`` object (e.g. a parsed log record).
+    ``sink``, when given, receives every line in order (e.g. a durable log file).
+    It is called outside the buffer lock so slow I/O never blocks readers; a
+    sink that raises ``OSError`` is logged and dropped rather than failing the
+    writer.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        lines: Iterable[str] = (),
+        sink: Optional[Callable[[str], None]] = None,
+    ):
+        self._sink = sink
+        self._lines: deque[str] = deque(maxlen=max(1, capacity))
+        self._meta: deque[Any] = deque(maxlen=max(1, capacity))
+        self._next_seq = 1
+        self._closed = False
+        self._lock = threading.Lock()
+        # Serializes sink calls so lines reach it in sequence order.
+        self._sink_lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        for line in lines:
+            self.append(line)
+
+    # ---- Sequence protocol (read access for existing list-style callers) ----
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._lines)[index]
+            return self._lines[index]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._lines))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RunLogBuffer):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RunLogBuffer(first_seq={self.first_seq}, last_seq={self.last_seq}, closed={self._closed})"
+
+    # ---- writing ----
+
+    def append(self, line: str, meta: Any = None) -> int:
+        """Add ``line`` and return its sequence number."""
+
+        with self._sink_lock:
+            with self._lock:
+                seq = self._next_seq
+                self._lines.append(line)
+                self._meta.append(meta)
+                self._next_seq += 1
+            if self._sink is not None:
+                try:
+                    self._sink(line)
+                except OSError:
+                    logger.exception("Log sink failed at line %d; continuing without it", seq)
+                    self._sink = None
+        self._notify()
+        return seq
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+    def close(self) -> None:
+        """Mark the run's output as complete and wake every subscriber."""
+
+        with self._lock:
+            self._closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        with self._lock:
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The subscriber's loop has been closed.
+                with self._lock:
+                    self._waiters.discard((loop, event))
+
+    # ---- reading ----
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest line, or 0 when nothing was written."""
+
+        return self._next_seq - 1
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest line still retained."""
+
+        with self._lock:
+            return self._next_seq - len(self._lines)
+
+    def since(self, seq: int) -> List[Tuple[int, str]]:
+        """Retained lines with a sequence number greater than ``seq``."""
+
+        with self._lock:
+            first = self._next_seq - len(self._lines)
+            start = max(seq + 1, first)
+            return [(number, self._lines[number - first]) for number in range(start, self._next_seq)]
+
+    def entries_since(self, seq: int) -> List[Tuple[int, str, Any]]:
+        """Like :meth:`since`, including each line's ``meta``."""
+
+        with self._lock:
+            first = self._next_seq - len(self._lines)
+            start = max(seq + 1, first)
+            return [
+                (number, self._lines[number - first], self._meta[number - first])
+                for number in range(start, self._next_seq)
+            ]
+
+    async def wait_for(self, seq: int, timeout: Optional[float] = None) -> bool:
+        """Wait until a line newer than ``seq`` exists or the buffer is closed.
+
+        Returns ``False`` when ``timeout`` elapsed first.
+        """
+
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            if self._next_seq - 1 > seq or self._closed:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
@@ -0,0 +1,249 @@
+"""Append-only on-disk run logs with a sparse line offset index.
+
+Each run writes its output to ``<run artifacts>/logs/run.log`` one line at a
+time. The writer records the byte offset of every ``INDEX_BLOCK_LINES``-th
+line so any line range, including the tail, is read by seeking to the
+nearest block instead of scanning the whole file. When a run finishes the
+index is written next to the log as ``run.log.idx``; with compression
+enabled the log is rewritten as ``run.log.gz`` made of one gzip member per
+index block, which keeps range reads to a single member's worth of
+decompression.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+LOG_FILENAME = "run.log"
+COMPRESSED_LOG_FILENAME = "run.log.gz"
+INDEX_FILENAME = "run.log.idx"
+INDEX_FORMAT_VERSION = 1
+INDEX_BLOCK_LINES = 256
+# The live log is flushed every FLUSH_LINES lines or FLUSH_INTERVAL seconds,
+# and before every in-process read, so readers never miss buffered output.
+FLUSH_LINES = 64
+FLUSH_INTERVAL = 0.5
+
+
+@dataclass
+class RunLogSlice:
+    first_line: int  # 1-based number of the first returned line
+    lines: List[str]
+    total_lines: int
+    complete: bool
+
+
+def _encode_line(line: str) -> bytes:
+    # Lines are newline-delimited on disk; keep embedded newlines visible.
+    return line.replace("\r\n", "\n").replace("\n", "\\n").encode("utf-8") + b"\n"
+
+
+def _decode_lines(data: bytes) -> List[str]:
+    return [line.decode("utf-8", errors="replace") for line in data.split(b"\n")[:-1]]
+
+
+@dataclass
+class _LogIndex:
+    path: Path
+    compressed: bool
+    offsets: List[int]
+    total_lines: int
+    size: int
+
+    def read(self, start: int, limit: int) -> List[str]:
+        """Return up to ``limit`` lines starting at 0-based line ``start``."""
+
+        end = min(self.total_lines, start + limit)
+        if start >= end:
+            return []
+        block = start // INDEX_BLOCK_LINES
+        lines: List[str] = []
+        with self.path.open("rb") as handle:
+            if self.compressed:
+                first = block * INDEX_BLOCK_LINES
+                while first < end and block < len(self.offsets):
+                    member_end = self.offsets[block + 1] if block + 1 < len(self.offsets) else self.size
+                    handle.seek(self.offsets[block])
+                    member = _decode_lines(gzip.decompress(handle.read(member_end - self.offsets[block])))
+                    lines.extend(member[max(0, start - first):end - first])
+                    first += len(member)
+                    block += 1
+                return lines
+            handle.seek(self.offsets[block])
+            for _ in range(start - block * INDEX_BLOCK_LINES):
+                handle.readline()
+            for _ in range(end - start):
+                raw = handle.readline()
+                if not raw.endswith(b"\n"):
+                    break
+                lines.append(raw[:-1].decode("utf-8", errors="replace"))
+        return lines
+
+
+def _slice(index: _LogIndex, start: int, limit: int, tail: Optional[int], complete: bool) -> RunLogSlice:
+    if tail is not None:
+        start = max(0, index.total_lines - tail)
+        limit = tail
+    return RunLogSlice(
+        first_line=start + 1,
+        lines=index.read(start, limit),
+        total_lines=index.total_lines,
+        complete=complete,
+    )
+
+
+class RunLogWriter:
+    """Appends lines to a run's log file and keeps its offset index in memory."""
+
+    def __init__(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.path = directory / LOG_FILENAME
+        self._handle = self.path.open("wb")
+        self._lock = threading.Lock()
+        self._offsets: List[int] = []
+        self._lines = 0
+        self._size = 0
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+        self._closed = False
+
+    def write(self, line: str) -> None:
+        data = _encode_line(line)
+        with self._lock:
+            if self._closed:
+                return
+            if self._lines % INDEX_BLOCK_LINES == 0:
+                self._offsets.append(self._size)
+            self._handle.write(data)
+            self._size += len(data)
+            self._lines += 1
+            self._unflushed += 1
+            if self._unflushed >= FLUSH_LINES or time.monotonic() - self._flushed_at >= FLUSH_INTERVAL:
+                self._flush()
+
+    def flush(self) -> None:
+        """Push buffered lines to disk for readers in other processes."""
+
+        with self._lock:
+            if not self._closed and self._unflushed:
+                self._flush()
+
+    def _flush(self) -> None:
+        self._handle.flush()
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+
+    def read(self, start: int = 0, limit: int = 1000, tail: Optional[int] = None) -> RunLogSlice:
+        with self._lock:
+            if self._closed:
+                snapshot = None
+            else:
+                if self._unflushed:
+                    self._flush()
+                snapshot = _LogIndex(self.path, False, list(self._offsets), self._lines, self._size)
+        if snapshot is None:
+            result = read_run_log(self.directory, start, limit, tail)
+            return result or RunLogSlice(first_line=1, lines=[], total_lines=0, complete=True)
+        return _slice(snapshot, start, limit, tail, complete=False)
+
+    def close(self, compress: bool = False) -> None:
+        """Finish the log, optionally compress it, and persist the index."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._handle.close()
+            offsets, lines, size = list(self._offsets), self._lines, self._size
+
+        compressed = False
+        if compress and lines:
+            offsets, size = _compress_log(self.path, self.directory / COMPRESSED_LOG_FILENAME)
+            self.path.unlink()
+            compressed = True
+        _write_index(self.directory, offsets, lines, size, compressed)
+
+
+def _compress_log(source: Path, destination: Path) -> tuple[List[int], int]:
+    """Rewrite ``source`` as one gzip member per index block; return the member offsets and size."""
+
+    offsets: List[int] = []
+    staging = destination.with_name(f"{destination.name}.tmp")
+    with source.open("rb") as reader, staging.open("wb") as writer:
+        position = 0
+        while True:
+            block = [reader.readline() for _ in range(INDEX_BLOCK_LINES)]
+            data = b"".join(block)
+            if not data:
+                break
+            member = gzip.compress(data)
+            offsets.append(position)
+            writer.write(member)
+            position += len(member)
+    os.replace(staging, destination)
+    return offsets, position
+
+
+def _write_index(directory: Path, offsets: List[int], lines: int, size: int, compressed: bool) -> None:
+    payload = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "block_lines": INDEX_BLOCK_LINES,
+        "lines": lines,
+        "size": size,
+        "compressed": compressed,
+        "offsets": offsets,
+    }
+    staging = directory / f"{INDEX_FILENAME}.tmp"
+    staging.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(staging, directory / INDEX_FILENAME)
+
+
+def _load_index(directory: Path) -> Optional[_LogIndex]:
+    try:
+        payload = json.loads((directory / INDEX_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.get("format_version") != INDEX_FORMAT_VERSION or payload.get("block_lines") != INDEX_BLOCK_LINES:
+        return None
+    compressed = bool(payload.get("compressed"))
+    path = directory / (COMPRESSED_LOG_FILENAME if compressed else LOG_FILENAME)
+    if not path.exists():
+        return None
+    return _LogIndex(path, compressed, list(payload.get("offsets", [])), int(payload.get("lines", 0)), int(payload.get("size", 0)))
+
+
+def _scan_index(path: Path) -> _LogIndex:
+    """Index a log that has no index file yet (written by another process or interrupted)."""
+
+    offsets: List[int] = []
+    lines = 0
+    size = 0
+    with path.open("rb") as handle:
+        for raw in handle:
+            if not raw.endswith(b"\n"):
+                break
+            if lines % INDEX_BLOCK_LINES == 0:
+                offsets.append(size)
+            size += len(raw)
+            lines += 1
+    return _LogIndex(path, False, offsets, lines, size)
+
+
+def read_run_log(directory: Path, start: int = 0, limit: int = 1000, tail: Optional[int] = None) -> Optional[RunLogSlice]:
+    """Read lines ``[start, start + limit)`` (0-based) or the last ``tail`` lines of a stored log."""
+
+    index = _load_index(directory)
+    if index is not None:
+        return _slice(index, start, limit, tail, complete=True)
+    plain = directory / LOG_FILENAME
+    if plain.exists():
+        return _slice(_scan_index(plain), start, limit, tail, complete=False)
+    return None
@@ -0,0 +1,138 @@
+"""Priority queue that hands out dbt execution slots.
+
+Runs are queued when they are created and wait for a slot when their
+execution starts. Slots are bounded globally (``MAX_CONCURRENT_RUNS``) and
+optionally per workspace (``MAX_CONCURRENT_RUNS_PER_WORKSPACE``). When a slot
+frees up the next run is chosen by priority (interactive before scheduled
+before backfill), then by how many runs its workspace already has running so
+busy workspaces do not starve others, then first in, first out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.schemas.execution import RunPriority
+
+PRIORITY_RANK = {
+    RunPriority.INTERACTIVE: 0,
+    RunPriority.SCHEDULED: 1,
+    RunPriority.BACKFILL: 2,
+}
+
+
+@dataclass
+class _QueuedRun:
+    run_id: str
+    rank: int
+    seq: int
+    workspace_key: str
+    # Set once execute_run asks for a slot; only ready runs are dispatched.
+    ready: bool = False
+    granted: bool = False
+    wakeup: Optional[asyncio.Event] = field(default=None, repr=False)
+
+
+class RunQueue:
+    def __init__(self, max_running: int, max_running_per_workspace: int = 0):
+        self.max_running = max_running
+        self.max_running_per_workspace = max_running_per_workspace
+        self._counter = itertools.count()
+        self._pending: Dict[str, _QueuedRun] = {}
+        self._running: Dict[str, str] = {}  # run_id -> workspace_key
+
+    def configure(self, max_running: int, max_running_per_workspace: int = 0) -> None:
+        self.max_running = max_running
+        self.max_running_per_workspace = max_running_per_workspace
+        self._dispatch()
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running)
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._pending)
+
+    def _running_in(self, workspace_key: str) -> int:
+        return sum(1 for key in self._running.values() if key == workspace_key)
+
+    def _order(self, entry: _QueuedRun) -> Tuple[int, int, int]:
+        return entry.rank, self._running_in(entry.workspace_key), entry.seq
+
+    def enqueue(self, run_id: str, priority: RunPriority, workspace_key: str) -> None:
+        if run_id in self._pending or run_id in self._running:
+            return
+        self._pending[run_id] = _QueuedRun(
+            run_id=run_id,
+            rank=PRIORITY_RANK[priority],
+            seq=next(self._counter),
+            workspace_key=workspace_key,
+        )
+
+    def position(self, run_id: str) -> Optional[int]:
+        """1-based position among queued runs, or ``None`` when the run is not queued."""
+
+        if run_id not in self._pending:
+            return None
+        ordered = sorted(self._pending.values(), key=self._order)
+        return next(index for index, entry in enumerate(ordered, start=1) if entry.run_id == run_id)
+
+    async def acquire(self, run_id: str) -> bool:
+        """Wait for a slot; return ``False`` when the run was removed from the queue instead."""
+
+        if run_id in self._running:
+            return True
+        entry = self._pending.get(run_id)
+        if entry is None:
+            self.enqueue(run_id, RunPriority.INTERACTIVE, "")
+            entry = self._pending[run_id]
+        entry.ready = True
+        entry.wakeup = asyncio.Event()
+        self._dispatch()
+        try:
+            await entry.wakeup.wait()
+        except asyncio.CancelledError:
+            if entry.granted:
+                self.release(run_id)
+            else:
+                self._pending.pop(run_id, None)
+            raise
+        return entry.granted
+
+    def release(self, run_id: str) -> None:
+        if self._running.pop(run_id, None) is not None:
+            self._dispatch()
+
+    def remove(self, run_id: str) -> bool:
+        """Drop a queued run; a waiting ``acquire`` returns ``False``."""
+
+        entry = self._pending.pop(run_id, None)
+        if entry is None:
+            return False
+        if entry.wakeup is not None:
+            entry.wakeup.set()
+        return True
+
+    def _dispatch(self) -> None:
+        while len(self._running) < max(1, self.max_running):
+            candidates: List[_QueuedRun] = [
+                entry
+                for entry in self._pending.values()
+                if entry.ready
+                and (
+                    self.max_running_per_workspace <= 0
+                    or self._running_in(entry.workspace_key) < self.max_running_per_workspace
+                )
+            ]
+            if not candidates:
+                return
+            entry = min(candidates, key=self._order)
+            del self._pending[entry.run_id]
+            self._running[entry.run_id] = entry.workspace_key
+            entry.granted = True
+            if entry.wakeup is not None:
+                entry.wakeup.set()
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from app.core.config import get_settings
 from app.database.connection import SessionLocal
 from app.database.models import models as db_models
-from app.schemas.execution import DbtCommand, RunStatus
+from app.schemas.execution import DbtCommand, RunPriority, RunStatus
 from app.schemas.scheduler import (
     BackoffStrategy,
     CatchUpPolicy,
@@ -609,6 +609,7 @@ class SchedulerService:
         db_schedule: db_models.Schedule,
         scheduled_time: datetime,
         triggering_event: TriggeringEvent,
+        priority: RunPriority = RunPriority.SCHEDULED,
     ) -> Optional[db_models.ScheduledRun]:
         if db_schedule.overlap_policy == OverlapPolicy.NO_OVERLAP.value:
             active = (
@@ -638,6 +639,7 @@ class SchedulerService:
         command = {
             "command": db_schedule.dbt_command,
             "environment_id": env.id,
+            "priority": priority.value,
         }
 
         now = datetime.now(timezone.utc)
@@ -713,9 +715,11 @@ class SchedulerService:
                 description=f"Scheduled run (schedule {schedule.id}, attempt {attempt_number})",
                 project_path=project_path,
                 artifacts_path=artifacts_path,
+                # Retries keep the priority the run was created with.
+                priority=RunPriority((db_scheduled_run.command or {}).get("priority") or RunPriority.SCHEDULED),
             )
         except RuntimeError as exc:
-            logger.warning("Max concurrent runs reached; cannot start scheduled run: %s", exc)
+            logger.warning("Run queue is full; cannot start scheduled run: %s", exc)
             return None
 
         db_attempt = db_models.ScheduledRunAttempt(
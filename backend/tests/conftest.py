@@ -1,5 +1,8 @@
+import atexit
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -15,6 +18,14 @@ from app.core.config import get_settings
 test_db_path = ROOT / "test.db"
 os.environ.setdefault("DATABASE_URL", f"sqlite:///{test_db_path}")
 
+# Runs write per-run logs and captured artifacts to disk, and the default
+# workspace creates a git checkout; keep all of that out of the source tree.
+test_data_root = Path(tempfile.mkdtemp(prefix="dbt-workbench-tests-"))
+atexit.register(shutil.rmtree, test_data_root, ignore_errors=True)
+os.environ.setdefault("DBT_ARTIFACTS_PATH", str(test_data_root / "artifacts"))
+os.environ.setdefault("GIT_REPOS_BASE_PATH", str(test_data_root / "repos"))
+os.environ.setdefault("DBT_PROJECT_PATH", str(test_data_root / "repos" / "default"))
+
 # Clear any cached settings so subsequent imports pick up the test database
 # configuration established above.
 get_settings.cache_clear()
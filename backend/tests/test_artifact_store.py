@@ -0,0 +1,115 @@
+import os
+import shutil
+import threading
+
+from app.services.artifact_store import ArtifactStore
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_capture_links_identical_content_once(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "manifest.json", "{}")
+    _write(target / "compiled" / "a.sql", "select 1")
+    _write(target / "compiled" / "b.sql", "select 1")
+    store = ArtifactStore(tmp_path / "store")
+    run_dir = tmp_path / "runs" / "r1"
+    latest = tmp_path / "latest"
+
+    stored = store.capture(target, [run_dir], copy_destinations=[latest])
+
+    assert sorted(item.relative_path for item in stored) == ["compiled/a.sql", "compiled/b.sql", "manifest.json"]
+    assert len(list(store.objects_dir.glob("*/*"))) == 2
+    assert (run_dir / "compiled" / "a.sql").read_text() == "select 1"
+    assert os.path.samefile(run_dir / "compiled" / "a.sql", run_dir / "compiled" / "b.sql")
+    assert (latest / "compiled" / "b.sql").read_text() == "select 1"
+    assert not os.path.samefile(run_dir / "compiled" / "b.sql", latest / "compiled" / "b.sql")
+
+
+def test_recapture_only_stores_changed_files(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "manifest.json", "{}")
+    _write(target / "run_results.json", '{"results": []}')
+    store = ArtifactStore(tmp_path / "store")
+    latest = tmp_path / "latest"
+    store.capture(target, [tmp_path / "runs" / "r1"], copy_destinations=[latest])
+    unchanged_before = (latest / "manifest.json").stat().st_ino
+
+    (target / "run_results.json").unlink()
+    _write(target / "run_results.json", '{"results": [1]}')
+    store.capture(target, [tmp_path / "runs" / "r2"], copy_destinations=[latest])
+
+    assert (latest / "manifest.json").stat().st_ino == unchanged_before
+    assert (latest / "run_results.json").read_text() == '{"results": [1]}'
+    assert (tmp_path / "runs" / "r1" / "run_results.json").read_text() == '{"results": []}'
+    assert len(list(store.objects_dir.glob("*/*"))) == 3
+
+
+def test_capture_include_limits_captured_entries(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "manifest.json", "{}")
+    _write(target / "compiled" / "a.sql", "select 1")
+    store = ArtifactStore(tmp_path / "store")
+
+    stored = store.capture(target, [tmp_path / "out"], include=["manifest.json", "catalog.json"])
+
+    assert [item.relative_path for item in stored] == ["manifest.json"]
+    assert not (tmp_path / "out" / "compiled").exists()
+
+
+def test_prune_removes_unreferenced_objects(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "manifest.json", "{}")
+    store = ArtifactStore(tmp_path / "store")
+    run_dir = tmp_path / "runs" / "r1"
+    store.capture(target, [run_dir])
+
+    assert store.prune() == 0
+    (run_dir / "manifest.json").unlink()
+    assert store.prune() == 1
+    assert list(store.objects_dir.glob("*/*")) == []
+
+
+def test_prune_waits_for_a_capture_between_put_and_link(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "manifest.json", "{}")
+    store = ArtifactStore(tmp_path / "store")
+    # Another instance over the same root, e.g. a second executor.
+    pruner = threading.Thread(target=ArtifactStore(tmp_path / "store").prune)
+    link = store.link
+
+    def _link_after_prune_started(digest, destination):
+        # The object exists with no links yet: exactly what prune would delete.
+        pruner.start()
+        pruner.join(timeout=0.2)
+        assert pruner.is_alive()
+        link(digest, destination)
+
+    store.link = _link_after_prune_started
+    run_dir = tmp_path / "runs" / "r1"
+    store.capture(target, [run_dir])
+    pruner.join(timeout=5)
+
+    assert (run_dir / "manifest.json").read_text() == "{}"
+    assert len(list(store.objects_dir.glob("*/*"))) == 1
+
+
+def test_in_place_writes_to_copy_destinations_do_not_reach_captured_runs(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "manifest.json", '{"v": 1}')
+    store = ArtifactStore(tmp_path / "store")
+    run_dir = tmp_path / "runs" / "r1"
+    latest = tmp_path / "latest"
+    store.capture(target, [run_dir], copy_destinations=[latest])
+
+    # What RowLineageService._sync_target_to_artifacts does to the latest snapshot.
+    synced = tmp_path / "synced-target"
+    _write(synced / "manifest.json", '{"v": 2}')
+    shutil.copytree(synced, latest, dirs_exist_ok=True)
+
+    assert (latest / "manifest.json").read_text() == '{"v": 2}'
+    assert (run_dir / "manifest.json").read_text() == '{"v": 1}'
+    assert [path.read_text() for path in store.objects_dir.glob("*/*")] == ['{"v": 1}']
@@ -0,0 +1,66 @@
+from app.services.bounded_cache import BoundedCache
+
+
+def test_evicts_least_recently_used_entries_over_budget():
+    cache: BoundedCache[str, str] = BoundedCache(max_bytes=100)
+    cache.put("a", "A", 40)
+    cache.put("b", "B", 40)
+    assert cache.get("a") == "A"
+
+    cache.put("c", "C", 40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": 80,
+        "max_bytes": 100,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_oversized_entries_are_not_cached_and_replacements_are_reaccounted():
+    cache: BoundedCache[str, str] = BoundedCache(max_bytes=100)
+    assert cache.put("big", "X", 101) is False
+    assert cache.get("big") is None
+
+    cache.put("a", "A", 60)
+    cache.put("a", "A2", 30)
+    assert cache.stats()["bytes"] == 30
+    assert cache.get("a") == "A2"
+
+
+def test_validator_and_ttl_turn_entries_into_misses():
+    now = [0.0]
+    cache: BoundedCache[str, int] = BoundedCache(max_bytes=100, ttl_seconds=10, clock=lambda: now[0])
+    cache.put("a", 1, 1)
+
+    assert cache.get("a", is_valid=lambda value: value == 2) is None
+    assert len(cache) == 0
+
+    cache.put("a", 1, 1)
+    now[0] = 9.0
+    assert cache.get("a") == 1
+    now[0] = 10.0
+    assert cache.get("a") is None
+
+
+def test_invalidate_clear_and_resize():
+    cache: BoundedCache[str, str] = BoundedCache(max_bytes=100)
+    cache.put("a", "A", 30)
+    cache.put("b", "B", 30)
+    cache.put("c", "C", 30)
+
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+
+    cache.resize(40)
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+    assert len(cache) == 0
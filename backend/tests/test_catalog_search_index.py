@@ -0,0 +1,51 @@
+import numpy as np
+
+from app.services.catalog_search_index import HashingEmbedder, VectorIndex, build_embedder
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dimension=128)
+        self.embedded: list[str] = []
+
+    def embed(self, texts):
+        self.embedded.extend(texts)
+        return super().embed(texts)
+
+
+def test_hashing_embedder_groups_word_variants():
+    embedder = HashingEmbedder()
+    vectors = embedder.embed(["customer orders", "customers ordered", "warehouse inventory"])
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+
+def test_vector_index_reembeds_only_changed_documents():
+    embedder = CountingEmbedder()
+    index = VectorIndex(embedder)
+    assert index.update({"a": "customer orders", "b": "payment amounts"}, signature=1) == 2
+
+    embedder.embedded.clear()
+    assert index.update({"a": "customer orders", "b": "refund amounts", "c": "shipping events"}, signature=2) == 2
+    assert embedder.embedded == ["refund amounts", "shipping events"]
+    assert index.signature == 2
+    assert index.search("refunds", top_k=1)[0][0] == "b"
+
+    index.update({"c": "shipping events"})
+    assert [doc_id for doc_id, _ in index.search("orders", top_k=5)] == ["c"]
+
+
+def test_vector_index_uses_lsh_candidates_on_large_indexes():
+    index = VectorIndex(HashingEmbedder(dimension=64), brute_force_limit=10)
+    documents = {f"doc{i}": f"table number {i} metrics" for i in range(50)}
+    documents["orders"] = "customer orders with amounts"
+    index.update(documents)
+
+    results = index.search("customer orders with amounts", top_k=3)
+    assert results[0][0] == "orders"
+    assert results[0][1] > 0.99
+
+
+def test_build_embedder_falls_back_to_hashing():
+    assert build_embedder("hashing").name.startswith("hashing")
+    assert build_embedder("sentence-transformers:not-installed-model").name.startswith("hashing")
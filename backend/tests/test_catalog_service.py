@@ -1,7 +1,9 @@
 import json
-import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -11,6 +13,7 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import Settings
 from app.database.connection import Base
 from app.services.artifact_service import ArtifactService
+from app.services import catalog_service as catalog_service_module
 from app.services.catalog_service import CatalogService
 from app.schemas import catalog as catalog_schemas
 
@@ -189,3 +192,222 @@ def test_catalog_api_endpoints(tmp_path: Path):
     assert validation.status_code == 200
     assert "issues" in validation.json()
 
+    freshness = client.get("/catalog/freshness")
+    assert freshness.status_code == 200
+    assert freshness.json()["total"] == 1
+
+    entity_validation = client.get("/catalog/validation/entities/model.demo.orders")
+    assert entity_validation.status_code == 200
+    assert client.get("/catalog/validation/entities/model.demo.unknown").status_code == 404
+    assert len(client.get("/catalog/validation", params={"limit": 1}).json()["issues"]) == 1
+
+
+
+def test_catalog_validation_is_incremental_and_paginated(tmp_path: Path, monkeypatch):
+    build_artifacts(tmp_path)
+    service = build_service(tmp_path)
+
+    full = service.validate()
+    assert full.total == len(full.issues)
+
+    page = service.validate(offset=1, limit=2)
+    assert page.total == full.total
+    assert page.issues == full.issues[1:3]
+
+    entity = service.validate_entity("model.demo.orders")
+    assert entity is not None
+    assert any(issue.message == "Failing tests" for issue in entity.issues)
+    assert all(issue.unique_id.startswith("model.demo.orders") for issue in entity.issues)
+    assert service.validate_entity("model.demo.missing") is None
+
+    validated: list[str] = []
+    original = CatalogService._validate_entity
+
+    def tracking(self, unique_id, *args, **kwargs):
+        validated.append(unique_id)
+        return original(self, unique_id, *args, **kwargs)
+
+    monkeypatch.setattr(CatalogService, "_validate_entity", tracking)
+    service.validate()
+    assert validated == []
+
+    service.update_metadata("macro.demo.helper", catalog_schemas.MetadataUpdate(owner="macro-owner"))
+    validated.clear()
+    refreshed = service.validate()
+    assert validated == ["macro.demo.helper"]
+    assert not any(
+        issue.unique_id == "macro.demo.helper" and issue.message == "Missing owner" for issue in refreshed.issues
+    )
+
+
+def test_catalog_validation_skips_artifact_loads_while_signatures_are_unchanged(tmp_path: Path, monkeypatch):
+    build_artifacts(tmp_path)
+    service = build_service(tmp_path)
+    catalog_service_module._validation_cache_by_path.clear()
+
+    validated: list[str] = []
+    original = CatalogService._validate_entity
+
+    def tracking(self, unique_id, *args, **kwargs):
+        validated.append(unique_id)
+        return original(self, unique_id, *args, **kwargs)
+
+    monkeypatch.setattr(CatalogService, "_validate_entity", tracking)
+    # A cold entity lookup validates only that entity.
+    entity = service.validate_entity("model.demo.orders")
+    assert entity is not None and entity.total
+    assert validated == ["model.demo.orders"]
+
+    full = service.validate()
+    loads: list[int] = []
+    original_load = CatalogService._load_artifacts
+
+    def counting_load(self):
+        loads.append(1)
+        return original_load(self)
+
+    monkeypatch.setattr(CatalogService, "_load_artifacts", counting_load)
+    assert service.validate() == full
+    assert service.validate_entity("model.demo.orders") == entity
+    assert loads == []
+
+
+def test_catalog_freshness_snapshot_and_summary(tmp_path: Path):
+    build_artifacts(tmp_path)
+    catalog = json.loads((tmp_path / "catalog.json").read_text())
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    manifest["sources"]["source.demo.fresh_events"] = {
+        "resource_type": "source",
+        "name": "fresh_events",
+        "schema": "raw",
+    }
+    manifest["sources"]["source.demo.unchecked"] = {
+        "resource_type": "source",
+        "name": "unchecked",
+        "schema": "landing",
+    }
+    recent = datetime.now(timezone.utc) - timedelta(minutes=5)
+    catalog["sources"]["source.demo.fresh_events"] = {
+        "freshness": {
+            "max_loaded_at": recent.isoformat(),
+            "threshold": 60,
+            "snapshotted_at": "2024-06-11T01:00:00Z",
+        },
+    }
+    write_json(tmp_path, "manifest.json", manifest)
+    write_json(tmp_path, "catalog.json", catalog)
+    service = build_service(tmp_path)
+
+    entities = {entity.unique_id: entity for entity in service.list_entities()}
+    assert entities["source.demo.raw_orders"].freshness.status == "late"
+    fresh = entities["source.demo.fresh_events"].freshness
+    assert fresh.status == "on-time"
+    assert 4 <= fresh.age_minutes <= 10
+    assert fresh.checked_at == datetime(2024, 6, 11, 1, 0, tzinfo=timezone.utc)
+    assert entities["source.demo.unchecked"].freshness.status is None
+    assert entities["model.demo.orders"].freshness is None
+
+    summary = service.freshness_summary()
+    assert (summary.total, summary.on_time, summary.late, summary.unknown) == (3, 1, 1, 1)
+    raw = next(item for item in summary.schemas if item.schema_ == "raw")
+    assert (raw.on_time, raw.late) == (1, 1)
+
+    snapshot = service._freshness_snapshot(manifest, catalog)
+    assert service._freshness_snapshot(manifest, catalog) is snapshot
+
+
+def test_to_datetime64_handles_offsets_and_invalid_values():
+    parsed = catalog_service_module._to_datetime64(
+        ["2024-06-11T00:00:00", "2024-06-11T02:00:00+02:00", "2024-06-11T00:00:00Z", "not-a-date", None]
+    )
+    expected = np.datetime64("2024-06-11T00:00:00", "us")
+    assert parsed[0] == expected
+    assert parsed[1] == expected
+    assert parsed[2] == expected
+    assert np.isnat(parsed[3])
+    assert np.isnat(parsed[4])
+
+
+def test_catalog_search_blends_semantic_scores(tmp_path: Path):
+    build_artifacts(tmp_path)
+    service = build_service(tmp_path)
+    service.settings.catalog_semantic_search_enabled = True
+
+    semantic = service.search("macro helper")
+    assert semantic.results["macro"][0].unique_id == "macro.demo.helper"
+
+    service.settings.catalog_semantic_search_enabled = False
+    lexical = service.search("macro helper")
+    assert semantic.results["macro"][0].score > lexical.results["macro"][0].score
+    assert semantic.results["columns"]
+
+
+def test_catalog_semantic_search_ignores_unrelated_queries(tmp_path: Path):
+    build_artifacts(tmp_path)
+    service = build_service(tmp_path)
+    service.settings.catalog_semantic_search_enabled = True
+    manifest, catalog, _ = service._load_artifacts()
+
+    assert service._semantic_scores("zebra giraffe", manifest, catalog) == {}
+
+    def scores(response):
+        return {item.unique_id: item.score for items in response.results.values() for item in items}
+
+    semantic = scores(service.search("zebra giraffe"))
+    service.settings.catalog_semantic_search_enabled = False
+    assert semantic == scores(service.search("zebra giraffe"))
+
+
+def test_catalog_batch_entity_detail_and_etag(tmp_path: Path, monkeypatch):
+    build_artifacts(tmp_path)
+    service = build_service(tmp_path)
+
+    details = service.entity_details(["model.demo.orders", "source.demo.raw_orders", "model.demo.unknown"])
+    assert set(details) == {"model.demo.orders", "source.demo.raw_orders"}
+    assert details["model.demo.orders"] == service.entity_detail("model.demo.orders")
+    assert details["source.demo.raw_orders"].freshness is not None
+
+    app = FastAPI()
+    from app.api.routes import catalog as catalog_route
+
+    app.dependency_overrides[catalog_route.get_service] = lambda: service
+    app.include_router(catalog_route.router)
+    client = TestClient(app)
+
+    batch = client.get(
+        "/catalog/entities/batch",
+        params=[("ids", "model.demo.orders"), ("ids", "model.demo.unknown"), ("ids", "macro.demo.helper")],
+    )
+    assert batch.status_code == 200
+    payload = batch.json()
+    assert [entity["unique_id"] for entity in payload["entities"]] == ["model.demo.orders", "macro.demo.helper"]
+    assert payload["missing"] == ["model.demo.unknown"]
+
+    detail = client.get("/catalog/entities/model.demo.orders")
+    etag = detail.headers["etag"]
+    revalidated = client.get("/catalog/entities/model.demo.orders", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert client.get("/catalog/entities/model.demo.orders", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/catalog/entities/model.demo.unknown", headers={"If-None-Match": "*"}).status_code == 404
+    all_missing = client.get(
+        "/catalog/entities/batch", params=[("ids", "model.demo.unknown")], headers={"If-None-Match": "*"}
+    )
+    assert all_missing.status_code == 200
+    assert all_missing.json() == {"entities": [], "missing": ["model.demo.unknown"]}
+
+    calls: list = []
+    for name in ("_load_artifacts", "_entity_overrides", "_column_overrides"):
+        original = getattr(CatalogService, name)
+
+        def counting(self, *args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(CatalogService, name, counting)
+    assert client.get("/catalog/entities/model.demo.orders").status_code == 200
+    assert sorted(calls) == ["_column_overrides", "_entity_overrides", "_load_artifacts"]
+
+    client.patch("/catalog/entities/model.demo.orders/columns/id", json={"description": "changed"})
+    changed = client.get("/catalog/entities/model.demo.orders", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
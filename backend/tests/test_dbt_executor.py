@@ -1,9 +1,11 @@
 
 import asyncio
+import json
+import sys
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
-from app.schemas.execution import DbtCommand, RunDetail, RunStatus
+from app.schemas.execution import DbtCommand, RunDetail, RunPriority, RunStatus
 from app.services.dbt_executor import DbtExecutor
 
 def test_get_dbt_command_docs_generate():
@@ -16,6 +18,7 @@ def test_get_dbt_command_run():
     executor = DbtExecutor()
     cmd = executor._get_dbt_command(DbtCommand.RUN, {})
     assert cmd[:2] == ['dbt', 'run']
+    assert cmd[2:4] == ['--log-format', 'json']
 
 def test_dbt_commmand_profile():
     executor = DbtExecutor()
@@ -81,6 +84,390 @@ def test_stream_logs_adds_terminal_message_without_error():
     assert messages[-1].level == "INFO"
 
 
+def test_execute_run_streams_output_without_blocking_event_loop(tmp_path, monkeypatch):
+    executor = DbtExecutor()
+    script = (
+        "import sys, time\n"
+        "for i in range(3):\n"
+        "    print(f'line {i}', flush=True)\n"
+        "    time.sleep(0.1)\n"
+        "print('x' * 200000)\n"
+    )
+    monkeypatch.setattr(executor, "_get_dbt_command", lambda command, parameters: [sys.executable, "-c", script])
+    monkeypatch.setattr(executor, "_persist_run", lambda run_detail: None)
+
+    async def _run():
+        run_id = await executor.start_run(
+            DbtCommand.RUN, {}, project_path=str(tmp_path), artifacts_path=str(tmp_path / "artifacts")
+        )
+        ticks = 0
+        task = asyncio.create_task(executor.execute_run(run_id))
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        await task
+        return run_id, ticks
+
+    run_id, ticks = asyncio.run(_run())
+
+    run_detail = executor.run_history[run_id]
+    assert run_detail.status == RunStatus.SUCCEEDED
+    assert run_detail.log_lines[:3] == ["line 0", "line 1", "line 2"]
+    assert run_detail.log_lines[3] == "x" * 200000
+    # The loop kept running while the subprocess slept between lines.
+    assert ticks >= 10
+    assert executor.active_run_count() == 0
+
+
+def test_execute_run_keeps_full_log_on_disk_beyond_buffer(tmp_path, monkeypatch):
+    executor = DbtExecutor()
+    executor.settings = executor.settings.model_copy(update={"log_buffer_size": 5})
+    script = "for i in range(50):\n    print(f'line {i}')\n"
+    monkeypatch.setattr(executor, "_get_dbt_command", lambda command, parameters: [sys.executable, "-c", script])
+    monkeypatch.setattr(executor, "_persist_run", lambda run_detail: None)
+
+    async def _run():
+        run_id = await executor.start_run(
+            DbtCommand.RUN, {}, project_path=str(tmp_path), artifacts_path=str(tmp_path / "artifacts")
+        )
+        await executor.execute_run(run_id)
+        return run_id
+
+    run_id = asyncio.run(_run())
+
+    assert list(executor.run_history[run_id].log_lines) == [f"line {i}" for i in range(45, 50)]
+    head = executor.read_run_log(run_id, start=0, limit=3)
+    assert head.lines == ["line 0", "line 1", "line 2"]
+    assert head.total_lines == 50
+    assert head.complete is True
+    assert executor.read_run_log(run_id, tail=1).lines == ["line 49"]
+    assert run_id not in executor.run_log_writers
+
+
+def test_execute_run_parses_structured_dbt_events(tmp_path, monkeypatch):
+    executor = DbtExecutor()
+    events = [
+        "Plain preamble",
+        {"info": {"name": "NodeStart", "level": "info", "msg": "1 of 2 START orders", "ts": "2024-05-01T12:00:00Z"},
+         "data": {"node_info": {"unique_id": "model.shop.orders", "node_status": "started"}}},
+        {"info": {"name": "LogModelResult", "level": "info", "msg": "1 of 2 OK orders", "ts": "2024-05-01T12:00:01Z"},
+         "data": {"node_info": {"unique_id": "model.shop.orders", "node_status": "success"},
+                  "execution_time": 0.5, "index": 1, "total": 2}},
+        {"info": {"name": "LogModelResult", "level": "error", "msg": "2 of 2 ERROR customers", "ts": "2024-05-01T12:00:02Z"},
+         "data": {"node_info": {"unique_id": "model.shop.customers", "node_status": "error"},
+                  "execution_time": 0.25, "index": 2, "total": 2}},
+    ]
+    script = "import json, sys\nfor line in json.loads(sys.argv[1]):\n    print(line if isinstance(line, str) else json.dumps(line))\n"
+    monkeypatch.setattr(
+        executor,
+        "_get_dbt_command",
+        lambda command, parameters: [sys.executable, "-c", script, json.dumps(events)],
+    )
+    monkeypatch.setattr(executor, "_persist_run", lambda run_detail: None)
+
+    async def _run():
+        run_id = await executor.start_run(
+            DbtCommand.RUN, {}, project_path=str(tmp_path), artifacts_path=str(tmp_path / "artifacts")
+        )
+        await executor.execute_run(run_id)
+        errors = [log async for log in executor.stream_logs(run_id, levels={"error"})]
+        orders = [log async for log in executor.stream_logs(run_id, node_id="model.shop.orders")]
+        return run_id, errors, orders
+
+    run_id, errors, orders = asyncio.run(_run())
+
+    run_detail = executor.run_history[run_id]
+    assert list(run_detail.log_lines) == ["Plain preamble", "1 of 2 START orders", "1 of 2 OK orders", "2 of 2 ERROR customers"]
+    assert run_detail.node_results["model.shop.orders"].status == "success"
+    assert run_detail.node_results["model.shop.orders"].execution_time == 0.5
+    assert run_detail.node_results["model.shop.customers"].message == "2 of 2 ERROR customers"
+    assert run_detail.progress.model_dump() == {"total": 2, "completed": 2, "failed": 1}
+    assert executor.get_run_status(run_id).progress.failed == 1
+
+    assert [log.message for log in errors[:-1]] == ["2 of 2 ERROR customers"]
+    assert errors[0].line_number == 4
+    assert errors[0].timestamp.isoformat().startswith("2024-05-01T12:00:02")
+    assert [log.node_status for log in orders[:-1]] == ["started", "success"]
+    assert orders[-1].message.startswith("Run finished")
+
+
+def test_runs_beyond_the_concurrency_limit_wait_in_the_queue(tmp_path, monkeypatch):
+    executor = DbtExecutor()
+    executor.settings = executor.settings.model_copy(update={"max_concurrent_runs": 1})
+    executor.run_queue.configure(1)
+    monkeypatch.setattr(
+        executor,
+        "_get_dbt_command",
+        lambda command, parameters: [sys.executable, "-c", "import time; time.sleep(0.2); print('done')"],
+    )
+    monkeypatch.setattr(executor, "_persist_run", lambda run_detail: None)
+
+    async def _scenario():
+        kwargs = {"project_path": str(tmp_path), "artifacts_path": str(tmp_path / "artifacts")}
+        first = await executor.start_run(DbtCommand.RUN, {}, **kwargs)
+        second = await executor.start_run(DbtCommand.RUN, {}, priority=RunPriority.BACKFILL, **kwargs)
+        third = await executor.start_run(DbtCommand.RUN, {}, **kwargs)
+        cancelled = await executor.start_run(DbtCommand.RUN, {}, **kwargs)
+        tasks = [asyncio.create_task(executor.execute_run(run_id)) for run_id in (first, second, third, cancelled)]
+        await asyncio.sleep(0.05)
+
+        assert executor.run_history[first].status == RunStatus.RUNNING
+        assert executor.get_run_status(second).status == RunStatus.QUEUED
+        assert executor.get_run_status(third).queue_position == 1
+        assert executor.get_run_status(second).queue_position == 3
+        assert executor.cancel_run(cancelled) is True
+
+        await asyncio.gather(*tasks)
+        return first, second, third, cancelled
+
+    first, second, third, cancelled = asyncio.run(_scenario())
+
+    history = executor.run_history
+    assert [history[run_id].status for run_id in (first, second, third)] == [RunStatus.SUCCEEDED] * 3
+    # The interactive run queued after the backfill still ran before it.
+    assert history[third].end_time < history[second].end_time
+    assert history[cancelled].status == RunStatus.CANCELLED
+    assert executor.run_queue.running_count == 0
+    # Durations cover execution only; the queued run waited for the first one.
+    assert history[third].start_time >= history[first].end_time
+    assert history[third].queued_at < history[first].end_time
+    assert history[third].duration_seconds < 1
+
+
+def test_start_run_failure_leaves_no_queue_entry(tmp_path, monkeypatch):
+    executor = DbtExecutor()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(executor, "_create_artifacts_directory", fail)
+    with pytest.raises(OSError):
+        asyncio.run(executor.start_run(DbtCommand.RUN, {}, project_path=str(tmp_path)))
+
+    assert executor.run_queue.queued_count == 0
+    assert executor.run_history == {}
+
+
+def test_cleanup_old_runs_keeps_queued_runs(tmp_path):
+    executor = DbtExecutor()
+    executor.settings = executor.settings.model_copy(update={"max_run_history": 1, "max_artifact_sets": 1})
+    kwargs = {"project_path": str(tmp_path), "artifacts_path": str(tmp_path / "artifacts")}
+    queued = asyncio.run(executor.start_run(DbtCommand.RUN, {}, **kwargs))
+    finished = asyncio.run(executor.start_run(DbtCommand.RUN, {}, **kwargs))
+    executor.run_queue.remove(finished)
+    executor.run_history[finished].status = RunStatus.SUCCEEDED
+
+    executor.cleanup_old_runs()
+
+    assert list(executor.run_history) == [queued]
+    assert Path(executor.run_artifacts[queued]).exists()
+
+
+def test_stream_logs_pushes_new_lines_and_resumes_after_last_event_id(tmp_path):
+    executor = DbtExecutor()
+
+    async def _scenario():
+        run_id = await executor.start_run(DbtCommand.RUN, {}, artifacts_path=str(tmp_path))
+        executor.run_history[run_id].status = RunStatus.RUNNING
+        buffer = executor.run_history[run_id].log_lines
+        buffer.append("first")
+
+        received = []
+
+        async def _consume():
+            async for log in executor.stream_logs(run_id):
+                received.append(log)
+
+        consumer = asyncio.create_task(_consume())
+        await asyncio.sleep(0.05)
+        assert [log.message for log in received] == ["first"]
+
+        buffer.append("second")
+        await asyncio.sleep(0.05)
+        assert [log.line_number for log in received] == [1, 2]
+
+        executor.run_history[run_id].status = RunStatus.SUCCEEDED
+        buffer.close()
+        await asyncio.wait_for(consumer, timeout=1)
+
+        resumed = [log async for log in executor.stream_logs(run_id, after=1)]
+        return received, resumed
+
+    received, resumed = asyncio.run(_scenario())
+
+    assert received[-1].message == "Run finished with status succeeded"
+    assert received[-1].line_number == 3
+    assert [log.message for log in resumed] == ["second", "Run finished with status succeeded"]
+
+
+def _write_target(project_dir):
+    target = project_dir / "target"
+    (target / "compiled").mkdir(parents=True)
+    (target / "manifest.json").write_text("{}")
+    (target / "run_results.json").write_text('{"results": []}')
+    (target / "compiled" / "orders.sql").write_text("select 1")
+
+
+def test_capture_profiles_limit_what_each_command_captures(tmp_path):
+    executor = DbtExecutor()
+    project_dir = tmp_path / "project"
+    _write_target(project_dir)
+    artifacts_base = tmp_path / "artifacts"
+
+    async def _start(command):
+        return await executor.start_run(
+            command, {}, project_path=str(project_dir), artifacts_path=str(artifacts_base)
+        )
+
+    test_run = asyncio.run(_start(DbtCommand.TEST))
+    captured = executor._capture_artifacts(test_run)
+    run_dir = Path(executor.run_artifacts[test_run])
+    assert sorted(artifact.filename for artifact in captured) == ["manifest.json", "run_results.json"]
+    assert all(artifact.checksum for artifact in captured)
+    assert not (run_dir / "compiled").exists()
+
+    full_run = asyncio.run(_start(DbtCommand.RUN))
+    executor._capture_artifacts(full_run)
+    assert (Path(executor.run_artifacts[full_run]) / "compiled" / "orders.sql").exists()
+
+    deps_run = asyncio.run(_start(DbtCommand.DEPS))
+    assert executor._capture_artifacts(deps_run) == []
+    assert list(Path(executor.run_artifacts[deps_run]).glob("*.json")) == []
+
+
+def test_row_lineage_sync_does_not_rewrite_captured_runs(tmp_path):
+    from app.core.auth import WorkspaceContext
+    from app.core.config import Settings
+    from app.services.row_lineage_service import RowLineageService
+
+    executor = DbtExecutor()
+    project_dir = tmp_path / "project"
+    _write_target(project_dir)
+    artifacts_base = tmp_path / "artifacts"
+
+    run_id = asyncio.run(
+        executor.start_run(DbtCommand.RUN, {}, project_path=str(project_dir), artifacts_path=str(artifacts_base))
+    )
+    executor._capture_artifacts(run_id)
+    run_manifest = Path(executor.run_artifacts[run_id]) / "manifest.json"
+
+    (project_dir / "target" / "manifest.json").unlink()
+    (project_dir / "target" / "manifest.json").write_text('{"changed": true}')
+    workspace = WorkspaceContext(id=None, key="default", name="Default", artifacts_path=str(artifacts_base))
+    service = RowLineageService(workspace, Settings(dbt_artifacts_path=str(artifacts_base)))
+    service._sync_target_to_artifacts(project_dir)
+
+    assert (artifacts_base / "manifest.json").read_text() == '{"changed": true}'
+    assert run_manifest.read_text() == "{}"
+
+
+def test_with_state_narrows_selection_when_modified_only():
+    executor = DbtExecutor()
+    cmd = executor._get_dbt_command(DbtCommand.RUN, {"select": "tag:daily orders"})
+
+    assert executor._with_state(cmd, "/state")[-2:] == ["--state", "/state"]
+    narrowed = executor._with_state(cmd, "/state", modified_only=True)
+    assert narrowed[narrowed.index("--select") + 1] == "state:modified+,tag:daily state:modified+,orders"
+
+    plain = executor._with_state(executor._get_dbt_command(DbtCommand.RUN, {}), "/state", modified_only=True)
+    assert plain[-2:] == ["--select", "state:modified+"]
+
+
+def test_execute_run_compares_against_last_successful_run(tmp_path, monkeypatch):
+    executor = DbtExecutor()
+    project_dir = tmp_path / "project"
+    (project_dir / "target").mkdir(parents=True)
+    script = (
+        "import pathlib, sys\n"
+        "print('warm' if pathlib.Path('target/partial_parse.msgpack').exists() else 'cold', flush=True)\n"
+        "print(' '.join(sys.argv[1:]), flush=True)\n"
+        "pathlib.Path('target/manifest.json').write_text('{}')\n"
+        "pathlib.Path('target/partial_parse.msgpack').write_bytes(b'cache')\n"
+    )
+    monkeypatch.setattr(
+        executor, "_get_dbt_command", lambda command, parameters: [sys.executable, "-c", script]
+    )
+    monkeypatch.setattr(executor, "_persist_run", lambda run_detail: None)
+    monkeypatch.setattr(executor.settings, "dbt_auto_state", True)
+    monkeypatch.setattr(executor.settings, "dbt_reuse_partial_parse", True)
+
+    async def _run(parameters):
+        run_id = await executor.start_run(
+            DbtCommand.RUN, parameters, project_path=str(project_dir), artifacts_path=str(tmp_path / "artifacts")
+        )
+        await executor.execute_run(run_id)
+        return executor.run_history[run_id]
+
+    first = asyncio.run(_run({"modified_only": True}))
+    assert first.status == RunStatus.SUCCEEDED
+    assert "--state" not in first.log_lines[-1]
+    assert any("No earlier successful run" in line for line in first.log_lines)
+    assert "cold" in first.log_lines
+    saved = tmp_path / "artifacts" / "state" / "partial_parse.msgpack"
+    assert saved.read_bytes() == b"cache"
+
+    # A fresh checkout gets the workspace's parse cache back before dbt starts.
+    (project_dir / "target" / "partial_parse.msgpack").unlink()
+    second = asyncio.run(_run({"modified_only": True}))
+    assert second.log_lines[-1].split() == [
+        "--state", first.artifacts_path, "--select", "state:modified+"
+    ]
+    assert "warm" in second.log_lines
+
+
+def test_previous_state_survives_an_api_restart(tmp_path):
+    from app.database.connection import Base, engine
+
+    Base.metadata.create_all(bind=engine)
+    project_dir = tmp_path / "project"
+    _write_target(project_dir)
+    artifacts_base = tmp_path / "artifacts"
+
+    def _finished_run(executor, project_path):
+        run_id = asyncio.run(
+            executor.start_run(DbtCommand.RUN, {}, project_path=str(project_path), artifacts_path=str(artifacts_base))
+        )
+        executor._capture_artifacts(run_id)
+        run_detail = executor.run_history[run_id]
+        run_detail.status = RunStatus.SUCCEEDED
+        executor._persist_run(run_detail)
+        return run_id
+
+    before_restart = DbtExecutor()
+    earlier = _finished_run(before_restart, project_dir)
+    # A newer run of another project sharing the artifacts base is not a valid baseline.
+    _write_target(tmp_path / "other-project")
+    _finished_run(before_restart, tmp_path / "other-project")
+
+    restarted = DbtExecutor()
+    run_id = asyncio.run(
+        restarted.start_run(DbtCommand.RUN, {}, project_path=str(project_dir), artifacts_path=str(artifacts_base))
+    )
+
+    assert restarted._previous_state_dir(restarted.run_history[run_id]) == before_restart.run_artifacts[earlier]
+
+
+def test_persisted_runs_read_logs_from_disk_not_the_database(tmp_path):
+    from app.database.models import models as db_models
+    from app.database.connection import Base, SessionLocal, engine
+
+    Base.metadata.create_all(bind=engine)
+    executor = DbtExecutor()
+    run_id = asyncio.run(executor.start_run(DbtCommand.RUN, {}, artifacts_path=str(tmp_path / "artifacts")))
+    run_detail = executor.run_history[run_id]
+    run_detail.log_lines.append("hello from disk")
+    run_detail.status = RunStatus.SUCCEEDED
+    executor._persist_run(run_detail)
+    executor.run_log_writers.pop(run_id).close()
+
+    db = SessionLocal()
+    try:
+        assert db.query(db_models.Run).filter(db_models.Run.run_id == run_id).one().logs is None
+    finally:
+        db.close()
+    assert DbtExecutor().get_run_detail(run_id).log_lines == ["hello from disk"]
+
+
 def test_extract_package_name_git():
     executor = DbtExecutor()
 
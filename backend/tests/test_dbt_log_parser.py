@@ -0,0 +1,66 @@
+import json
+
+from app.services.dbt_log_parser import parse_dbt_log_line
+
+
+def _event(name, level, msg, data=None):
+    return json.dumps(
+        {
+            "info": {"name": name, "level": level, "msg": msg, "ts": "2024-05-01T12:00:00.500000Z"},
+            "data": data or {},
+        }
+    )
+
+
+def test_parses_node_result_event():
+    record = parse_dbt_log_line(
+        _event(
+            "LogModelResult",
+            "info",
+            "1 of 2 OK created sql view model main.orders",
+            {
+                "node_info": {
+                    "unique_id": "model.shop.orders",
+                    "node_status": "success",
+                    "node_started_at": "2024-05-01T12:00:00",
+                    "node_finished_at": "2024-05-01T12:00:01",
+                },
+                "execution_time": 0.42,
+                "index": 1,
+                "total": 2,
+            },
+        )
+    )
+
+    assert record.structured is True
+    assert record.message == "1 of 2 OK created sql view model main.orders"
+    assert record.level == "INFO"
+    assert record.event_name == "LogModelResult"
+    assert record.node_id == "model.shop.orders"
+    assert record.node_status == "success"
+    assert record.execution_time == 0.42
+    assert (record.index, record.total) == (1, 2)
+    assert record.timestamp.year == 2024 and record.timestamp.tzinfo is not None
+
+
+def test_reads_run_result_timing_and_levels():
+    record = parse_dbt_log_line(
+        _event(
+            "NodeFinished",
+            "error",
+            "boom",
+            {"node_info": {"unique_id": "test.shop.not_null"}, "run_result": {"status": "fail", "execution_time": "1.5"}},
+        )
+    )
+    assert record.level == "ERROR"
+    assert record.execution_time == 1.5
+    assert parse_dbt_log_line(_event("Note", "warning", "careful")).level == "WARN"
+
+
+def test_plain_and_foreign_json_lines_pass_through():
+    assert parse_dbt_log_line("Running with dbt=1.10.0").message == "Running with dbt=1.10.0"
+    assert parse_dbt_log_line("{not json").structured is False
+    foreign = parse_dbt_log_line('{"rows": 3}')
+    assert foreign.structured is False
+    assert foreign.message == '{"rows": 3}'
+    assert foreign.level == "INFO"
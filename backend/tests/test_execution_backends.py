@@ -0,0 +1,303 @@
+import asyncio
+import json
+import sys
+from datetime import timedelta
+
+import pytest
+
+from app.database.connection import Base, SessionLocal, engine
+from app.database.models import models as db_models
+from app.services.execution_backends import (
+    DbtRunnerBackend,
+    ExecutionJob,
+    LocalProcessBackend,
+    WorkerPoolBackend,
+    create_backend,
+    utcnow,
+)
+from app.services.execution_worker import ExecutionWorker
+
+
+@pytest.fixture(autouse=True)
+def clean_db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def _job_command() -> list:
+    script = (
+        "import json, pathlib\n"
+        "for i in range(3): print(f'line {i}', flush=True)\n"
+        "pathlib.Path('target').mkdir(exist_ok=True)\n"
+        "pathlib.Path('target/manifest.json').write_text(json.dumps({'nodes': {}}))\n"
+    )
+    return [sys.executable, "-c", script]
+
+
+def test_create_backend_rejects_unknown_name():
+    assert isinstance(create_backend("local"), LocalProcessBackend)
+    assert isinstance(create_backend("worker_pool"), WorkerPoolBackend)
+    assert isinstance(create_backend("dbt_runner"), DbtRunnerBackend)
+    with pytest.raises(ValueError):
+        create_backend("kubernetes")
+
+
+def test_local_backend_forwards_output_and_exit_code(tmp_path):
+    processes = {}
+    backend = LocalProcessBackend(processes)
+    lines = []
+
+    exit_code = asyncio.run(
+        backend.execute(ExecutionJob(run_id="local-1", command=_job_command(), cwd=str(tmp_path)), lines.append)
+    )
+
+    assert exit_code == 0
+    assert lines == ["line 0", "line 1", "line 2"]
+    assert "local-1" in processes
+    assert backend.cancel("local-1") is False  # already exited
+
+
+def test_worker_pool_runs_job_and_reports_logs_and_artifacts(tmp_path):
+    backend = WorkerPoolBackend(poll_interval_seconds=0.05, heartbeat_timeout_seconds=30)
+    worker = ExecutionWorker(worker_id="worker-a", poll_interval_seconds=0.05, heartbeat_interval_seconds=0.1)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    lines = []
+
+    async def scenario():
+        job = ExecutionJob(run_id="pool-1", command=_job_command(), cwd=str(project_dir))
+        follow = asyncio.create_task(backend.execute(job, lines.append))
+        while not await worker.run_once():
+            await asyncio.sleep(0.05)
+        return await asyncio.wait_for(follow, timeout=10)
+
+    exit_code = asyncio.run(scenario())
+
+    assert exit_code == 0
+    assert lines == ["line 0", "line 1", "line 2"]
+    assert json.loads((project_dir / "target" / "manifest.json").read_text()) == {"nodes": {}}
+    db = SessionLocal()
+    try:
+        job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.run_id == "pool-1").one()
+        assert job.status == "succeeded"
+        assert job.worker_id == "worker-a"
+        # Output and artifacts were forwarded, so their rows are gone.
+        assert job.logs == []
+        assert job.artifacts == []
+    finally:
+        db.close()
+
+
+def test_worker_pool_materializes_reported_artifacts_into_the_api_checkout(tmp_path):
+    backend = WorkerPoolBackend()
+    job_id = backend._submit(ExecutionJob(run_id="remote-1", command=["true"], cwd="/worker/checkout"))
+    db = SessionLocal()
+    try:
+        db.add(db_models.ExecutionJobArtifact(job_id=job_id, filename="manifest.json", content=b'{"nodes": {}}'))
+        db.commit()
+    finally:
+        db.close()
+
+    # A worker on another machine writes into its own checkout; the API side gets the reported copy.
+    api_checkout = tmp_path / "api-checkout"
+    backend._materialize_artifacts(job_id, str(api_checkout))
+    assert json.loads((api_checkout / "target" / "manifest.json").read_text()) == {"nodes": {}}
+
+
+def test_worker_claims_each_job_once(tmp_path):
+    backend = WorkerPoolBackend()
+    backend._submit(ExecutionJob(run_id="claim-1", command=["true"], cwd=str(tmp_path)))
+    first = ExecutionWorker(worker_id="worker-a")
+    second = ExecutionWorker(worker_id="worker-b")
+
+    assert first._claim() is not None
+    assert second._claim() is None
+
+
+def test_worker_pool_fails_job_when_heartbeat_goes_stale(tmp_path):
+    backend = WorkerPoolBackend(poll_interval_seconds=0.01, heartbeat_timeout_seconds=5)
+    job_id = backend._submit(ExecutionJob(run_id="lost-1", command=["true"], cwd=str(tmp_path)))
+    db = SessionLocal()
+    try:
+        job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).one()
+        job.status = "running"
+        job.worker_id = "gone"
+        job.heartbeat_at = utcnow() - timedelta(seconds=60)
+        db.commit()
+    finally:
+        db.close()
+
+    lines, finished = backend._poll(job_id, 0)
+
+    assert lines == []
+    assert finished is not None and finished.status == "failed"
+    assert "gone" in finished.error_message
+
+
+def test_worker_does_not_overwrite_a_job_the_api_already_failed(tmp_path):
+    backend = WorkerPoolBackend()
+    job_id = backend._submit(ExecutionJob(run_id="late-1", command=["true"], cwd=str(tmp_path)))
+    worker = ExecutionWorker(worker_id="worker-a")
+    assert worker._claim() is not None
+    db = SessionLocal()
+    try:
+        job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).one()
+        job.status = "failed"
+        job.error_message = "Execution worker worker-a stopped sending heartbeats"
+        db.commit()
+    finally:
+        db.close()
+    (tmp_path / "target").mkdir()
+    (tmp_path / "target" / "manifest.json").write_text("{}")
+
+    assert worker._heartbeat(job_id) is True
+    worker._finish(job_id, str(tmp_path), 0, False, None)
+
+    db = SessionLocal()
+    try:
+        job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).one()
+        assert (job.status, job.exit_code) == ("failed", None)
+        assert "heartbeats" in job.error_message
+        assert db.query(db_models.ExecutionJobArtifact).filter_by(job_id=job_id).count() == 0
+    finally:
+        db.close()
+
+
+def test_worker_keeps_heartbeating_after_a_heartbeat_error(tmp_path):
+    backend = WorkerPoolBackend()
+    backend._submit(ExecutionJob(run_id="flaky-1", command=["true"], cwd=str(tmp_path)))
+    worker = ExecutionWorker(worker_id="worker-a", heartbeat_interval_seconds=0.02)
+    job_id, _, cwd = worker._claim()
+    calls = []
+    heartbeat = worker._heartbeat
+
+    def _flaky_heartbeat(job):
+        calls.append(job)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return heartbeat(job)
+
+    worker._heartbeat = _flaky_heartbeat
+    asyncio.run(worker._run_job(job_id, [sys.executable, "-c", "import time; time.sleep(0.3)"], cwd))
+
+    assert len(calls) > 1
+    db = SessionLocal()
+    try:
+        assert db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).one().status == "succeeded"
+    finally:
+        db.close()
+
+
+def test_worker_pool_fails_job_that_no_worker_claims(tmp_path):
+    backend = WorkerPoolBackend(poll_interval_seconds=0.01, claim_timeout_seconds=30)
+    job_id = backend._submit(ExecutionJob(run_id="unclaimed-1", command=["true"], cwd=str(tmp_path)))
+
+    assert backend._poll(job_id, 0) == ([], None)
+
+    db = SessionLocal()
+    try:
+        job = db.query(db_models.ExecutionJob).filter(db_models.ExecutionJob.id == job_id).one()
+        job.created_at = utcnow() - timedelta(seconds=60)
+        db.commit()
+    finally:
+        db.close()
+
+    _, finished = backend._poll(job_id, 0)
+
+    assert finished is not None and finished.status == "failed"
+    assert "30 seconds" in finished.error_message
+    assert ExecutionWorker(worker_id="worker-a")._claim() is None
+
+
+def test_worker_pool_cancel_marks_queued_job_cancelled(tmp_path):
+    backend = WorkerPoolBackend()
+    backend._submit(ExecutionJob(run_id="cancel-1", command=["true"], cwd=str(tmp_path)))
+
+    assert backend.cancel("cancel-1") is True
+    assert backend.cancel("cancel-1") is False
+    assert ExecutionWorker(worker_id="worker-a")._claim() is None
+
+
+class _FakeResult:
+    def __init__(self, success=True, result=None, exception=None):
+        self.success = success
+        self.result = result
+        self.exception = exception
+
+
+class _FakeDbtRunner:
+    invocations = []
+
+    def __init__(self, manifest=None, callbacks=None):
+        self.manifest = manifest
+        self.callbacks = callbacks or []
+
+    def invoke(self, args):
+        _FakeDbtRunner.invocations.append((args[0], self.manifest))
+        if args[0] == "parse":
+            return _FakeResult(result=f"manifest-{len(_FakeDbtRunner.invocations)}")
+        for callback in self.callbacks:
+            callback(f"{args[0]} started")
+            callback(f"{args[0]} done")
+        return _FakeResult()
+
+
+def _git_project(path):
+    from git import Repo
+
+    repo = Repo.init(path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    (path / "dbt_project.yml").write_text("name: demo\n")
+    (path / ".gitignore").write_text("")
+    repo.index.add(["dbt_project.yml", ".gitignore"])
+    repo.index.commit("init")
+    return repo
+
+
+def test_dbt_runner_reuses_manifest_until_git_state_changes(tmp_path):
+    _FakeDbtRunner.invocations = []
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    repo = _git_project(project_dir)
+    backend = DbtRunnerBackend(LocalProcessBackend(), runner_factory=_FakeDbtRunner)
+    job = ExecutionJob(run_id="r", command=["dbt", "run", "--log-format", "json"], cwd=str(project_dir))
+    lines = []
+
+    assert asyncio.run(backend.execute(job, lines.append)) == 0
+    assert asyncio.run(backend.execute(job, lines.append)) == 0
+    # dbt's own build output does not invalidate the parsed manifest.
+    (project_dir / "target").mkdir()
+    (project_dir / "target" / "run_results.json").write_text("{}")
+    assert asyncio.run(backend.execute(job, lines.append)) == 0
+
+    (project_dir / "dbt_project.yml").write_text("name: demo\nversion: 2\n")
+    repo.index.add(["dbt_project.yml"])
+    repo.index.commit("bump")
+    assert asyncio.run(backend.execute(job, lines.append)) == 0
+
+    assert lines[:2] == ["run started", "run done"]
+    assert _FakeDbtRunner.invocations == [
+        ("parse", None),
+        ("run", "manifest-1"),
+        ("run", "manifest-1"),
+        ("run", "manifest-1"),
+        ("parse", None),
+        ("run", "manifest-5"),
+    ]
+
+
+def test_dbt_runner_falls_back_to_cli_when_dbt_is_unavailable(tmp_path):
+    backend = DbtRunnerBackend(LocalProcessBackend(), runner_factory=None, event_to_line=str)
+    backend.runner_factory = None
+    lines = []
+
+    exit_code = asyncio.run(
+        backend.execute(ExecutionJob(run_id="cli", command=_job_command(), cwd=str(tmp_path)), lines.append)
+    )
+
+    assert exit_code == 0
+    assert lines == ["line 0", "line 1", "line 2"]
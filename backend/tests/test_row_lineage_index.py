@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.services import row_lineage_index
+from app.services.row_lineage_index import (
+    index_dirs_for,
+    load_mapping_store,
+    open_mapping_store,
+)
+
+
+def _mapping(source_model: str, target_model: str, source_trace: str, target_trace: str, sql: str = "") -> dict:
+    return {
+        "source_model": source_model,
+        "target_model": target_model,
+        "source_trace_id": source_trace,
+        "target_trace_id": target_trace,
+        "compiled_sql": sql,
+        "executed_at": "2024-01-01T00:00:00Z",
+    }
+
+
+def _write_mappings(path: Path, lines: list) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines))
+    return path
+
+
+def test_lookup_returns_parents_in_file_order(tmp_path):
+    mapping_path = _write_mappings(
+        tmp_path / "lineage" / "lineage.jsonl",
+        [
+            _mapping("orders", "mart", "o-2", "m-1", "select 2"),
+            _mapping("stg", "mart", "s-9", "m-0"),
+            _mapping("orders", "mart", "o-1", "m-1", "select 1"),
+            _mapping("raw", "stg", "r-1", "s-9"),
+        ],
+    )
+
+    store = load_mapping_store(mapping_path)
+
+    parents = store.lookup_target("mart", "m-1")
+    assert [record.source_trace_id for record in parents] == ["o-2", "o-1"]
+    assert [record.compiled_sql for record in parents] == ["select 2", "select 1"]
+    assert parents[0].executed_at == "2024-01-01T00:00:00Z"
+    assert store.lookup_target("stg", "s-9")[0].source_model == "raw"
+    assert store.lookup_target("mart", "missing") == []
+    assert store.lookup_target("unknown", "m-1") == []
+    assert store.lookup_target("mart", "m-1-but-longer-than-any-stored-trace") == []
+
+    assert store.count == 4
+    assert store.meta["mappings_as_target"] == {"mart": 3, "stg": 1}
+    assert store.meta["roots"] == ["mart"]
+
+
+def test_index_is_reused_until_mapping_file_changes(tmp_path):
+    mapping_path = _write_mappings(
+        tmp_path / "lineage.jsonl",
+        [_mapping("a", "b", "a-1", "b-1")],
+    )
+
+    load_mapping_store(mapping_path)
+    index_dir = index_dirs_for(mapping_path)[0]
+    assert (index_dir / "meta.json").exists()
+    assert open_mapping_store(mapping_path) is not None
+
+    _write_mappings(mapping_path, [_mapping("a", "b", "a-1", "b-1"), _mapping("a", "b", "a-2", "b-2")])
+    stat = mapping_path.stat()
+    os.utime(mapping_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert open_mapping_store(mapping_path) is None
+
+    rebuilt = load_mapping_store(mapping_path)
+    assert rebuilt.count == 2
+    assert rebuilt.lookup_target("b", "b-2")[0].source_trace_id == "a-2"
+
+
+def test_invalid_lines_are_reported_as_warnings(tmp_path):
+    mapping_path = _write_mappings(
+        tmp_path / "lineage.jsonl",
+        [
+            _mapping("a", "b", "a-1", "b-1"),
+            "{not json",
+            json.dumps({"source_model": "a", "target_model": "b"}),
+        ],
+    )
+
+    store = load_mapping_store(mapping_path)
+
+    assert store.count == 1
+    assert store.meta["warnings"] == [
+        "Invalid JSON in row lineage mapping at line 2.",
+        "Incomplete row lineage mapping at line 3.",
+    ]
+
+
+def test_empty_mapping_file_builds_empty_index(tmp_path):
+    mapping_path = _write_mappings(tmp_path / "lineage.jsonl", [])
+
+    store = load_mapping_store(mapping_path)
+
+    assert store.count == 0
+    assert store.models == []
+    assert store.lookup_target("a", "b") == []
+
+
+def test_parquet_mappings_are_indexed_column_wise(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    table = pa.table(
+        {
+            "source_model": ["orders", "stg", "orders", "raw", "", "raw"],
+            "target_model": ["mart", "mart", "mart", "stg", "stg", "stg"],
+            "source_trace_id": ["o-2", "s-9", "o-1", "r-é", "x", None],
+            "target_trace_id": ["m-1", "m-0", "m-1", "s-9", "s-9", "s-9"],
+            "compiled_sql": ["select 2", "", "select 1", None, None, None],
+            "executed_at": ["2024-01-01T00:00:00Z"] * 6,
+            "unused_payload": ["ignored"] * 6,
+        }
+    )
+    mapping_path = tmp_path / "lineage.parquet"
+    pq.write_table(table, mapping_path)
+
+    store = load_mapping_store(mapping_path)
+
+    assert store.count == 4
+    assert [record.source_trace_id for record in store.lookup_target("mart", "m-1")] == ["o-2", "o-1"]
+    (stg_parent,) = store.lookup_target("stg", "s-9")
+    assert stg_parent.source_trace_id == "r-é"
+    assert stg_parent.compiled_sql == ""
+    assert stg_parent.executed_at == "2024-01-01T00:00:00Z"
+    assert store.meta["mappings_as_target"] == {"mart": 3, "stg": 1}
+    assert store.meta["warnings"] == ["Skipped 2 incomplete row lineage mappings in row group 0."]
+
+
+def test_parquet_row_groups_without_required_values_are_skipped(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    table = pa.table(
+        {
+            "source_model": pa.array(["a", "a", None, None], type=pa.string()),
+            "target_model": ["b", "b", "b", "b"],
+            "source_trace_id": ["a-1", "a-2", "a-3", "a-4"],
+            "target_trace_id": ["b-1", "b-2", "b-3", "b-4"],
+        }
+    )
+    mapping_path = tmp_path / "lineage.parquet"
+    pq.write_table(table, mapping_path, row_group_size=2)
+
+    store = load_mapping_store(mapping_path)
+
+    assert store.count == 2
+    assert store.lookup_target("b", "b-2")[0].compiled_sql == ""
+    assert store.meta["warnings"] == ["Skipped 2 incomplete row lineage mappings in row group 1."]
+
+
+def test_parquet_without_required_columns_is_rejected(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    mapping_path = tmp_path / "lineage.parquet"
+    pq.write_table(pa.table({"source_model": ["a"], "target_model": ["b"]}), mapping_path)
+
+    with pytest.raises(ValueError, match="source_trace_id, target_trace_id"):
+        load_mapping_store(mapping_path)
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_appended_mappings_only_parse_the_new_tail(tmp_path, monkeypatch):
+    mapping_path = tmp_path / "lineage.jsonl"
+    mapping_path.write_text(json.dumps(_mapping("a", "b", "a-1", "b-1")) + "\n")
+    first = load_mapping_store(mapping_path)
+    offset = first.meta["tail"]["offset"]
+
+    with mapping_path.open("a") as handle:
+        handle.write("{broken\n")
+        handle.write(json.dumps(_mapping("a", "b", "a-2", "b-1")) + "\n")
+    _bump_mtime(mapping_path)
+
+    monkeypatch.setattr(
+        row_lineage_index,
+        "build_mapping_store",
+        lambda path: pytest.fail("append should not trigger a full rebuild"),
+    )
+    store = load_mapping_store(mapping_path)
+
+    assert store.meta["tail"]["offset"] > offset
+    assert store.meta["tail"]["line_count"] == 3
+    assert [record.source_trace_id for record in store.lookup_target("b", "b-1")] == ["a-1", "a-2"]
+    assert store.meta["warnings"] == ["Invalid JSON in row lineage mapping at line 2."]
+
+
+def test_appends_are_written_as_delta_segments_and_compacted(tmp_path, monkeypatch):
+    mapping_path = tmp_path / "lineage.jsonl"
+    mapping_path.write_text(json.dumps(_mapping("stg", "mart", "s-0", "m-0", "select 0")) + "\n")
+    base = load_mapping_store(mapping_path)
+    base_columns = (base.directory / "target_trace.npy").stat().st_ino
+
+    for i in range(1, row_lineage_index.MAX_DELTA_SEGMENTS):
+        with mapping_path.open("a") as handle:
+            handle.write(json.dumps(_mapping("stg", "mart", "s-0", f"m-{i}", f"select {i}")) + "\n")
+            handle.write(json.dumps(_mapping("raw", "stg", f"r-{i}", "s-0")) + "\n")
+        _bump_mtime(mapping_path)
+        store = load_mapping_store(mapping_path)
+        # The base columns are left alone; each append only writes its own rows.
+        assert (store.directory / "target_trace.npy").stat().st_ino == base_columns
+        assert len(store.meta["deltas"]) == i
+
+    assert store.count == 1 + 2 * (row_lineage_index.MAX_DELTA_SEGMENTS - 1)
+    assert [record.source_trace_id for record in store.lookup_target("stg", "s-0")] == [
+        f"r-{i}" for i in range(1, row_lineage_index.MAX_DELTA_SEGMENTS)
+    ]
+    children = store.lookup_source("stg", "s-0")
+    assert [record.target_trace_id for record in children] == sorted(record.target_trace_id for record in children)
+    assert store.lookup_target("mart", "m-3")[0].compiled_sql == "select 3"
+    assert store.meta["roots"] == ["mart"]
+
+    monkeypatch.setattr(
+        row_lineage_index,
+        "build_mapping_store",
+        lambda path: pytest.fail("compaction should not re-parse the mapping file"),
+    )
+    with mapping_path.open("a") as handle:
+        handle.write(json.dumps(_mapping("stg", "orders", "s-9", "o-1", "select 9")) + "\n")
+    _bump_mtime(mapping_path)
+    compacted = load_mapping_store(mapping_path)
+
+    assert compacted.meta["deltas"] == []
+    assert compacted.count == store.count + 1
+    assert compacted.lookup_target("mart", "m-3")[0].compiled_sql == "select 3"
+    assert compacted.lookup_target("orders", "o-1")[0].compiled_sql == "select 9"
+    assert [record.target_trace_id for record in compacted.lookup_source("stg", "s-0")] == [
+        record.target_trace_id for record in children
+    ]
+    assert compacted.meta["roots"] == ["mart", "orders"]
+    # The previous index directory was renamed aside and removed after the swap.
+    assert not list(compacted.directory.parent.glob(f"{compacted.directory.name}.old-*"))
+
+
+def test_concurrent_loads_extend_an_index_once(tmp_path, monkeypatch):
+    mapping_path = tmp_path / "lineage.jsonl"
+    mapping_path.write_text(json.dumps(_mapping("stg", "mart", "s-0", "m-0")) + "\n")
+    load_mapping_store(mapping_path)
+    with mapping_path.open("a") as handle:
+        handle.write(json.dumps(_mapping("stg", "mart", "s-0", "m-1")) + "\n")
+    _bump_mtime(mapping_path)
+
+    results = []
+    other = threading.Thread(target=lambda: results.append(load_mapping_store(mapping_path)))
+    append_delta = row_lineage_index._append_delta
+
+    def _append_while_another_load_waits(*args, **kwargs):
+        if not other.is_alive() and not results:
+            other.start()
+            other.join(timeout=0.2)
+            assert other.is_alive()
+        return append_delta(*args, **kwargs)
+
+    monkeypatch.setattr(row_lineage_index, "_append_delta", _append_while_another_load_waits)
+    first = load_mapping_store(mapping_path)
+    other.join(timeout=5)
+
+    assert first.meta["deltas"] == results[0].meta["deltas"]
+    assert len(first.meta["deltas"]) == 1
+    assert results[0].count == 2
+
+
+def test_rewritten_or_truncated_mapping_file_is_rebuilt(tmp_path):
+    mapping_path = tmp_path / "lineage.jsonl"
+    mapping_path.write_text(
+        "\n".join(json.dumps(_mapping("a", "b", f"a-{i}", f"b-{i}")) for i in range(3)) + "\n"
+    )
+    load_mapping_store(mapping_path)
+
+    mapping_path.write_text(json.dumps(_mapping("x", "y", "x-1", "y-1")) + "\n")
+    _bump_mtime(mapping_path)
+    truncated = load_mapping_store(mapping_path)
+    assert truncated.count == 1
+    assert truncated.lookup_target("b", "b-0") == []
+
+    mapping_path.write_text(
+        "\n".join(json.dumps(_mapping("z", "y", f"z-{i}", f"y-{i}")) for i in range(4)) + "\n"
+    )
+    _bump_mtime(mapping_path)
+    rewritten = load_mapping_store(mapping_path)
+    assert rewritten.count == 4
+    assert rewritten.lookup_target("y", "y-1")[0].source_model == "z"
+    assert rewritten.models == ["y", "z"]
+
+
+def test_unterminated_partial_line_is_reparsed_once_complete(tmp_path):
+    mapping_path = tmp_path / "lineage.jsonl"
+    complete = json.dumps(_mapping("a", "b", "a-2", "b-2"))
+    mapping_path.write_text(json.dumps(_mapping("a", "b", "a-1", "b-1")) + "\n" + complete[:10])
+
+    partial = load_mapping_store(mapping_path)
+    assert partial.count == 1
+    assert partial.meta["warnings"] == ["Invalid JSON in row lineage mapping at line 2."]
+
+    with mapping_path.open("a") as handle:
+        handle.write(complete[10:])
+    _bump_mtime(mapping_path)
+
+    store = load_mapping_store(mapping_path)
+    assert store.count == 2
+    assert store.meta["warnings"] == []
+    assert store.lookup_target("b", "b-2")[0].source_trace_id == "a-2"
+
+    with mapping_path.open("a") as handle:
+        handle.write("\n" + json.dumps(_mapping("a", "b", "a-3", "b-3")) + "\n{oops\n")
+    _bump_mtime(mapping_path)
+
+    appended = load_mapping_store(mapping_path)
+    assert appended.count == 3
+    assert appended.meta["warnings"] == ["Invalid JSON in row lineage mapping at line 4."]
+
+
+def test_lookup_source_returns_downstream_mappings(tmp_path):
+    mapping_path = _write_mappings(
+        tmp_path / "lineage.jsonl",
+        [
+            _mapping("raw", "stg", "r-1", "s-1"),
+            _mapping("stg", "mart", "s-1", "m-2"),
+            _mapping("stg", "mart", "s-2", "m-3"),
+            _mapping("stg", "mart", "s-1", "m-1"),
+            _mapping("stg", "orders", "s-1", "o-1"),
+        ],
+    )
+
+    store = load_mapping_store(mapping_path)
+
+    children = store.lookup_source("stg", "s-1")
+    assert sorted((record.target_model, record.target_trace_id) for record in children) == [
+        ("mart", "m-1"),
+        ("mart", "m-2"),
+        ("orders", "o-1"),
+    ]
+    assert [record.target_trace_id for record in store.lookup_source("raw", "r-1")] == ["s-1"]
+    assert store.lookup_source("stg", "missing") == []
+    assert store.lookup_source("mart", "m-1") == []
+    assert store.lookup_source("unknown", "s-1") == []
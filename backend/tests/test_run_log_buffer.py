@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+from app.services.run_log_buffer import RunLogBuffer
+
+
+def test_buffer_keeps_sequence_numbers_across_eviction():
+    buffer = RunLogBuffer(capacity=3)
+    for index in range(5):
+        assert buffer.append(f"line {index}") == index + 1
+
+    assert list(buffer) == ["line 2", "line 3", "line 4"]
+    assert buffer[-2:] == ["line 3", "line 4"]
+    assert buffer[0] == "line 2"
+    assert (buffer.first_seq, buffer.last_seq) == (3, 5)
+    assert buffer.since(0) == [(3, "line 2"), (4, "line 3"), (5, "line 4")]
+    assert buffer.since(4) == [(5, "line 4")]
+    assert buffer.since(5) == []
+
+
+def test_wait_for_wakes_on_append_from_another_thread():
+    buffer = RunLogBuffer(capacity=10)
+
+    async def _wait():
+        timer = threading.Timer(0.05, buffer.append, args=("hello",))
+        timer.start()
+        woke = await buffer.wait_for(0, timeout=5)
+        return woke, buffer.since(0)
+
+    woke, lines = asyncio.run(_wait())
+    assert woke is True
+    assert lines == [(1, "hello")]
+
+
+def test_wait_for_returns_on_close_and_times_out_otherwise():
+    buffer = RunLogBuffer(capacity=10, lines=["a"])
+
+    async def _wait():
+        timed_out = await buffer.wait_for(1, timeout=0.01)
+        asyncio.get_running_loop().call_later(0.01, buffer.close)
+        closed = await buffer.wait_for(1, timeout=5)
+        return timed_out, closed
+
+    assert asyncio.run(_wait()) == (False, True)
+    assert buffer.closed
+
+
+def test_failing_sink_is_dropped_without_failing_the_writer():
+    written = []
+
+    def _sink(line):
+        if line == "boom":
+            raise OSError("disk full")
+        written.append(line)
+
+    buffer = RunLogBuffer(capacity=10, sink=_sink)
+    buffer.append("a")
+    assert buffer.append("boom") == 2
+    buffer.append("c")
+
+    assert written == ["a"]
+    assert list(buffer) == ["a", "boom", "c"]
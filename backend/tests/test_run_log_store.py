@@ -0,0 +1,69 @@
+import pytest
+
+from app.services.run_log_store import (
+    COMPRESSED_LOG_FILENAME,
+    INDEX_BLOCK_LINES,
+    INDEX_FILENAME,
+    LOG_FILENAME,
+    RunLogWriter,
+    read_run_log,
+)
+
+
+def _write(directory, count):
+    writer = RunLogWriter(directory)
+    for index in range(count):
+        writer.write(f"line {index}")
+    return writer
+
+
+def test_live_writer_serves_ranges_and_tail(tmp_path):
+    writer = _write(tmp_path, INDEX_BLOCK_LINES * 3 + 10)
+
+    live = writer.read(start=INDEX_BLOCK_LINES + 5, limit=3)
+    assert live.lines == [f"line {i}" for i in range(INDEX_BLOCK_LINES + 5, INDEX_BLOCK_LINES + 8)]
+    assert live.first_line == INDEX_BLOCK_LINES + 6
+    assert live.complete is False
+
+    tail = writer.read(tail=4)
+    assert tail.lines == [f"line {i}" for i in range(INDEX_BLOCK_LINES * 3 + 6, INDEX_BLOCK_LINES * 3 + 10)]
+    assert tail.total_lines == INDEX_BLOCK_LINES * 3 + 10
+    assert writer.read(start=10_000).lines == []
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_closed_log_is_read_through_its_index(tmp_path, compress):
+    total = INDEX_BLOCK_LINES * 2 + 3
+    writer = _write(tmp_path, total)
+    writer.write("multi\nline")
+    writer.close(compress=compress)
+
+    assert (tmp_path / INDEX_FILENAME).exists()
+    assert (tmp_path / COMPRESSED_LOG_FILENAME).exists() is compress
+    assert (tmp_path / LOG_FILENAME).exists() is not compress
+
+    spanning = read_run_log(tmp_path, start=INDEX_BLOCK_LINES - 2, limit=4)
+    assert spanning.lines == [f"line {i}" for i in range(INDEX_BLOCK_LINES - 2, INDEX_BLOCK_LINES + 2)]
+    assert spanning.complete is True
+    assert read_run_log(tmp_path, tail=2).lines == [f"line {total - 1}", "multi\\nline"]
+    assert writer.read(start=0, limit=1).lines == ["line 0"]
+
+
+def test_log_without_index_is_scanned(tmp_path):
+    writer = _write(tmp_path, 5)
+    writer.flush()
+    # Simulate a reader in another process: no in-memory writer, no index yet.
+    stored = read_run_log(tmp_path, start=3, limit=10)
+    assert stored.lines == ["line 3", "line 4"]
+    assert stored.complete is False
+    assert read_run_log(tmp_path / "missing") is None
+    writer.close()
+
+
+def test_live_writer_batches_flushes_but_reads_see_every_line(tmp_path):
+    writer = _write(tmp_path, 3)
+    # Fewer than FLUSH_LINES lines may still sit in the file buffer...
+    assert writer.read(tail=3).lines == ["line 0", "line 1", "line 2"]
+    # ...but an in-process read flushes them to disk first.
+    assert read_run_log(tmp_path, tail=3).lines == ["line 0", "line 1", "line 2"]
+    writer.close()
@@ -0,0 +1,68 @@
+import asyncio
+
+from app.schemas.execution import RunPriority
+from app.services.run_queue import RunQueue
+
+
+def _start(queue, run_id):
+    return asyncio.create_task(queue.acquire(run_id))
+
+
+def test_slots_go_to_higher_priority_runs_first():
+    async def _scenario():
+        queue = RunQueue(max_running=1)
+        queue.enqueue("first", RunPriority.INTERACTIVE, "ws-a")
+        assert await queue.acquire("first") is True
+
+        queue.enqueue("backfill", RunPriority.BACKFILL, "ws-a")
+        queue.enqueue("scheduled", RunPriority.SCHEDULED, "ws-a")
+        queue.enqueue("interactive", RunPriority.INTERACTIVE, "ws-a")
+        waiters = {run_id: _start(queue, run_id) for run_id in ["backfill", "scheduled", "interactive"]}
+        await asyncio.sleep(0)
+
+        positions = {run_id: queue.position(run_id) for run_id in waiters}
+        order = []
+        queue.release("first")
+        for _ in range(3):
+            await asyncio.sleep(0)
+            granted = next(run_id for run_id, task in waiters.items() if task.done() and run_id not in order)
+            order.append(granted)
+            queue.release(granted)
+        return positions, order
+
+    positions, order = asyncio.run(_scenario())
+    assert positions == {"interactive": 1, "scheduled": 2, "backfill": 3}
+    assert order == ["interactive", "scheduled", "backfill"]
+
+
+def test_workspace_quota_and_fair_dispatch():
+    async def _scenario():
+        queue = RunQueue(max_running=2, max_running_per_workspace=1)
+        for run_id, workspace in [("a1", "ws-a"), ("a2", "ws-a"), ("b1", "ws-b")]:
+            queue.enqueue(run_id, RunPriority.SCHEDULED, workspace)
+        tasks = {run_id: _start(queue, run_id) for run_id in ["a1", "a2", "b1"]}
+        await asyncio.sleep(0)
+        running = sorted(run_id for run_id, task in tasks.items() if task.done())
+        waiting_position = queue.position("a2")
+        queue.release("a1")
+        await asyncio.sleep(0)
+        return running, waiting_position, tasks["a2"].done()
+
+    running, waiting_position, a2_started = asyncio.run(_scenario())
+    assert running == ["a1", "b1"]
+    assert waiting_position == 1
+    assert a2_started is True
+
+
+def test_removed_run_stops_waiting_without_a_slot():
+    async def _scenario():
+        queue = RunQueue(max_running=1)
+        queue.enqueue("running", RunPriority.INTERACTIVE, "")
+        await queue.acquire("running")
+        queue.enqueue("queued", RunPriority.INTERACTIVE, "")
+        waiter = _start(queue, "queued")
+        await asyncio.sleep(0)
+        assert queue.remove("queued") is True
+        return await waiter, queue.queued_count, queue.running_count
+
+    assert asyncio.run(_scenario()) == (False, 0, 1)
@@ -1,11 +1,17 @@
 from datetime import datetime, timedelta, timezone
 
+import asyncio
+
 import pytest
 
+from app.core import scheduler_manager
 from app.core.scheduler_manager import _process_due_schedule, _ensure_utc
 from app.database.connection import Base, SessionLocal, engine
 from app.database.models import models as db_models
+from app.schemas.execution import RunPriority
 from app.schemas.scheduler import CatchUpPolicy
+from app.services import scheduler_service as scheduler_service_module
+from app.services.scheduler_service import scheduler_service
 
 
 @pytest.fixture(autouse=True)
@@ -74,6 +80,59 @@ def test_process_due_schedule_handles_naive_datetimes():
     db.close()
 
 
+def test_catch_up_runs_are_queued_as_backfill(monkeypatch):
+    monkeypatch.setattr(scheduler_manager, "_schedule_attempt_start", lambda scheduled_run_id: None)
+    db = SessionLocal()
+
+    env = _build_environment(db)
+    now = datetime(2024, 1, 1, 12, 1, tzinfo=timezone.utc)
+    schedule = db_models.Schedule(
+        name="Catch-up schedule",
+        description="",
+        cron_expression="*/5 * * * *",
+        timezone="UTC",
+        dbt_command="run",
+        environment_id=env.id,
+        notification_config={},
+        retry_policy={},
+        retention_policy=None,
+        catch_up_policy=CatchUpPolicy.CATCH_UP.value,
+        overlap_policy="allow_overlap",
+        enabled=True,
+        status="active",
+        next_run_time=now - timedelta(minutes=11),
+        last_run_time=None,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(schedule)
+    db.commit()
+    db.refresh(schedule)
+
+    _process_due_schedule(db, schedule, now)
+
+    scheduled_runs = db.query(db_models.ScheduledRun).order_by(db_models.ScheduledRun.scheduled_at).all()
+    assert [run.command["priority"] for run in scheduled_runs] == [
+        RunPriority.BACKFILL.value,
+        RunPriority.BACKFILL.value,
+        RunPriority.SCHEDULED.value,
+    ]
+
+    priorities = []
+
+    async def fake_start_run(command, parameters, priority=None, **kwargs):
+        priorities.append(priority)
+        return f"run-{len(priorities)}"
+
+    monkeypatch.setattr(scheduler_service_module.executor, "start_run", fake_start_run)
+    for scheduled_run in scheduled_runs:
+        asyncio.run(scheduler_service.start_attempt_for_scheduled_run(db, scheduled_run))
+
+    assert priorities == [RunPriority.BACKFILL, RunPriority.BACKFILL, RunPriority.SCHEDULED]
+
+    db.close()
+
+
 def test_ensure_utc_normalizes_naive_and_aware_datetimes():
     naive = datetime(2024, 1, 1, 0, 0, 0)
     aware = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
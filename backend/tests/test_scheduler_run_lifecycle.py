@@ -135,6 +135,7 @@ def test_scheduled_run_uses_environment_profile_and_target(monkeypatch):
         project_path=None,
         run_row_lineage=False,
         artifacts_path=None,
+        **kwargs,
     ):
         captured.update(parameters)
         return "run-123"
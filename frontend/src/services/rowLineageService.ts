@@ -41,4 +41,16 @@ export class RowLineageService {
     )
     return response.data
   }
+
+  static async getDownstreamTrace(
+    modelUniqueId: string,
+    traceId: string,
+    params?: { environment_id?: number; max_hops?: number },
+  ): Promise<RowLineageTraceResponse> {
+    const response = await api.get<RowLineageTraceResponse>(
+      `/row-lineage/downstream/${encodeURIComponent(modelUniqueId)}/${encodeURIComponent(traceId)}`,
+      { params },
+    )
+    return response.data
+  }
 }
@@ -326,6 +326,7 @@ export interface RowLineageTraceResponse {
   graph: RowLineageGraph
   hops: RowLineageHop[]
   truncated: boolean
+  direction?: 'upstream' | 'downstream'
   warnings?: string[]
 }
 
@@ -387,6 +388,26 @@ export interface RunSummary {
   description?: string;
   error_message?: string;
   artifacts_available: boolean;
+  progress?: RunProgress | null;
+  priority?: RunPriority;
+  queue_position?: number | null;
+}
+
+export type RunPriority = 'interactive' | 'scheduled' | 'backfill';
+
+export interface RunProgress {
+  total?: number | null;
+  completed: number;
+  failed: number;
+}
+
+export interface RunNodeResult {
+  unique_id: string;
+  status?: string | null;
+  execution_time?: number | null;
+  started_at?: string | null;
+  finished_at?: string | null;
+  message?: string | null;
 }
 
 export interface GitChange {
@@ -464,6 +485,7 @@ export interface RunDetail extends RunSummary {
   log_lines: string[];
   artifacts_path?: string;
   dbt_output?: Record<string, any>;
+  node_results?: Record<string, RunNodeResult>;
 }
 
 export interface LogMessage {
@@ -472,6 +494,10 @@ export interface LogMessage {
   level: string;
   message: string;
   line_number: number;
+  event_name?: string | null;
+  node_id?: string | null;
+  node_status?: string | null;
+  execution_time?: number | null;
 }
 
 export interface RunHistoryResponse {